@@ -33,6 +33,7 @@ _LAZY_IMPORT_TABLE = {
     "exc": {
         "GlobusAPIError",
         "ErrorSubdocument",
+        "GlobusCircuitOpenError",
         "GlobusConnectionError",
         "GlobusConnectionTimeoutError",
         "GlobusError",
@@ -58,6 +59,10 @@ _LAZY_IMPORT_TABLE = {
         "ConfidentialAppAuthClient",
         "AuthAPIError",
         "IdentityMap",
+        "IdentityCache",
+        "TTLIdentityCache",
+        "SQLiteIdentityCache",
+        "OIDCMetadataCache",
         "GetIdentitiesResponse",
         "OAuthDependentTokenResponse",
         "OAuthTokenResponse",
@@ -108,6 +113,7 @@ _LAZY_IMPORT_TABLE = {
         "GroupVisibility",
     },
     "services.search": {
+        "IterableSearchResponse",
         "SearchAPIError",
         "SearchClient",
         "SearchQuery",
@@ -120,6 +126,7 @@ _LAZY_IMPORT_TABLE = {
     },
     "services.transfer": {
         "ActivationRequirementsResponse",
+        "ChunkedSubmissionError",
         "DeleteData",
         "IterableTransferResponse",
         "TransferAPIError",
@@ -137,6 +144,7 @@ if t.TYPE_CHECKING:
     from .client import BaseClient
     from .exc import GlobusAPIError
     from .exc import ErrorSubdocument
+    from .exc import GlobusCircuitOpenError
     from .exc import GlobusConnectionError
     from .exc import GlobusConnectionTimeoutError
     from .exc import GlobusError
@@ -156,6 +164,10 @@ if t.TYPE_CHECKING:
     from .services.auth import ConfidentialAppAuthClient
     from .services.auth import AuthAPIError
     from .services.auth import IdentityMap
+    from .services.auth import IdentityCache
+    from .services.auth import TTLIdentityCache
+    from .services.auth import SQLiteIdentityCache
+    from .services.auth import OIDCMetadataCache
     from .services.auth import GetIdentitiesResponse
     from .services.auth import OAuthDependentTokenResponse
     from .services.auth import OAuthTokenResponse
@@ -198,6 +210,7 @@ if t.TYPE_CHECKING:
     from .services.groups import GroupsClient
     from .services.groups import GroupsManager
     from .services.groups import GroupVisibility
+    from .services.search import IterableSearchResponse
     from .services.search import SearchAPIError
     from .services.search import SearchClient
     from .services.search import SearchQuery
@@ -206,6 +219,7 @@ if t.TYPE_CHECKING:
     from .services.timer import TimerClient
     from .services.timer import TimerJob
     from .services.transfer import ActivationRequirementsResponse
+    from .services.transfer import ChunkedSubmissionError
     from .services.transfer import DeleteData
     from .services.transfer import IterableTransferResponse
     from .services.transfer import TransferAPIError
@@ -257,6 +271,7 @@ __all__ = (
     "BlackPearlStoragePolicies",
     "BoxStoragePolicies",
     "CephStoragePolicies",
+    "ChunkedSubmissionError",
     "ClientCredentialsAuthorizer",
     "CollectionDocument",
     "CollectionPolicies",
@@ -270,6 +285,7 @@ __all__ = (
     "GCSRoleDocument",
     "GetIdentitiesResponse",
     "GlobusAPIError",
+    "GlobusCircuitOpenError",
     "GlobusConnectPersonalOwnerInfo",
     "GlobusConnectionError",
     "GlobusConnectionTimeoutError",
@@ -290,10 +306,12 @@ __all__ = (
     "GroupsManager",
     "GuestCollectionDocument",
     "HPSSStoragePolicies",
+    "IdentityCache",
     "IdentityMap",
     "IrodsStoragePolicies",
     "IterableFlowsResponse",
     "IterableResponse",
+    "IterableSearchResponse",
     "IterableTransferResponse",
     "LocalGlobusConnectPersonal",
     "LocalGlobusConnectServer",
@@ -303,6 +321,7 @@ __all__ = (
     "NullAuthorizer",
     "OAuthDependentTokenResponse",
     "OAuthTokenResponse",
+    "OIDCMetadataCache",
     "OneDriveStoragePolicies",
     "POSIXCollectionPolicies",
     "POSIXStagingCollectionPolicies",
@@ -311,6 +330,7 @@ __all__ = (
     "RefreshTokenAuthorizer",
     "RemovedInV4Warning",
     "S3StoragePolicies",
+    "SQLiteIdentityCache",
     "SearchAPIError",
     "SearchClient",
     "SearchQuery",
@@ -318,6 +338,7 @@ __all__ = (
     "SpecificFlowClient",
     "StorageGatewayDocument",
     "StorageGatewayPolicies",
+    "TTLIdentityCache",
     "TimerAPIError",
     "TimerClient",
     "TimerJob",
@@ -82,6 +82,7 @@ _LAZY_IMPORT_TABLE: list[tuple[str, tuple[str, ...]]] = [
         (
             "GlobusAPIError",
             "ErrorSubdocument",
+            "GlobusCircuitOpenError",
             "GlobusConnectionError",
             "GlobusConnectionTimeoutError",
             "GlobusError",
@@ -119,6 +120,10 @@ _LAZY_IMPORT_TABLE: list[tuple[str, tuple[str, ...]]] = [
             "AuthAPIError",
             # high-level helpers
             "IdentityMap",
+            "IdentityCache",
+            "TTLIdentityCache",
+            "SQLiteIdentityCache",
+            "OIDCMetadataCache",
             # responses
             "GetIdentitiesResponse",
             "OAuthDependentTokenResponse",
@@ -182,6 +187,7 @@ _LAZY_IMPORT_TABLE: list[tuple[str, tuple[str, ...]]] = [
     (
         "services.search",
         (
+            "IterableSearchResponse",
             "SearchAPIError",
             "SearchClient",
             "SearchQuery",
@@ -193,6 +199,7 @@ _LAZY_IMPORT_TABLE: list[tuple[str, tuple[str, ...]]] = [
         "services.transfer",
         (
             "ActivationRequirementsResponse",
+            "ChunkedSubmissionError",
             "DeleteData",
             "IterableTransferResponse",
             "TransferAPIError",
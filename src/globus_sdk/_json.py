@@ -0,0 +1,328 @@
+"""
+JSON codecs used to encode request bodies and decode response bodies.
+
+The stdlib ``json`` module is used by default. Faster third-party libraries
+(``orjson``, ``ujson``, or ``msgspec``) can be selected with the
+``GLOBUS_SDK_JSON_CODEC`` environment variable, or a codec can be installed with
+``set_json_codec()``. If the selected library is not installed, the stdlib codec is
+used instead.
+
+It also provides incremental decoding of large JSON arrays from streamed responses.
+"""
+from __future__ import annotations
+
+import abc
+import codecs
+import functools
+import importlib
+import json
+import logging
+import re
+import typing as t
+
+from requests import Response
+
+from globus_sdk import config
+
+log = logging.getLogger(__name__)
+
+
+class JSONCodec:
+    """
+    A JSONCodec converts between Python data and JSON documents.
+
+    This base class uses the stdlib ``json`` module, and encodes data exactly as
+    ``requests`` does for ``json=...`` request bodies.
+    """
+
+    #: the name used to select this codec
+    name = "stdlib"
+
+    def dumps(self, data: t.Any) -> bytes:
+        """
+        Serialize data as a UTF-8 encoded JSON document.
+
+        :param data: The data to serialize
+        :raises ValueError: if the data contains values which are not valid in JSON,
+            such as ``NaN``
+        :raises TypeError: if the data contains values which cannot be serialized
+        """
+        return json.dumps(data, allow_nan=False).encode("utf-8")
+
+    def loads(self, content: bytes) -> t.Any:
+        """
+        Parse a JSON document.
+
+        :param content: The document to parse
+        :raises ValueError: if the content is not valid JSON
+        """
+        return json.loads(content)
+
+    def decode_response(self, response: Response) -> t.Any:
+        """
+        Parse the body of a response as JSON.
+
+        :param response: The response to parse
+        :raises ValueError: if the body is not valid JSON
+        """
+        # `requests` detects the encoding of the body before parsing
+        return response.json()
+
+
+class _ThirdPartyJSONCodec(JSONCodec, metaclass=abc.ABCMeta):
+    """
+    A codec which uses a third-party library, falling back to the stdlib for any
+    data which the library rejects, so that results match the stdlib codec.
+    """
+
+    @abc.abstractmethod
+    def _dumps(self, data: t.Any) -> bytes:
+        """Serialize data with the library."""
+
+    @abc.abstractmethod
+    def _loads(self, content: bytes) -> t.Any:
+        """Parse a document with the library."""
+
+    def dumps(self, data: t.Any) -> bytes:
+        try:
+            return self._dumps(data)
+        except (TypeError, ValueError):
+            return super().dumps(data)
+
+    def loads(self, content: bytes) -> t.Any:
+        try:
+            return self._loads(content)
+        except Exception as err:  # pylint: disable=broad-except
+            raise ValueError(str(err)) from err
+
+    def decode_response(self, response: Response) -> t.Any:
+        try:
+            return self.loads(response.content)
+        except ValueError:
+            # bodies which are not UTF-8 encoded JSON are handled by `requests`
+            return super().decode_response(response)
+
+
+class OrjsonCodec(_ThirdPartyJSONCodec):
+    name = "orjson"
+
+    def __init__(self) -> None:
+        self._orjson = importlib.import_module("orjson")
+
+    def _dumps(self, data: t.Any) -> bytes:
+        return t.cast(bytes, self._orjson.dumps(data))
+
+    def _loads(self, content: bytes) -> t.Any:
+        return self._orjson.loads(content)
+
+
+class UjsonCodec(_ThirdPartyJSONCodec):
+    name = "ujson"
+
+    def __init__(self) -> None:
+        self._ujson = importlib.import_module("ujson")
+
+    def _dumps(self, data: t.Any) -> bytes:
+        return t.cast(str, self._ujson.dumps(data, ensure_ascii=False)).encode("utf-8")
+
+    def _loads(self, content: bytes) -> t.Any:
+        return self._ujson.loads(content)
+
+
+class MsgspecCodec(_ThirdPartyJSONCodec):
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        self._msgspec_json = importlib.import_module("msgspec.json")
+
+    def _dumps(self, data: t.Any) -> bytes:
+        return t.cast(bytes, self._msgspec_json.encode(data))
+
+    def _loads(self, content: bytes) -> t.Any:
+        return self._msgspec_json.decode(content)
+
+
+_THIRD_PARTY_CODECS: dict[str, type[_ThirdPartyJSONCodec]] = {
+    "orjson": OrjsonCodec,
+    "ujson": UjsonCodec,
+    "msgspec": MsgspecCodec,
+}
+
+
+def _load_codec(name: str) -> JSONCodec | None:
+    try:
+        return _THIRD_PARTY_CODECS[name]()
+    except ImportError:
+        return None
+
+
+def _select_codec(name: str) -> JSONCodec:
+    if name == "stdlib":
+        return JSONCodec()
+    if name == "auto":
+        for candidate in _THIRD_PARTY_CODECS:
+            codec = _load_codec(candidate)
+            if codec is not None:
+                log.debug(f"selected JSON codec '{candidate}'")
+                return codec
+        return JSONCodec()
+    if name not in _THIRD_PARTY_CODECS:
+        raise ValueError(
+            f"Unknown JSON codec '{name}'. Valid values are 'stdlib', 'auto', "
+            f"and {', '.join(repr(x) for x in _THIRD_PARTY_CODECS)}."
+        )
+    codec = _load_codec(name)
+    if codec is None:
+        log.warning(f"JSON codec '{name}' is not installed, falling back to 'stdlib'")
+        return JSONCodec()
+    return codec
+
+
+@functools.lru_cache(maxsize=None)
+def _get_configured_codec() -> JSONCodec:
+    return _select_codec(config.get_json_codec_name())
+
+
+# a codec installed with set_json_codec(), which takes precedence over the
+# environment
+_installed_codec: JSONCodec | None = None
+
+
+def get_json_codec() -> JSONCodec:
+    """
+    Get the JSON codec installed with :func:`set_json_codec`, or if there is none,
+    the codec selected by ``GLOBUS_SDK_JSON_CODEC``.
+
+    The environment variable is read once, on first use.
+    """
+    if _installed_codec is not None:
+        return _installed_codec
+    return _get_configured_codec()
+
+
+def set_json_codec(codec: JSONCodec | str | None) -> None:
+    """
+    Set the JSON codec used by all clients to encode request bodies and parse
+    responses, overriding ``GLOBUS_SDK_JSON_CODEC``.
+
+    :param codec: A ``JSONCodec`` object, which may be an instance of a custom
+        subclass, or the name of a codec, as accepted by ``GLOBUS_SDK_JSON_CODEC``.
+        ``None`` restores the codec selected by the environment.
+    :type codec: JSONCodec, str, or None
+    """
+    global _installed_codec  # pylint: disable=global-statement
+    if isinstance(codec, str):
+        codec = _select_codec(config.get_json_codec_name(codec))
+    _installed_codec = codec
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class _StreamBuffer:
+    """
+    A buffer of decoded text from a stream of byte chunks, which is extended on
+    demand and discards text once it has been consumed.
+    """
+
+    def __init__(self, chunks: t.Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._decode_json = json.JSONDecoder().raw_decode
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """
+        Read more text from the stream. Returns False at the end of the stream.
+        """
+        if self.eof:
+            return False
+        # drop text which has already been consumed
+        self.text, self.pos = self.text[self.pos :], 0
+        for chunk in self._chunks:
+            if chunk:
+                self.text += self._decoder.decode(chunk)
+                return True
+        self.text += self._decoder.decode(b"", final=True)
+        self.eof = True
+        return True
+
+    def peek(self) -> str:
+        """
+        Skip whitespace and return the next character, without consuming it.
+        """
+        while True:
+            whitespace = _WHITESPACE.match(self.text, self.pos)
+            if whitespace is not None:
+                self.pos = whitespace.end()
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                raise ValueError("unexpected end of JSON document")
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(
+                f"expected '{char}' in JSON document, found '{self.peek()}'"
+            )
+        self.pos += 1
+
+    def decode_value(self) -> t.Any:
+        """
+        Decode the next complete JSON value.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self._decode_json(self.text, self.pos)
+            except json.JSONDecodeError:
+                # the value may be incomplete, read more and retry
+                if not self.fill():
+                    raise
+                continue
+            # a number at the end of the buffer may continue in the next chunk
+            if end == len(self.text) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_array(
+    chunks: t.Iterable[bytes], key: str, fields: dict[str, t.Any]
+) -> t.Iterator[t.Any]:
+    """
+    Incrementally decode a JSON object from a stream of bytes, yielding the elements of
+    the array under ``key`` one at a time. Only the element being decoded is held in
+    memory. The other fields of the object are decoded and stored in ``fields``.
+
+    :param chunks: The UTF-8 encoded document, in chunks
+    :param key: The key of the array to iterate over
+    :param fields: A dict which receives the fields of the object other than ``key``
+    :raises ValueError: if the document is not a JSON object, or the value under
+        ``key`` is not an array
+    """
+    buf = _StreamBuffer(chunks)
+    buf.expect("{")
+    if buf.peek() == "}":
+        return
+    while True:
+        name = buf.decode_value()
+        buf.expect(":")
+        if name == key:
+            buf.expect("[")
+            if buf.peek() == "]":
+                buf.pos += 1
+            else:
+                while True:
+                    yield buf.decode_value()
+                    if buf.peek() == "]":
+                        buf.pos += 1
+                        break
+                    buf.expect(",")
+        else:
+            fields[name] = buf.decode_value()
+        if buf.peek() == "}":
+            return
+        buf.expect(",")
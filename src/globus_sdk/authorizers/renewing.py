@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import abc
+import contextvars
 import logging
+import random
+import threading
 import time
 import typing as t
+import weakref
 
 from globus_sdk import exc, utils
 
@@ -16,6 +20,15 @@ log = logging.getLogger(__name__)
 # Provides a buffer for token expiration time to account for
 # possible delays or clock skew.
 EXPIRES_ADJUST_SECONDS = 60
+# after a failed background renewal, wait this long before trying again
+BACKGROUND_RENEWAL_RETRY_SECONDS = 30
+# background renewal happens no earlier than this fraction of the remaining lifetime
+# of a token before it expires, so that a token whose lifetime is shorter than the
+# lead time is not renewed as soon as it is received
+BACKGROUND_RENEWAL_MAX_LEAD_FRACTION = 0.5
+# the minimum time between background renewals, which prevents tokens with a very
+# short lifetime from being renewed continuously
+BACKGROUND_RENEWAL_MIN_INTERVAL_SECONDS = 10
 
 
 class RenewingAuthorizer(GlobusAuthorizer, metaclass=abc.ABCMeta):
@@ -48,6 +61,10 @@ class RenewingAuthorizer(GlobusAuthorizer, metaclass=abc.ABCMeta):
         ``on_refresh`` callback can be used to update the Access Tokens and
         their expiration times.
     :type on_refresh: callable, optional
+
+    A ``RenewingAuthorizer`` may be shared between threads. When the token must be
+    renewed, exactly one thread fetches a new token while any others wait for, and
+    then use, its result.
     """
 
     def __init__(
@@ -58,6 +75,19 @@ class RenewingAuthorizer(GlobusAuthorizer, metaclass=abc.ABCMeta):
     ):
         self._access_token = None
         self._access_token_hash = None
+        # guards renewal and invalidation of the access token, so that concurrent
+        # callers coalesce onto a single renewal
+        # reentrant so that `on_refresh` callbacks may use the authorizer
+        self._token_lock = threading.RLock()
+        # the hash of the token most recently handed out in the current context, used
+        # to determine whether a 401 refers to the current token or a stale one
+        # a context is kept for each thread and for each asyncio task, so this follows
+        # a request even when many requests are sent concurrently from one thread
+        self._request_token_hash: contextvars.ContextVar[
+            str | None
+        ] = contextvars.ContextVar(f"globus_sdk_token_hash_{id(self):x}", default=None)
+        self._renewal_thread: threading.Thread | None = None
+        self._renewal_stop: threading.Event | None = None
 
         log.info(
             "Setting up a RenewingAuthorizer. It will use an "
@@ -149,28 +179,130 @@ class RenewingAuthorizer(GlobusAuthorizer, metaclass=abc.ABCMeta):
         ``on_refresh`` handler.
         """
         log.debug("RenewingAuthorizer checking expiration time")
-        if self.access_token is None:
-            log.debug("RenewingAuthorizer has no token")
-        else:
-            if (
-                self.expires_at is not None
-                and time.time() <= self.expires_at - EXPIRES_ADJUST_SECONDS
-            ):
-                log.debug("RenewingAuthorizer determined time has not yet expired")
+        if self._has_valid_token():
+            log.debug("RenewingAuthorizer determined time has not yet expired")
+            return
+
+        with self._token_lock:
+            # another thread may have renewed the token while this one waited
+            if self._has_valid_token():
+                log.debug("RenewingAuthorizer token was renewed by another caller")
                 return
+
+            if self.access_token is None:
+                log.debug("RenewingAuthorizer has no token")
             else:
                 log.debug("RenewingAuthorizer has a token, but it is expired")
 
-        log.debug("RenewingAuthorizer fetching new Access Token")
-        self._get_new_access_token()
+            log.debug("RenewingAuthorizer fetching new Access Token")
+            self._get_new_access_token()
+
+    def _has_valid_token(self) -> bool:
+        return (
+            self.access_token is not None
+            and self.expires_at is not None
+            and time.time() <= self.expires_at - EXPIRES_ADJUST_SECONDS
+        )
+
+    def start_background_renewal(
+        self, *, lead_time: float = 300, jitter: float = 30
+    ) -> None:
+        """
+        Start renewing the token in a background thread, ahead of its expiration.
+        This keeps the cost of fetching a new token out of the requests which use the
+        authorizer.
+
+        Each renewal is scheduled ``lead_time`` seconds before the token expires, less
+        a random delay of up to ``jitter`` seconds, so that many processes sharing
+        credentials do not renew at the same moment. If a renewal fails, it is
+        retried, and tokens continue to be renewed on demand as a fallback.
+
+        A token is never renewed earlier than halfway through its remaining lifetime,
+        so tokens which live for less than ``lead_time`` are renewed at the halfway
+        point rather than continuously.
+
+        The thread is a daemon thread, and stops when :meth:`stop_background_renewal`
+        is called or the authorizer is garbage collected. Calling this method while
+        background renewal is running has no effect.
+
+        Tokens which are renewed in the background are passed to ``on_refresh`` on the
+        background thread, so ``on_refresh`` must be safe to call from another thread.
+        The token storage adapters in ``globus_sdk.tokenstorage`` may be used in this
+        way.
+
+        :param lead_time: How many seconds before expiration to renew the token
+        :type lead_time: float
+        :param jitter: The maximum number of seconds to randomly renew earlier
+        :type jitter: float
+        """
+        if lead_time < 0 or jitter < 0:
+            raise exc.GlobusSDKUsageError(
+                "Background renewal requires a non-negative lead_time and jitter."
+            )
+        with self._token_lock:
+            if self._renewal_thread is not None and self._renewal_thread.is_alive():
+                return
+            stop = threading.Event()
+            # the thread only holds a weak reference to the authorizer, and is
+            # signalled to stop when the authorizer is collected
+            weakref.finalize(self, stop.set)
+            self._renewal_stop = stop
+            self._renewal_thread = threading.Thread(
+                target=_run_background_renewal,
+                args=(weakref.ref(self), stop, lead_time, jitter),
+                name=f"globus-sdk-token-renewal-{id(self):x}",
+                daemon=True,
+            )
+            self._renewal_thread.start()
+        log.info("RenewingAuthorizer started background renewal")
+
+    def stop_background_renewal(self) -> None:
+        """
+        Stop background renewal, if it is running, and wait for the background thread
+        to exit.
+        """
+        with self._token_lock:
+            thread, stop = self._renewal_thread, self._renewal_stop
+            self._renewal_thread = self._renewal_stop = None
+        if thread is None or stop is None:
+            return
+        stop.set()
+        if thread is not threading.current_thread():
+            thread.join()
+        log.info("RenewingAuthorizer stopped background renewal")
+
+    def _seconds_until_background_renewal(
+        self, lead_time: float, jitter: float
+    ) -> float:
+        expires_at = self.expires_at
+        if self.access_token is None or expires_at is None:
+            return 0
+        remaining = expires_at - time.time()
+        lead = min(
+            lead_time + random.uniform(0, jitter),
+            remaining * BACKGROUND_RENEWAL_MAX_LEAD_FRACTION,
+        )
+        return max(remaining - lead, 0)
+
+    def _renew_in_background(self, expires_at: int | None) -> None:
+        with self._token_lock:
+            # skip renewal if the token was replaced since it was scheduled
+            if self.access_token is not None and self.expires_at != expires_at:
+                log.debug("RenewingAuthorizer token was already renewed")
+                return
+            log.debug("RenewingAuthorizer renewing Access Token in background")
+            self._get_new_access_token()
 
     def get_authorization_header(self) -> str:
         """
         Check to see if a new token is needed and return "Bearer <access_token>"
         """
         self.ensure_valid_token()
-        log.debug(f'bearer token has hash "{self._access_token_hash}"')
-        return f"Bearer {self.access_token}"
+        with self._token_lock:
+            access_token, token_hash = self.access_token, self._access_token_hash
+        self._request_token_hash.set(token_hash)
+        log.debug(f'bearer token has hash "{token_hash}"')
+        return f"Bearer {access_token}"
 
     def handle_missing_authorization(self) -> bool:
         """
@@ -178,12 +310,63 @@ class RenewingAuthorizer(GlobusAuthorizer, metaclass=abc.ABCMeta):
         invalidating its current Access Token. When this happens, the next call
         to ``set_authorization_header()`` will result in a new Access Token
         being fetched.
+
+        If the token which was rejected has already been replaced by another thread
+        or task, the current token is kept.
         """
-        log.debug(
-            "RenewingAuthorizer seeing 401. Invalidating "
-            "token and preparing for refresh."
-        )
-        # None for expires_at invalidates any current token
-        self.expires_at = None
+        rejected_hash = self._request_token_hash.get()
+        with self._token_lock:
+            if rejected_hash is not None and rejected_hash != self._access_token_hash:
+                log.debug(
+                    "RenewingAuthorizer seeing 401 for a token which has already "
+                    "been replaced. Keeping current token."
+                )
+                return True
+
+            log.debug(
+                "RenewingAuthorizer seeing 401. Invalidating "
+                "token and preparing for refresh."
+            )
+            # None for expires_at invalidates any current token
+            self.expires_at = None
         # respond True, as in "we took some action, the 401 *may* be resolved"
         return True
+
+
+def _run_background_renewal(
+    ref: weakref.ReferenceType[RenewingAuthorizer],
+    stop: threading.Event,
+    lead_time: float,
+    jitter: float,
+) -> None:
+    # only hold a strong reference to the authorizer while working with it, so that
+    # the thread does not keep it alive
+    min_delay: float = 0
+    while not stop.is_set():
+        authorizer = ref()
+        if authorizer is None:
+            return
+        delay = max(
+            authorizer._seconds_until_background_renewal(lead_time, jitter), min_delay
+        )
+        expires_at = authorizer.expires_at
+        del authorizer
+
+        if stop.wait(delay):
+            return
+
+        authorizer = ref()
+        if authorizer is None:
+            return
+        failed = False
+        try:
+            authorizer._renew_in_background(expires_at)
+        except Exception:  # pylint: disable=broad-except
+            log.warning("background token renewal failed, will retry", exc_info=True)
+            failed = True
+        del authorizer
+
+        if failed:
+            min_delay = BACKGROUND_RENEWAL_RETRY_SECONDS
+        else:
+            min_delay = BACKGROUND_RENEWAL_MIN_INTERVAL_SECONDS
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import collections
+import concurrent.futures
 import logging
 import typing as t
 import urllib.parse
 
+import requests
+
 from globus_sdk import config, exc, utils
 from globus_sdk.authorizers import GlobusAuthorizer
 from globus_sdk.paging import PaginatorTable
@@ -15,27 +19,37 @@ log = logging.getLogger(__name__)
 
 DataParamType = t.Union[None, str, t.Dict[str, t.Any], utils.PayloadWrapper]
 
+T = t.TypeVar("T")
 
-class BaseClient:
-    r"""
-    Abstract base class for clients with error handling for Globus APIs.
 
-    :param authorizer: A ``GlobusAuthorizer`` which will generate Authorization headers
-    :type authorizer: :class:`GlobusAuthorizer\
-        <globus_sdk.authorizers.base.GlobusAuthorizer>`
-    :param app_name: Optional "nice name" for the application. Has no bearing on the
-        semantics of client actions. It is just passed as part of the User-Agent
-        string, and may be useful when debugging issues with the Globus Team
-    :type app_name: str
-    :param base_url: The URL for the service. Most client types initialize this value
-        intelligently by default. Set it when inheriting from BaseClient or
-        communicating through a proxy.
-    :type base_url: str
-    :param transport_params: Options to pass to the transport for this client
-    :type transport_params: dict
+class MapResult(t.NamedTuple):
+    """
+    The outcome of one call made by :meth:`BaseClient.map`.
+    """
 
-    All other parameters are for internal use and should be ignored.
+    #: the position of the item in the input
+    position: int
+    #: the item the call was made with
+    item: t.Any
+    #: the value returned by the call, or ``None`` if it raised an error
+    result: t.Any
+    #: the error raised by the call, or ``None`` if it succeeded
+    exception: exc.GlobusError | None
+
+    @property
+    def ok(self) -> bool:
+        """``True`` if the call succeeded"""
+        return self.exception is None
+
+
+class _ClientCore:
     """
+    The parts of a client which do not depend on how requests are sent: the base URL,
+    transport, and authorizer, and the handling of request paths, request data, and
+    responses. These are shared by ``BaseClient`` and the asynchronous clients in
+    ``globus_sdk.experimental.aio``.
+    """
+
     # service name is used to lookup a service URL from config
     service_name: str = "_base"
     # path under the client base URL
@@ -98,13 +112,10 @@ class BaseClient:
         self.authorizer = authorizer
 
         # set application name if given
-        self._app_name = None
+        self._app_name: str | None = None
         if app_name is not None:
             self.app_name = app_name
 
-        # setup paginated methods
-        self.paginated = PaginatorTable(self)
-
     @property
     def app_name(self) -> str | None:
         return self._app_name
@@ -127,12 +138,83 @@ class BaseClient:
             return None
         return self_or_cls.scopes.resource_server
 
+    def _get_url(self, path: str) -> str:
+        # if a client is asked to make a request against a full URL, not just the path
+        # component, then do not resolve the path, simply pass it through as the URL
+        if path.startswith("https://") or path.startswith("http://"):
+            url = path
+        else:
+            url = utils.slash_join(self.base_url, urllib.parse.quote(path))
+        log.debug("request will hit URL: %s", url)
+        return url
+
+    @staticmethod
+    def _unwrap_data(data: DataParamType) -> dict[str, t.Any] | str | None:
+        if isinstance(data, utils.PayloadWrapper):
+            return data._get_request_data()
+        return data
+
+    def _handle_response(self, r: requests.Response) -> GlobusHTTPResponse:
+        log.debug("request made to URL: %s", r.url)
+
+        if 200 <= r.status_code < 400:
+            log.debug(f"request completed with response code: {r.status_code}")
+            # the client of a response is typed as a BaseClient, but it is only an
+            # attribute for the caller's reference
+            return GlobusHTTPResponse(r, t.cast("BaseClient", self))
+
+        log.debug(f"request completed with (error) response code: {r.status_code}")
+        raise self.error_class(r)
+
+
+class BaseClient(_ClientCore):
+    r"""
+    Abstract base class for clients with error handling for Globus APIs.
+
+    :param authorizer: A ``GlobusAuthorizer`` which will generate Authorization headers
+    :type authorizer: :class:`GlobusAuthorizer\
+        <globus_sdk.authorizers.base.GlobusAuthorizer>`
+    :param app_name: Optional "nice name" for the application. Has no bearing on the
+        semantics of client actions. It is just passed as part of the User-Agent
+        string, and may be useful when debugging issues with the Globus Team
+    :type app_name: str
+    :param base_url: The URL for the service. Most client types initialize this value
+        intelligently by default. Set it when inheriting from BaseClient or
+        communicating through a proxy.
+    :type base_url: str
+    :param transport_params: Options to pass to the transport for this client
+    :type transport_params: dict
+
+    All other parameters are for internal use and should be ignored.
+    """
+
+    def __init__(
+        self,
+        *,
+        environment: str | None = None,
+        base_url: str | None = None,
+        authorizer: GlobusAuthorizer | None = None,
+        app_name: str | None = None,
+        transport_params: dict[str, t.Any] | None = None,
+    ):
+        super().__init__(
+            environment=environment,
+            base_url=base_url,
+            authorizer=authorizer,
+            app_name=app_name,
+            transport_params=transport_params,
+        )
+
+        # setup paginated methods
+        self.paginated = PaginatorTable(self)
+
     def get(  # pylint: disable=missing-param-doc
         self,
         path: str,
         *,
         query_params: dict[str, t.Any] | None = None,
         headers: dict[str, str] | None = None,
+        stream: bool = False,
     ) -> GlobusHTTPResponse:
         """
         Make a GET request to the specified path.
@@ -143,7 +225,9 @@ class BaseClient:
         <globus_sdk.response.GlobusHTTPResponse>` object
         """
         log.debug(f"GET to {path} with query_params {query_params}")
-        return self.request("GET", path, query_params=query_params, headers=headers)
+        return self.request(
+            "GET", path, query_params=query_params, headers=headers, stream=stream
+        )
 
     def post(  # pylint: disable=missing-param-doc
         self,
@@ -153,6 +237,7 @@ class BaseClient:
         data: DataParamType = None,
         headers: dict[str, str] | None = None,
         encoding: str | None = None,
+        stream: bool = False,
     ) -> GlobusHTTPResponse:
         """
         Make a POST request to the specified path.
@@ -170,6 +255,7 @@ class BaseClient:
             data=data,
             headers=headers,
             encoding=encoding,
+            stream=stream,
         )
 
     def delete(  # pylint: disable=missing-param-doc
@@ -255,6 +341,7 @@ class BaseClient:
         encoding: str | None = None,
         allow_redirects: bool = True,
         stream: bool = False,
+        deadline: float | None = None,
     ) -> GlobusHTTPResponse:
         """
         Send an HTTP request
@@ -270,7 +357,8 @@ class BaseClient:
         :param data: Data to send as the request body. May pass through encoding.
         :type data: dict or str
         :param encoding: A way to encode request data. "json", "form", and "text"
-            are all valid values. Custom encodings can be used only if they are
+            are all valid values, as are "json+gzip" and "json+deflate", which
+            compress large JSON bodies. Custom encodings can be used only if they are
             registered with the transport. By default, strings get "text" behavior and
             all other objects get "json".
         :type encoding: str
@@ -278,8 +366,14 @@ class BaseClient:
             automatically. Defaults to ``True``
         :type allow_redirects: bool
         :param stream: Do not immediately download the response content. Defaults to
-            ``False``
+            ``False``. Iterable responses built from a streamed response decode their
+            items incrementally as they are iterated
         :type stream: bool
+        :param deadline: The maximum number of seconds that the request may take,
+            including retries. Defaults to the ``deadline`` of the transport. The
+            ``get()``, ``post()`` and other helper methods do not take a deadline; use
+            ``transport.tune(deadline=...)`` to set one for them
+        :type deadline: float, optional
 
         :return: :class:`GlobusHTTPResponse \
         <globus_sdk.response.GlobusHTTPResponse>` object
@@ -287,35 +381,103 @@ class BaseClient:
         :raises GlobusAPIError: a `GlobusAPIError` will be raised if the response to the
             request is received and has a status code in the 4xx or 5xx categories
         """
-        # prepare data...
         # copy headers if present
         rheaders = {**headers} if headers else {}
 
-        # if a client is asked to make a request against a full URL, not just the path
-        # component, then do not resolve the path, simply pass it through as the URL
-        if path.startswith("https://") or path.startswith("http://"):
-            url = path
-        else:
-            url = utils.slash_join(self.base_url, urllib.parse.quote(path))
-
-        # make the request
-        log.debug("request will hit URL: %s", url)
         r = self.transport.request(
             method=method,
-            url=url,
-            data=data.data if isinstance(data, utils.PayloadWrapper) else data,
+            url=self._get_url(path),
+            data=self._unwrap_data(data),
             query_params=query_params,
             headers=rheaders,
             encoding=encoding,
             authorizer=self.authorizer,
             allow_redirects=allow_redirects,
             stream=stream,
+            deadline=deadline,
         )
-        log.debug("request made to URL: %s", r.url)
-
-        if 200 <= r.status_code < 400:
-            log.debug(f"request completed with response code: {r.status_code}")
-            return GlobusHTTPResponse(r, self)
+        return self._handle_response(r)
 
-        log.debug(f"request completed with (error) response code: {r.status_code}")
-        raise self.error_class(r)
+    def map(
+        self,
+        method: t.Callable[[T], t.Any],
+        items: t.Iterable[T],
+        *,
+        concurrency: int = 4,
+        ordered: bool = True,
+    ) -> t.Iterator[MapResult]:
+        """
+        Call ``method`` once for each of ``items``, running up to ``concurrency``
+        calls at once on a thread pool, and yield a :class:`MapResult` for each call.
+
+        ``method`` is usually a method of this client, for example
+        ``tc.map(tc.get_task, task_ids)``. Calls which need other arguments can be
+        made with a ``lambda`` or ``functools.partial``.
+
+        The calls share the transport of the client, so its connection pool,
+        authorizer, rate limiter, and retry behavior apply to every call. For the best
+        throughput, the transport's ``pool_maxsize`` should be at least
+        ``concurrency``.
+
+        Items are read from ``items`` as calls complete, so a long or unbounded
+        iterable is never held in memory at once. If the iterator is closed before
+        it is exhausted, calls which have not started are cancelled.
+
+        A :class:`GlobusError <globus_sdk.GlobusError>` raised by a call, such as an
+        API error or a network error, is recorded in the ``exception`` of its result.
+        Other errors are raised by the iterator.
+
+        :param method: The callable to call with each item
+        :type method: callable
+        :param items: The items to call ``method`` with
+        :type items: iterable
+        :param concurrency: The maximum number of calls to run at once
+        :type concurrency: int
+        :param ordered: If ``True``, results are yielded in the order of ``items``.
+            If ``False``, they are yielded as the calls complete
+        :type ordered: bool
+        """
+        if concurrency < 1:
+            raise ValueError("Cannot map with a concurrency of less than one.")
+
+        def call(position: int, item: T) -> MapResult:
+            try:
+                return MapResult(position, item, method(item), None)
+            except exc.GlobusError as err:
+                return MapResult(position, item, None, err)
+
+        # submit a few calls beyond the concurrency, so that workers are not left
+        # idle while results are consumed
+        window = concurrency * 2
+        iterator = enumerate(items)
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=concurrency)
+        pending: collections.deque[
+            concurrent.futures.Future[MapResult]
+        ] = collections.deque()
+
+        def fill_window() -> None:
+            while len(pending) < window:
+                try:
+                    position, item = next(iterator)
+                except StopIteration:
+                    return
+                pending.append(executor.submit(call, position, item))
+
+        try:
+            fill_window()
+            while pending:
+                if ordered:
+                    future = pending.popleft()
+                else:
+                    done, _ = concurrent.futures.wait(
+                        pending, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    future = next(f for f in pending if f in done)
+                    pending.remove(future)
+                result = future.result()
+                fill_window()
+                yield result
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
@@ -1,6 +1,7 @@
 from .api import ErrorSubdocument, GlobusAPIError
 from .base import GlobusError, GlobusSDKUsageError
 from .convert import (
+    GlobusCircuitOpenError,
     GlobusConnectionError,
     GlobusConnectionTimeoutError,
     GlobusTimeoutError,
@@ -24,6 +25,7 @@ __all__ = (
     "GlobusTimeoutError",
     "GlobusConnectionTimeoutError",
     "GlobusConnectionError",
+    "GlobusCircuitOpenError",
     "convert_request_exception",
     "ErrorInfo",
     "ErrorInfoContainer",
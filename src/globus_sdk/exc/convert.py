@@ -36,6 +36,25 @@ class GlobusConnectionError(NetworkError):
     """A connection error occurred while making a REST request."""
 
 
+class GlobusCircuitOpenError(GlobusError):
+    """
+    A request was not sent because the circuit breaker for its host is open, after
+    too many recent requests to the host failed.
+
+    :ivar host: The host to which the request would have been sent
+    :ivar retry_at: The time, as a Unix timestamp, after which requests to the host
+        will be tried again
+    """
+
+    def __init__(self, host: str, retry_at: float | None) -> None:
+        super().__init__(host, retry_at)
+        self.host = host
+        self.retry_at = retry_at
+
+    def __str__(self) -> str:
+        return f"Circuit breaker is open for {self.host}, request not sent"
+
+
 def convert_request_exception(exc: requests.RequestException) -> GlobusError:
     """
     Converts incoming requests.Exception to a Globus NetworkError
@@ -0,0 +1,147 @@
+"""
+Helpers for sending SDK requests with ``httpx``.
+
+``httpx`` is an optional dependency. Transports which use it convert requests and
+responses at the boundary, so that encoders, retry checks, and error classes continue
+to work with ``requests`` objects.
+"""
+from __future__ import annotations
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+try:
+    import httpx
+except ImportError as _err:  # pragma: no cover
+    raise ImportError(
+        "The 'httpx' package is required in order to use httpx-based transports. "
+        "Install it with 'pip install httpx'."
+    ) from _err
+
+__all__ = (
+    "httpx",
+    "build_request",
+    "to_requests_response",
+    "to_requests_exception",
+)
+
+
+def build_request(
+    client: httpx.Client | httpx.AsyncClient,
+    prepared: requests.PreparedRequest,
+    timeout: float | None,
+) -> httpx.Request:
+    """
+    Convert a prepared ``requests`` request into an ``httpx`` request.
+
+    :param client: The client which will send the request
+    :param prepared: The prepared request, as produced by an encoder
+    :param timeout: The timeout to apply to the request, or ``None`` for no timeout
+    """
+    # let httpx compute the content length for the body it sends
+    headers = {
+        k: v for k, v in prepared.headers.items() if k.lower() != "content-length"
+    }
+    return client.build_request(
+        prepared.method or "GET",
+        prepared.url or "",
+        headers=headers,
+        content=prepared.body,
+        timeout=timeout,
+    )
+
+
+class _StreamingBody:
+    """
+    A file-like view of the body of an unread ``httpx`` response, used as the
+    ``raw`` attribute of a streamed ``requests`` response. The ``httpx`` response is
+    closed, releasing its connection, once the body has been read.
+    """
+
+    def __init__(
+        self, response: httpx.Response, prepared: requests.PreparedRequest
+    ) -> None:
+        self._response = response
+        self._prepared = prepared
+        self._chunks = response.iter_bytes()
+        self._buffer = bytearray()
+
+    def read(self, amt: int | None = None) -> bytes:
+        try:
+            while amt is None or len(self._buffer) < amt:
+                chunk = next(self._chunks, None)
+                if chunk is None:
+                    self.close()
+                    break
+                self._buffer += chunk
+        except httpx.RequestError as err:
+            self.close()
+            raise to_requests_exception(err, self._prepared) from err
+        size = len(self._buffer) if amt is None else amt
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+    def close(self) -> None:
+        self._response.close()
+
+
+def to_requests_response(
+    response: httpx.Response,
+    prepared: requests.PreparedRequest,
+    *,
+    stream: bool = False,
+) -> requests.Response:
+    """
+    Convert an ``httpx`` response into a ``requests`` response.
+
+    :param response: The response to convert. Unless ``stream`` is set, its content
+        must already be read.
+    :param prepared: The request which produced the response
+    :param stream: If true, the body of the response has not been read, and will be
+        read as the ``requests`` response is consumed
+    """
+    converted = requests.Response()
+    converted.status_code = response.status_code
+    converted.reason = response.reason_phrase
+    converted.headers = CaseInsensitiveDict(response.headers.items())
+    converted.url = str(response.url)
+    converted.encoding = response.charset_encoding
+    converted.request = prepared
+    try:
+        converted.elapsed = response.elapsed
+    except RuntimeError:  # not all httpx transports record the elapsed time
+        pass
+    if stream:
+        converted.raw = _StreamingBody(response, prepared)
+    else:
+        converted._content = response.content
+    return converted
+
+
+def to_requests_exception(
+    err: httpx.RequestError, prepared: requests.PreparedRequest
+) -> requests.RequestException:
+    """
+    Convert an ``httpx`` error into the equivalent ``requests`` error, so that retry
+    checks and error conversion see the same exception types for every transport.
+
+    :param err: The error raised by ``httpx``
+    :param prepared: The request which was being sent
+    """
+    exc_class: type[requests.RequestException]
+    if isinstance(err, httpx.ConnectTimeout):
+        exc_class = requests.ConnectTimeout
+    elif isinstance(err, httpx.TimeoutException):
+        exc_class = requests.Timeout
+    elif isinstance(err, (httpx.NetworkError, httpx.ProtocolError)):
+        exc_class = requests.ConnectionError
+    elif isinstance(err, httpx.TooManyRedirects):
+        exc_class = requests.TooManyRedirects
+    elif isinstance(err, httpx.DecodingError):
+        exc_class = requests.exceptions.ContentDecodingError
+    else:
+        exc_class = requests.RequestException
+    converted = exc_class(str(err), request=prepared)
+    converted.__cause__ = err
+    return converted
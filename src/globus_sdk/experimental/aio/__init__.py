@@ -0,0 +1,23 @@
+from .client import AsyncBaseClient
+from .services import (
+    AsyncAuthClient,
+    AsyncFlowsClient,
+    AsyncGroupsClient,
+    AsyncSearchClient,
+    AsyncTimerClient,
+    AsyncTransferClient,
+    AsyncTransferTransport,
+)
+from .transport import AsyncTransport
+
+__all__ = (
+    "AsyncTransport",
+    "AsyncTransferTransport",
+    "AsyncBaseClient",
+    "AsyncAuthClient",
+    "AsyncFlowsClient",
+    "AsyncGroupsClient",
+    "AsyncSearchClient",
+    "AsyncTimerClient",
+    "AsyncTransferClient",
+)
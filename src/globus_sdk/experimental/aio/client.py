@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import logging
+import typing as t
+
+from globus_sdk.client import DataParamType, _ClientCore
+from globus_sdk.response import GlobusHTTPResponse
+
+from .transport import AsyncTransport
+
+log = logging.getLogger(__name__)
+
+
+class AsyncBaseClient(_ClientCore):
+    r"""
+    An asynchronous counterpart to :class:`globus_sdk.BaseClient`.
+
+    The request methods (``get``, ``post``, ``put``, ``patch``, ``delete``, and
+    ``request``) are coroutines, and return the same
+    :class:`GlobusHTTPResponse <globus_sdk.response.GlobusHTTPResponse>` objects as
+    their synchronous equivalents. Errors are raised as ``error_class``, exactly as
+    with a ``BaseClient``.
+
+    The client can be used as an asynchronous context manager, which closes the
+    transport on exit.
+
+    :param authorizer: A ``GlobusAuthorizer`` which will generate Authorization headers
+    :type authorizer: :class:`GlobusAuthorizer\
+        <globus_sdk.authorizers.base.GlobusAuthorizer>`
+    :param app_name: Optional "nice name" for the application, passed as part of the
+        User-Agent string
+    :type app_name: str
+    :param base_url: The URL for the service. Required if the client class does not
+        set a ``service_name``
+    :type base_url: str
+    :param transport_params: Options to pass to the transport for this client
+    :type transport_params: dict
+    """
+
+    #: the type of Transport which will be used, defaults to ``AsyncTransport``
+    transport_class: type[AsyncTransport] = AsyncTransport
+    transport: AsyncTransport
+
+    async def aclose(self) -> None:
+        """
+        Close the transport used by this client.
+        """
+        await self.transport.aclose()
+
+    async def __aenter__(self) -> AsyncBaseClient:
+        return self
+
+    async def __aexit__(self, *exc_info: t.Any) -> None:
+        await self.aclose()
+
+    async def get(  # pylint: disable=missing-param-doc
+        self,
+        path: str,
+        *,
+        query_params: dict[str, t.Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> GlobusHTTPResponse:
+        """
+        Make a GET request to the specified path.
+
+        See :py:meth:`~.AsyncBaseClient.request` for details on the various parameters.
+        """
+        log.debug(f"GET to {path} with query_params {query_params}")
+        return await self.request(
+            "GET", path, query_params=query_params, headers=headers
+        )
+
+    async def post(  # pylint: disable=missing-param-doc
+        self,
+        path: str,
+        *,
+        query_params: dict[str, t.Any] | None = None,
+        data: DataParamType = None,
+        headers: dict[str, str] | None = None,
+        encoding: str | None = None,
+    ) -> GlobusHTTPResponse:
+        """
+        Make a POST request to the specified path.
+
+        See :py:meth:`~.AsyncBaseClient.request` for details on the various parameters.
+        """
+        log.debug(f"POST to {path} with query_params {query_params}")
+        return await self.request(
+            "POST",
+            path,
+            query_params=query_params,
+            data=data,
+            headers=headers,
+            encoding=encoding,
+        )
+
+    async def delete(  # pylint: disable=missing-param-doc
+        self,
+        path: str,
+        *,
+        query_params: dict[str, t.Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> GlobusHTTPResponse:
+        """
+        Make a DELETE request to the specified path.
+
+        See :py:meth:`~.AsyncBaseClient.request` for details on the various parameters.
+        """
+        log.debug(f"DELETE to {path} with query_params {query_params}")
+        return await self.request(
+            "DELETE", path, query_params=query_params, headers=headers
+        )
+
+    async def put(  # pylint: disable=missing-param-doc
+        self,
+        path: str,
+        *,
+        query_params: dict[str, t.Any] | None = None,
+        data: DataParamType = None,
+        headers: dict[str, str] | None = None,
+        encoding: str | None = None,
+    ) -> GlobusHTTPResponse:
+        """
+        Make a PUT request to the specified path.
+
+        See :py:meth:`~.AsyncBaseClient.request` for details on the various parameters.
+        """
+        log.debug(f"PUT to {path} with query_params {query_params}")
+        return await self.request(
+            "PUT",
+            path,
+            query_params=query_params,
+            data=data,
+            headers=headers,
+            encoding=encoding,
+        )
+
+    async def patch(  # pylint: disable=missing-param-doc
+        self,
+        path: str,
+        *,
+        query_params: dict[str, t.Any] | None = None,
+        data: DataParamType = None,
+        headers: dict[str, str] | None = None,
+        encoding: str | None = None,
+    ) -> GlobusHTTPResponse:
+        """
+        Make a PATCH request to the specified path.
+
+        See :py:meth:`~.AsyncBaseClient.request` for details on the various parameters.
+        """
+        log.debug(f"PATCH to {path} with query_params {query_params}")
+        return await self.request(
+            "PATCH",
+            path,
+            query_params=query_params,
+            data=data,
+            headers=headers,
+            encoding=encoding,
+        )
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        query_params: dict[str, t.Any] | None = None,
+        data: DataParamType = None,
+        headers: dict[str, str] | None = None,
+        encoding: str | None = None,
+        allow_redirects: bool = True,
+    ) -> GlobusHTTPResponse:
+        """
+        Send an HTTP request
+
+        :param method: HTTP request method, as an all caps string
+        :type method: str
+        :param path: Path for the request, with or without leading slash
+        :type path: str
+        :param query_params: Parameters to be encoded as a query string
+        :type query_params: dict, optional
+        :param headers: HTTP headers to add to the request
+        :type headers: dict
+        :param data: Data to send as the request body. May pass through encoding.
+        :type data: dict or str
+        :param encoding: A way to encode request data. "json", "form", and "text"
+            are all valid values. Custom encodings can be used only if they are
+            registered with the transport. By default, strings get "text" behavior and
+            all other objects get "json".
+        :type encoding: str
+        :param allow_redirects: Follow Location headers on redirect response
+            automatically. Defaults to ``True``
+        :type allow_redirects: bool
+
+        :raises GlobusAPIError: a `GlobusAPIError` will be raised if the response to the
+            request is received and has a status code in the 4xx or 5xx categories
+        """
+        rheaders = {**headers} if headers else {}
+
+        r = await self.transport.arequest(
+            method=method,
+            url=self._get_url(path),
+            data=self._unwrap_data(data),
+            query_params=query_params,
+            headers=rheaders,
+            encoding=encoding,
+            authorizer=self.authorizer,
+            allow_redirects=allow_redirects,
+        )
+        return self._handle_response(r)
@@ -0,0 +1,85 @@
+"""
+Asynchronous clients for Globus services.
+
+These clients are configured for a specific service -- its URL, error class, scopes,
+and retry behavior -- and expose the low-level request methods of
+:class:`AsyncBaseClient <globus_sdk.experimental.aio.AsyncBaseClient>`.
+They do not provide the higher-level helper methods of the synchronous clients.
+"""
+from __future__ import annotations
+
+from globus_sdk.scopes import (
+    AuthScopes,
+    FlowsScopes,
+    GroupsScopes,
+    SearchScopes,
+    TimerScopes,
+    TransferScopes,
+)
+from globus_sdk.services.auth import AuthAPIError
+from globus_sdk.services.flows import FlowsAPIError
+from globus_sdk.services.groups import GroupsAPIError
+from globus_sdk.services.search import SearchAPIError
+from globus_sdk.services.timer import TimerAPIError
+from globus_sdk.services.transfer import TransferAPIError
+from globus_sdk.services.transfer.transport import TransferRequestsTransport
+
+from .client import AsyncBaseClient
+from .transport import AsyncTransport
+
+
+class AsyncTransferTransport(AsyncTransport, TransferRequestsTransport):
+    """
+    An ``AsyncTransport`` with the retry behaviors of the ``TransferClient``.
+    """
+
+
+class AsyncAuthClient(AsyncBaseClient):
+    """An asynchronous client for the Globus Auth API."""
+
+    service_name = "auth"
+    error_class = AuthAPIError
+    scopes = AuthScopes
+
+
+class AsyncFlowsClient(AsyncBaseClient):
+    """An asynchronous client for the Globus Flows API."""
+
+    service_name = "flows"
+    error_class = FlowsAPIError
+    scopes = FlowsScopes
+
+
+class AsyncGroupsClient(AsyncBaseClient):
+    """An asynchronous client for the Globus Groups API."""
+
+    service_name = "groups"
+    base_path = "/v2/"
+    error_class = GroupsAPIError
+    scopes = GroupsScopes
+
+
+class AsyncSearchClient(AsyncBaseClient):
+    """An asynchronous client for the Globus Search API."""
+
+    service_name = "search"
+    error_class = SearchAPIError
+    scopes = SearchScopes
+
+
+class AsyncTimerClient(AsyncBaseClient):
+    """An asynchronous client for the Globus Timer API."""
+
+    service_name = "timer"
+    error_class = TimerAPIError
+    scopes = TimerScopes
+
+
+class AsyncTransferClient(AsyncBaseClient):
+    """An asynchronous client for the Globus Transfer API."""
+
+    service_name = "transfer"
+    base_path = "/v0.10/"
+    transport_class: type[AsyncTransport] = AsyncTransferTransport
+    error_class = TransferAPIError
+    scopes = TransferScopes
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import typing as t
+
+import requests
+
+from globus_sdk.authorizers import GlobusAuthorizer
+from globus_sdk.experimental import _httpx_compat
+from globus_sdk.experimental._httpx_compat import httpx
+from globus_sdk.transport import RequestsTransport
+from globus_sdk.transport.hooks import _RequestHooks
+from globus_sdk.transport.requests import _SleepStep, _StepOutcome
+
+log = logging.getLogger(__name__)
+
+
+class AsyncTransport(RequestsTransport):
+    """
+    The AsyncTransport sends requests with an ``httpx.AsyncClient``, allowing many
+    requests to be in flight concurrently on a single event loop.
+
+    It is a ``RequestsTransport`` and accepts all of the same parameters. Encoders,
+    retry checks, ``tune()``, authorizer handling, and the optional response cache,
+    rate limiter, and circuit breaker behave identically: requests are encoded into
+    ``requests`` objects, and responses are converted back into
+    ``requests.Response`` objects before retry checks see them.
+
+    Requests are sent asynchronously with :meth:`arequest`. Authorizers are called
+    synchronously, so a ``RenewingAuthorizer`` which must fetch a new token will
+    block the event loop while it does so.
+
+    The underlying ``httpx.AsyncClient`` objects are bound to the event loop on which
+    they are first used. Call :meth:`aclose` when the transport is no longer needed.
+
+    No ``requests.Session`` is created by an ``AsyncTransport``, so the ``session``
+    and connection pool parameters have no effect. Connection limits for the
+    ``httpx.AsyncClient`` may be set with ``httpx_client_params``.
+
+    :param httpx_client_params: Keyword arguments used to construct the
+        ``httpx.AsyncClient``, e.g. ``{"limits": httpx.Limits(...)}``
+    :type httpx_client_params: dict, optional
+    """
+
+    def __init__(
+        self,
+        *args: t.Any,
+        httpx_client_params: dict[str, t.Any] | None = None,
+        **kwargs: t.Any,
+    ):
+        super().__init__(*args, **kwargs)
+        self.httpx_client_params = dict(httpx_client_params or {})
+        # clients are keyed by `verify_ssl`, which is fixed when an httpx client is
+        # created but may be changed on the transport via `tune()`
+        self._async_clients: dict[bool, httpx.AsyncClient] = {}
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        client = self._async_clients.get(self.verify_ssl)
+        if client is None:
+            client = httpx.AsyncClient(
+                verify=self.verify_ssl, **self.httpx_client_params
+            )
+            self._async_clients[self.verify_ssl] = client
+        return client
+
+    def get_pool_stats(self) -> dict[str, dict[str, int]]:
+        """
+        Statistics are not collected for the connection pools of an
+        ``httpx.AsyncClient``, so this always returns an empty dict.
+        """
+        return {}
+
+    async def aclose(self) -> None:
+        """
+        Close any ``httpx.AsyncClient`` objects held by this transport.
+        """
+        clients = list(self._async_clients.values())
+        self._async_clients.clear()
+        for client in clients:
+            await client.aclose()
+
+    async def _async_send(
+        self,
+        prepared: requests.PreparedRequest,
+        allow_redirects: bool,
+        timeout: float | None,
+    ) -> requests.Response:
+        client = self._get_async_client()
+        request = _httpx_compat.build_request(client, prepared, timeout)
+        try:
+            response = await client.send(request, follow_redirects=allow_redirects)
+        except httpx.RequestError as err:
+            raise _httpx_compat.to_requests_exception(err, prepared) from err
+        return _httpx_compat.to_requests_response(response, prepared)
+
+    async def arequest(
+        self,
+        method: str,
+        url: str,
+        query_params: dict[str, t.Any] | None = None,
+        data: dict[str, t.Any] | str | None = None,
+        headers: dict[str, str] | None = None,
+        encoding: str | None = None,
+        authorizer: GlobusAuthorizer | None = None,
+        allow_redirects: bool = True,
+        stream: bool = False,  # pylint: disable=unused-argument
+        deadline: float | None = None,
+    ) -> requests.Response:
+        """
+        Send an HTTP request asynchronously.
+
+        The parameters are the same as those of :meth:`request`. ``stream`` is accepted
+        for compatibility, but the response body is always read in full.
+
+        :param url: URL for the request
+        :type url: str
+        :param method: HTTP request method, as an all caps string
+        :type method: str
+        :param query_params: Parameters to be encoded as a query string
+        :type query_params: dict, optional
+        :param headers: HTTP headers to add to the request
+        :type headers: dict
+        :param data: Data to send as the request body. May pass through encoding.
+        :type data: dict or str
+        :param encoding: A way to encode request data, as in :meth:`request`
+        :type encoding: str
+        :param authorizer: The authorizer which is used to get or update authorization
+            information for the request
+        :type authorizer: GlobusAuthorizer, optional
+        :param allow_redirects: Follow Location headers on redirect response
+            automatically. Defaults to ``True``
+        :type allow_redirects: bool
+        :param stream: Ignored
+        :type stream: bool
+        :param deadline: The maximum number of seconds that the request may take,
+            including retries. Defaults to the ``deadline`` of the transport
+        :type deadline: float, optional
+
+        :return: ``requests.Response`` object
+        """
+        log.debug("starting async request for %s", url)
+        req = self._encode(method, url, query_params, data, headers, encoding)
+        hooks = _RequestHooks(self.hooks, method, url, req)
+        hooks.start()
+        try:
+            resp = await self._async_send_with_retries(
+                req,
+                url,
+                authorizer=authorizer,
+                allow_redirects=allow_redirects,
+                deadline=deadline,
+                hooks=hooks,
+            )
+        except Exception as err:
+            hooks.end(None, err)
+            raise
+        hooks.end(resp, None)
+        return resp
+
+    async def _async_send_with_retries(
+        self,
+        req: requests.Request,
+        url: str,
+        *,
+        authorizer: GlobusAuthorizer | None,
+        allow_redirects: bool,
+        deadline: float | None,
+        hooks: _RequestHooks,
+    ) -> requests.Response:
+        # the retry loop is shared with RequestsTransport, only sends and sleeps are
+        # performed differently
+        steps = self._retry_steps(
+            req,
+            url,
+            authorizer=authorizer,
+            stream=False,
+            deadline=deadline,
+            hooks=hooks,
+        )
+        outcome: _StepOutcome = None
+        while True:
+            try:
+                step = steps.send(outcome)
+            except StopIteration as stop:
+                return t.cast(requests.Response, stop.value)
+            if isinstance(step, _SleepStep):
+                await asyncio.sleep(step.seconds)
+                outcome = None
+                continue
+            try:
+                outcome = await self._async_send(
+                    step.prepared, allow_redirects, step.timeout
+                )
+            except requests.RequestException as err:
+                outcome = err
@@ -0,0 +1,3 @@
+from .transport import HTTP2TransferTransport, HTTP2Transport
+
+__all__ = ("HTTP2Transport", "HTTP2TransferTransport")
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import logging
+import threading
+import typing as t
+
+import requests
+
+from globus_sdk.experimental import _httpx_compat
+from globus_sdk.experimental._httpx_compat import httpx
+from globus_sdk.services.transfer.transport import TransferRequestsTransport
+from globus_sdk.transport import RequestsTransport
+
+log = logging.getLogger(__name__)
+
+
+class HTTP2Transport(RequestsTransport):
+    """
+    The HTTP2Transport sends requests with an ``httpx.Client`` which negotiates
+    HTTP/2 with servers that support it. Over HTTP/2, concurrent requests to a host
+    are multiplexed on a single connection, rather than each holding a connection
+    of its own.
+
+    It is a ``RequestsTransport`` and accepts all of the same parameters. Encoders,
+    retry checks, ``tune()``, authorizer handling, and the optional response cache,
+    rate limiter, circuit breaker, and hooks behave identically: requests are
+    encoded into ``requests`` objects, and responses are converted back into
+    ``requests.Response`` objects before retry checks see them. The connection pool
+    settings and ``session`` apply only to ``requests`` and are not used to send
+    requests; configure the ``httpx`` client with ``httpx_client_params`` instead.
+
+    A transport may be shared by many threads. Call :meth:`close` when it is no
+    longer needed.
+
+    Use it by setting the ``transport_class`` of a client class:
+
+    .. code-block:: python
+
+        class HTTP2GroupsClient(globus_sdk.GroupsClient):
+            transport_class = HTTP2Transport
+
+    :param http2: Whether or not to negotiate HTTP/2. Requires the ``h2`` package.
+        Defaults to ``True``
+    :type http2: bool
+    :param httpx_client_params: Keyword arguments used to construct the
+        ``httpx.Client``, e.g. ``{"limits": httpx.Limits(...)}``
+    :type httpx_client_params: dict, optional
+    """
+
+    def __init__(
+        self,
+        *args: t.Any,
+        http2: bool = True,
+        httpx_client_params: dict[str, t.Any] | None = None,
+        **kwargs: t.Any,
+    ):
+        super().__init__(*args, **kwargs)
+        self.http2 = http2
+        self.httpx_client_params = dict(httpx_client_params or {})
+        # clients are keyed by `verify_ssl`, which is fixed when an httpx client is
+        # created but may be changed on the transport via `tune()`
+        self._clients: dict[bool, httpx.Client] = {}
+        self._clients_lock = threading.Lock()
+
+    def _get_client(self) -> httpx.Client:
+        with self._clients_lock:
+            client = self._clients.get(self.verify_ssl)
+            if client is None:
+                client = httpx.Client(
+                    http2=self.http2,
+                    verify=self.verify_ssl,
+                    **self.httpx_client_params,
+                )
+                self._clients[self.verify_ssl] = client
+            return client
+
+    def close(self) -> None:
+        """
+        Close any ``httpx.Client`` objects held by this transport.
+        """
+        with self._clients_lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
+
+    def _send(
+        self,
+        prepared: requests.PreparedRequest,
+        *,
+        timeout: float | None,
+        allow_redirects: bool,
+        stream: bool,
+    ) -> requests.Response:
+        client = self._get_client()
+        request = _httpx_compat.build_request(client, prepared, timeout)
+        try:
+            response = client.send(
+                request, follow_redirects=allow_redirects, stream=stream
+            )
+        except httpx.RequestError as err:
+            raise _httpx_compat.to_requests_exception(err, prepared) from err
+        log.debug("response received over %s", response.http_version)
+        return _httpx_compat.to_requests_response(response, prepared, stream=stream)
+
+
+class HTTP2TransferTransport(HTTP2Transport, TransferRequestsTransport):
+    """
+    An ``HTTP2Transport`` with the retry behaviors of the ``TransferClient``.
+    """
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import abc
+import asyncio
+import collections.abc
 import functools
 import inspect
+import queue
 import sys
+import threading
 import typing as t
+import uuid
 
 from globus_sdk.response import GlobusHTTPResponse
 
@@ -18,6 +23,10 @@ P = ParamSpec("P")
 R = t.TypeVar("R", bound=GlobusHTTPResponse)
 C = t.TypeVar("C", bound=t.Callable[..., GlobusHTTPResponse])
 
+# messages passed from a _PagePrefetcher to its consumer are (kind, value) pairs
+# where kind is one of "page", "error", or "done"
+_PrefetchMessage = t.Tuple[str, t.Any]
+
 
 # stub for mypy
 class _PaginatedFunc(t.Generic[PageT]):
@@ -64,10 +73,100 @@ class Paginator(t.Iterable[PageT], metaclass=abc.ABCMeta):
         self.items_key = items_key
         self.client_args = client_args
         self.client_kwargs = client_kwargs
+        # set once the final page of results has been received
+        self._exhausted = False
+        # while pages are fetched ahead of the caller, the cursor and client_kwargs
+        # after the last page which was given to the caller, for use in checkpoints
+        self._caller_state: tuple[dict[str, t.Any], dict[str, t.Any]] | None = None
 
     def __iter__(self) -> t.Iterator[PageT]:
         yield from self.pages()
 
+    def _get_cursor(self) -> dict[str, t.Any]:
+        """
+        Get the state needed to fetch the next page, as a dict. Subclasses which
+        track additional state should extend this and ``_set_cursor``.
+        """
+        return {"exhausted": self._exhausted}
+
+    def _set_cursor(self, cursor: dict[str, t.Any]) -> None:
+        """
+        Restore the state recorded by ``_get_cursor``, including any parameters in
+        ``client_kwargs`` which depend on it.
+        """
+        self._exhausted = cursor["exhausted"]
+
+    def checkpoint(self) -> dict[str, t.Any]:
+        """
+        Get a checkpoint of the paginator's progress, as a dict which can be
+        serialized (e.g. as JSON). The checkpoint records the paginated method, the
+        arguments passed to it, and the position of the paginator in the results.
+
+        Paginators update their position before yielding each page, so a checkpoint
+        taken after a page has been handled will resume with the next page. When
+        pages are fetched ahead of the caller, with :meth:`prefetch_pages` or
+        :meth:`apages`, the checkpoint records the position after the last page
+        which was yielded to the caller, not the position of the background fetch.
+        If such an iteration is closed before it is finished, the paginator keeps
+        that position for checkpoints but cannot be iterated again; use
+        :meth:`from_checkpoint` to resume paging.
+
+        UUIDs in the method arguments are converted to strings. Any other arguments
+        must be serializable in order for the checkpoint to be serializable.
+        """
+        if self._caller_state is not None:
+            cursor, client_kwargs = self._caller_state
+        else:
+            cursor, client_kwargs = self._get_cursor(), self.client_kwargs
+        return {
+            "paginator": type(self).__name__,
+            "method": getattr(self.method, "__name__", None),
+            "client_args": _to_serializable(self.client_args),
+            "client_kwargs": _to_serializable(client_kwargs),
+            "cursor": cursor,
+        }
+
+    @classmethod
+    def from_checkpoint(
+        cls, method: t.Callable[..., t.Any], checkpoint: dict[str, t.Any]
+    ) -> Paginator[t.Any]:
+        """
+        Rebuild a paginator from a checkpoint produced by :meth:`checkpoint`.
+        The new paginator will continue from the position recorded in the
+        checkpoint.
+
+        For example, to resume listing the successful transfers of a task:
+
+            >>> paginator = tc.paginated.task_successful_transfers(task_id)
+            >>> checkpoint = paginator.checkpoint()
+            >>> ...
+            >>> paginator = Paginator.from_checkpoint(
+            ...     tc.task_successful_transfers, checkpoint
+            ... )
+
+        :param method: The bound method of an SDK client which was paginated. It must
+            be the same method which was used to produce the checkpoint.
+        :type method: callable
+        :param checkpoint: A checkpoint produced by :meth:`checkpoint`
+        :type checkpoint: dict
+        """
+        method_name = getattr(method, "__name__", None)
+        if method_name != checkpoint["method"]:
+            raise ValueError(
+                f"Cannot resume a checkpoint of '{checkpoint['method']}' with "
+                f"'{method_name}'"
+            )
+        paginator = cls.wrap(method)(
+            *checkpoint["client_args"], **checkpoint["client_kwargs"]
+        )
+        if type(paginator).__name__ != checkpoint["paginator"]:
+            raise ValueError(
+                f"Cannot resume a checkpoint of a {checkpoint['paginator']} with a "
+                f"{type(paginator).__name__}"
+            )
+        paginator._set_cursor(checkpoint["cursor"])
+        return paginator
+
     @abc.abstractmethod
     def pages(self) -> t.Iterator[PageT]:
         """``pages()`` yields GlobusHTTPResponse objects, each one representing a page
@@ -90,6 +189,121 @@ class Paginator(t.Iterable[PageT], metaclass=abc.ABCMeta):
         for page in self.pages():
             yield from page[self.items_key]
 
+    def _get_state(self) -> tuple[dict[str, t.Any], dict[str, t.Any]]:
+        return self._get_cursor(), dict(self.client_kwargs)
+
+    def _pages_with_state(
+        self,
+    ) -> t.Iterator[tuple[PageT, tuple[dict[str, t.Any], dict[str, t.Any]]]]:
+        # pair each page with the cursor and client_kwargs after it, taken before the
+        # next page is fetched, so that a background fetch does not change the
+        # caller's position
+        for page in self.pages():
+            yield page, self._get_state()
+
+    def prefetch_pages(self, depth: int = 1) -> t.Iterator[PageT]:
+        """
+        ``prefetch_pages()`` yields the same pages as ``pages()``, but fetches pages
+        in a background thread, staying up to ``depth`` pages ahead of the caller.
+        The request for the next page is therefore sent while the caller is still
+        handling the current one.
+
+        Any error raised while fetching a page is raised to the caller when it reaches
+        that page.
+
+        :param depth: The maximum number of pages to fetch ahead of the caller
+        :type depth: int
+        """
+        results: queue.Queue[_PrefetchMessage] = queue.Queue()
+        self._caller_state = self._get_state()
+        prefetcher = _PagePrefetcher(self._pages_with_state(), depth, results.put)
+        prefetcher.start()
+        try:
+            while True:
+                kind, value = results.get()
+                if kind != "page":
+                    # the caller has every page, so it is at the fetch position
+                    self._caller_state = None
+                    if kind == "error":
+                        raise value
+                    return
+                prefetcher.release()
+                page, self._caller_state = value
+                yield page
+        finally:
+            prefetcher.stop()
+
+    def prefetch_items(self, depth: int = 1) -> t.Iterator[t.Any]:
+        """
+        ``prefetch_items()`` is the equivalent of ``items()`` for
+        ``prefetch_pages()``.
+
+        :param depth: The maximum number of pages to fetch ahead of the caller
+        :type depth: int
+        """
+        if self.items_key is None:
+            raise ValueError(
+                "Cannot provide items() iteration on a paginator where 'items_key' "
+                "is not set."
+            )
+        for page in self.prefetch_pages(depth):
+            yield from page[self.items_key]
+
+    def __aiter__(self) -> t.AsyncIterator[PageT]:
+        return self.apages()
+
+    async def apages(self, *, prefetch: int = 1) -> t.AsyncIterator[PageT]:
+        """
+        ``apages()`` is an asynchronous generator which yields the same pages as
+        ``pages()``. Asynchronous iteration on a paginator is equivalent to
+        iterating on ``apages()``.
+
+        Pages are fetched in a background thread, up to ``prefetch`` pages ahead of
+        the caller, so that the event loop is never blocked on a request.
+
+        :param prefetch: The maximum number of pages to fetch ahead of the caller
+        :type prefetch: int
+        """
+        loop = asyncio.get_running_loop()
+        results: asyncio.Queue[_PrefetchMessage] = asyncio.Queue()
+
+        def deliver(message: _PrefetchMessage) -> None:
+            loop.call_soon_threadsafe(results.put_nowait, message)
+
+        self._caller_state = self._get_state()
+        prefetcher = _PagePrefetcher(self._pages_with_state(), prefetch, deliver)
+        prefetcher.start()
+        try:
+            while True:
+                kind, value = await results.get()
+                if kind != "page":
+                    # the caller has every page, so it is at the fetch position
+                    self._caller_state = None
+                    if kind == "error":
+                        raise value
+                    return
+                prefetcher.release()
+                page, self._caller_state = value
+                yield page
+        finally:
+            prefetcher.stop()
+
+    async def aitems(self, *, prefetch: int = 1) -> t.AsyncIterator[t.Any]:
+        """
+        ``aitems()`` is the equivalent of ``items()`` for ``apages()``.
+
+        :param prefetch: The maximum number of pages to fetch ahead of the caller
+        :type prefetch: int
+        """
+        if self.items_key is None:
+            raise ValueError(
+                "Cannot provide items() iteration on a paginator where 'items_key' "
+                "is not set."
+            )
+        async for page in self.apages(prefetch=prefetch):
+            for item in page[self.items_key]:
+                yield item
+
     @classmethod
     def wrap(cls, method: t.Callable[P, R]) -> t.Callable[P, Paginator[R]]:
         """
@@ -137,6 +351,82 @@ class Paginator(t.Iterable[PageT], metaclass=abc.ABCMeta):
         return t.cast(t.Callable[P, Paginator[R]], paginated_method)
 
 
+def _to_serializable(value: t.Any) -> t.Any:
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    elif isinstance(value, collections.abc.Mapping):
+        return {k: _to_serializable(v) for k, v in value.items()}
+    elif isinstance(value, (list, tuple)):
+        return [_to_serializable(v) for v in value]
+    return value
+
+
+class _PagePrefetcher:
+    """
+    Consume an iterator of pages in a background thread, passing each page to a
+    ``deliver`` callback. At most ``depth`` pages may be delivered and not yet released
+    by the consumer at any time.
+
+    The final message delivered is always either ``("done", None)`` or
+    ``("error", exception)``.
+    """
+
+    def __init__(
+        self,
+        pages: t.Iterator[t.Any],
+        depth: int,
+        deliver: t.Callable[[_PrefetchMessage], None],
+    ) -> None:
+        if depth < 1:
+            raise ValueError("Cannot prefetch fewer than one page.")
+        self._pages = pages
+        self._deliver = deliver
+        self._slots = threading.Semaphore(depth)
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def release(self) -> None:
+        """Mark a delivered page as taken by the consumer."""
+        self._slots.release()
+
+    def stop(self) -> None:
+        """Stop fetching pages. Any page currently being fetched is discarded."""
+        self._stopped.set()
+
+    def _acquire_slot(self) -> bool:
+        # poll so that a stopped prefetcher does not wait forever
+        while not self._stopped.is_set():
+            if self._slots.acquire(timeout=0.1):
+                return True
+        return False
+
+    def _run(self) -> None:
+        message: _PrefetchMessage
+        try:
+            while self._acquire_slot():
+                try:
+                    page = next(self._pages)
+                except StopIteration:
+                    message = ("done", None)
+                    break
+                if self._stopped.is_set():
+                    return
+                self._deliver(("page", page))
+            else:
+                return
+        except Exception as err:  # pylint: disable=broad-except
+            message = ("error", err)
+
+        if not self._stopped.is_set():
+            try:
+                self._deliver(message)
+            except RuntimeError:  # the consumer's event loop may already be closed
+                pass
+
+
 def has_paginator(
     paginator_class: type[Paginator[PageT]],
     items_key: str | None = None,
@@ -22,12 +22,20 @@ class LastKeyPaginator(Paginator[PageT]):
         )
         self.last_key: str | None = None
 
+    def _get_cursor(self) -> dict[str, t.Any]:
+        return {**super()._get_cursor(), "last_key": self.last_key}
+
+    def _set_cursor(self, cursor: dict[str, t.Any]) -> None:
+        super()._set_cursor(cursor)
+        self.last_key = cursor["last_key"]
+        if self.last_key:
+            self.client_kwargs["last_key"] = self.last_key
+
     def pages(self) -> t.Iterator[PageT]:
-        has_next_page = True
-        while has_next_page:
+        while not self._exhausted:
             if self.last_key:
                 self.client_kwargs["last_key"] = self.last_key
             current_page = self.method(*self.client_args, **self.client_kwargs)
-            yield current_page
             self.last_key = current_page.get("last_key")
-            has_next_page = current_page["has_next_page"]
+            self._exhausted = not current_page["has_next_page"]
+            yield current_page
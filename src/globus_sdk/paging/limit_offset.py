@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import abc
+import collections
+import concurrent.futures
 import typing as t
 
 from .base import PageT, Paginator
 
 
-class _LimitOffsetBasedPaginator(Paginator[PageT]):  # pylint: disable=abstract-method
+class _LimitOffsetBasedPaginator(Paginator[PageT]):
     def __init__(
         self,
         method: t.Callable[..., t.Any],
@@ -25,6 +28,7 @@ class _LimitOffsetBasedPaginator(Paginator[PageT]):  # pylint: disable=abstract-
         )
         self.get_page_size = get_page_size
         self.max_total_results = max_total_results
+        self.page_size = page_size
         self.limit = page_size
         self.offset = 0
 
@@ -43,26 +47,147 @@ class _LimitOffsetBasedPaginator(Paginator[PageT]):  # pylint: disable=abstract-
             self.max_total_results is not None and self.offset >= self.max_total_results
         )
 
+    def _get_cursor(self) -> dict[str, t.Any]:
+        return {**super()._get_cursor(), "offset": self.offset, "limit": self.limit}
+
+    def _set_cursor(self, cursor: dict[str, t.Any]) -> None:
+        super()._set_cursor(cursor)
+        self.offset = cursor["offset"]
+        self.limit = cursor["limit"]
+        self.client_kwargs["offset"] = self.offset
+        self.client_kwargs["limit"] = self.limit
+
+    @abc.abstractmethod
+    def _check_has_next_page(self, page: dict[str, t.Any]) -> bool:
+        """Check whether there is a page after ``page``."""
 
-class HasNextPaginator(_LimitOffsetBasedPaginator[PageT]):
     def pages(self) -> t.Iterator[PageT]:
-        has_next_page = True
-        while has_next_page:
+        while not self._exhausted:
             self._update_limit()
             current_page = self.method(*self.client_args, **self.client_kwargs)
+            self._exhausted = self._update_and_check_offset(
+                current_page
+            ) or not self._check_has_next_page(current_page)
             yield current_page
-            if self._update_and_check_offset(current_page):
-                return
-            has_next_page = current_page["has_next_page"]
+
+    def _get_result_bound(  # pylint: disable=unused-argument
+        self, page: dict[str, t.Any] | None
+    ) -> int | None:
+        """
+        Get the offset at which results end, if known.
+
+        :param page: The most recently received page, or None before the first page
+            has been received
+        """
+        return self.max_total_results
+
+    def parallel_pages(self, concurrency: int = 4) -> t.Iterator[PageT]:
+        """
+        ``parallel_pages()`` yields the same pages as ``pages()``, in the same order,
+        but requests up to ``concurrency`` pages at once on a thread pool.
+
+        Because every page but the last is expected to be full, the offsets of the
+        pages which follow can be computed in advance. If a short page is received
+        before the end of the results, any pages requested at the computed offsets
+        are discarded and fetching resumes from the correct offset.
+
+        :param concurrency: The maximum number of requests in flight at any time
+        :type concurrency: int
+        """
+        if concurrency < 1:
+            raise ValueError("Cannot fetch pages with a concurrency of less than one.")
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=concurrency)
+        # (offset, limit, future) for each requested page, in offset order
+        pending: collections.deque[
+            tuple[int, int, concurrent.futures.Future[t.Any]]
+        ] = collections.deque()
+        next_offset = self.offset
+        bound = self._get_result_bound(None)
+
+        def fill_window() -> None:
+            nonlocal next_offset
+            while len(pending) < concurrency:
+                # if the end of the results is not known yet, only one page may be
+                # requested at a time
+                if bound is None and pending:
+                    return
+                if bound is not None and next_offset >= bound:
+                    return
+                limit = self.page_size
+                if bound is not None:
+                    limit = min(limit, bound - next_offset)
+                kwargs = {**self.client_kwargs, "offset": next_offset, "limit": limit}
+                future = executor.submit(self.method, *self.client_args, **kwargs)
+                pending.append((next_offset, limit, future))
+                next_offset += limit
+
+        def discard_pending() -> None:
+            for _offset, _limit, future in pending:
+                future.cancel()
+            pending.clear()
+
+        try:
+            if not self._exhausted:
+                fill_window()
+            while pending:
+                offset, limit, future = pending.popleft()
+                current_page = future.result()
+
+                # record state exactly as serial iteration would
+                self.limit = limit
+                self.client_kwargs["limit"] = limit
+                page_size = self.get_page_size(current_page)
+                self.offset = offset + page_size
+                self.client_kwargs["offset"] = self.offset
+
+                bound = self._get_result_bound(current_page)
+                if (
+                    page_size == 0
+                    or (bound is not None and self.offset >= bound)
+                    or not self._check_has_next_page(current_page)
+                ):
+                    self._exhausted = True
+                    discard_pending()
+                    yield current_page
+                    return
+
+                if page_size != limit:
+                    discard_pending()
+                    next_offset = self.offset
+                fill_window()
+                yield current_page
+        finally:
+            discard_pending()
+            executor.shutdown(wait=False)
+
+    def parallel_items(self, concurrency: int = 4) -> t.Iterator[t.Any]:
+        """
+        ``parallel_items()`` is the equivalent of ``items()`` for
+        ``parallel_pages()``.
+
+        :param concurrency: The maximum number of requests in flight at any time
+        :type concurrency: int
+        """
+        if self.items_key is None:
+            raise ValueError(
+                "Cannot provide items() iteration on a paginator where 'items_key' "
+                "is not set."
+            )
+        for page in self.parallel_pages(concurrency):
+            yield from page[self.items_key]
+
+
+class HasNextPaginator(_LimitOffsetBasedPaginator[PageT]):
+    def _check_has_next_page(self, page: dict[str, t.Any]) -> bool:
+        return bool(page["has_next_page"])
 
 
 class LimitOffsetTotalPaginator(_LimitOffsetBasedPaginator[PageT]):
-    def pages(self) -> t.Iterator[PageT]:
-        has_next_page = True
-        while has_next_page:
-            self._update_limit()
-            current_page = self.method(*self.client_args, **self.client_kwargs)
-            yield current_page
-            if self._update_and_check_offset(current_page):
-                return
-            has_next_page = self.offset < current_page["total"]
+    def _check_has_next_page(self, page: dict[str, t.Any]) -> bool:
+        return bool(self.offset < page["total"])
+
+    def _get_result_bound(self, page: dict[str, t.Any] | None) -> int | None:
+        if page is None:
+            return None
+        return min(int(page["total"]), self.max_total_results)
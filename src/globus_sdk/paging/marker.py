@@ -34,15 +34,23 @@ class MarkerPaginator(Paginator[PageT]):
     def _check_has_next_page(self, page: dict[str, t.Any]) -> bool:
         return bool(page.get("has_next_page", False))
 
+    def _get_cursor(self) -> dict[str, t.Any]:
+        return {**super()._get_cursor(), "marker": self.marker}
+
+    def _set_cursor(self, cursor: dict[str, t.Any]) -> None:
+        super()._set_cursor(cursor)
+        self.marker = cursor["marker"]
+        if self.marker:
+            self.client_kwargs["marker"] = self.marker
+
     def pages(self) -> t.Iterator[PageT]:
-        has_next_page = True
-        while has_next_page:
+        while not self._exhausted:
             if self.marker:
                 self.client_kwargs["marker"] = self.marker
             current_page = self.method(*self.client_args, **self.client_kwargs)
-            yield current_page
             self.marker = current_page.get(self.marker_key)
-            has_next_page = self._check_has_next_page(current_page)
+            self._exhausted = not self._check_has_next_page(current_page)
+            yield current_page
 
 
 class NullableMarkerPaginator(MarkerPaginator[PageT]):
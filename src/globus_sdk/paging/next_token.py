@@ -30,12 +30,20 @@ class NextTokenPaginator(Paginator[PageT]):
         )
         self.next_token: str | None = None
 
+    def _get_cursor(self) -> dict[str, t.Any]:
+        return {**super()._get_cursor(), "next_token": self.next_token}
+
+    def _set_cursor(self, cursor: dict[str, t.Any]) -> None:
+        super()._set_cursor(cursor)
+        self.next_token = cursor["next_token"]
+        if self.next_token:
+            self.client_kwargs["next_token"] = self.next_token
+
     def pages(self) -> t.Iterator[PageT]:
-        has_next_page = True
-        while has_next_page:
+        while not self._exhausted:
             if self.next_token:
                 self.client_kwargs["next_token"] = self.next_token
             current_page = self.method(*self.client_args, **self.client_kwargs)
-            yield current_page
             self.next_token = current_page.get("next_token")
-            has_next_page = current_page.get("next_token") is not None
+            self._exhausted = self.next_token is None
+            yield current_page
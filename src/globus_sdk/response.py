@@ -7,13 +7,18 @@ import typing as t
 
 from requests import Response
 
-from globus_sdk import _guards
+from globus_sdk import _guards, _json
 
 log = logging.getLogger(__name__)
 
 if t.TYPE_CHECKING:
     import globus_sdk
 
+# a sentinel for response data which has not been parsed yet
+_UNPARSED = object()
+# the size of the chunks read when iterating over a streamed response
+_STREAM_CHUNK_SIZE = 64 * 1024
+
 
 class GlobusHTTPResponse:
     """
@@ -30,6 +35,10 @@ class GlobusHTTPResponse:
     If the response data is not a dictionary or list, item access will raise
     ``TypeError``.
 
+    The response body is parsed the first time that the data is accessed, and the
+    result is reused thereafter. Responses which wrap other responses share the
+    parsed data of the response they wrap.
+
     >>> print("Response ID": r["id"]) # alias for r.data["id"]
 
     :ivar client: The client instance which made the request
@@ -49,9 +58,6 @@ class GlobusHTTPResponse:
             self._response: Response | None = None
             self.client: globus_sdk.BaseClient = self._wrapped.client
 
-            # copy parsed JSON data off of '_wrapped'
-            self._parsed_json: t.Any = self._wrapped._parsed_json
-
         # init on a Response object, this is the "normal" case
         # _wrapped is None
         else:
@@ -61,18 +67,52 @@ class GlobusHTTPResponse:
             self._response = response
             self.client = client
 
-            # JSON decoding may raise a ValueError due to an invalid JSON
-            # document. In the case of trying to fetch the "data" on an HTTP
-            # response, this means we didn't get a JSON response.
-            # store this as None, as in "no data"
-            #
-            # if the caller *really* wants the raw body of the response, they can
-            # always use `text`
-            try:
-                self._parsed_json = self._response.json()
-            except ValueError:
-                log.warning("response data did not parse as JSON, data=None")
-                self._parsed_json = None
+        # parsing is deferred until the data is first used
+        self._cached_parsed_json: t.Any = _UNPARSED
+
+    @property
+    def _parsed_json(self) -> t.Any:
+        # wrapped responses defer to the innermost response, so that a body is only
+        # ever parsed once
+        if self._wrapped is not None:
+            return self._wrapped._parsed_json
+        if self._cached_parsed_json is _UNPARSED:
+            self._cached_parsed_json = self._parse_json()
+        return self._cached_parsed_json
+
+    @_parsed_json.setter
+    def _parsed_json(self, value: t.Any) -> None:
+        if self._wrapped is not None:
+            self._wrapped._parsed_json = value
+        else:
+            self._cached_parsed_json = value
+
+    @property
+    def _is_unread_stream(self) -> bool:
+        # true for a response which was requested with `stream=True` and whose body
+        # has not been read or parsed yet
+        if self._wrapped is not None:
+            return self._wrapped._is_unread_stream
+        return (
+            self._cached_parsed_json is _UNPARSED
+            and self._response is not None
+            and self._response.raw is not None
+            and not getattr(self._response, "_content_consumed", True)
+        )
+
+    def _parse_json(self) -> t.Any:
+        # JSON decoding may raise a ValueError due to an invalid JSON
+        # document. In the case of trying to fetch the "data" on an HTTP
+        # response, this means we didn't get a JSON response.
+        # store this as None, as in "no data"
+        #
+        # if the caller *really* wants the raw body of the response, they can
+        # always use `text`
+        try:
+            return _json.get_json_codec().decode_response(self._raw_response)
+        except ValueError:
+            log.warning("response data did not parse as JSON, data=None")
+            return None
 
     @property
     def _raw_response(self) -> Response:
@@ -193,7 +233,13 @@ class GlobusHTTPResponse:
 
 class IterableResponse(GlobusHTTPResponse):
     """This response class adds an __iter__ method on an 'iter_key' variable.
-    The assumption is that iter produces dicts or dict-like mappings."""
+    The assumption is that iter produces dicts or dict-like mappings.
+
+    If the request was sent with ``stream=True`` and the data has not been accessed,
+    iteration decodes the items incrementally as the body is downloaded, so that the
+    whole response is never held in memory. Such a response can only be iterated
+    once. Afterwards, ``data`` contains the other fields of the response, without
+    the items."""
 
     default_iter_key: t.ClassVar[str]
     iter_key: str
@@ -215,6 +261,8 @@ class IterableResponse(GlobusHTTPResponse):
         super().__init__(response, client)
 
     def __iter__(self) -> t.Iterator[t.Mapping[t.Any, t.Any]]:
+        if self._is_unread_stream:
+            return self._iter_stream()
         if not isinstance(self.data, dict):
             raise TypeError(
                 "Cannot iterate on IterableResponse data when "
@@ -222,6 +270,17 @@ class IterableResponse(GlobusHTTPResponse):
             )
         return iter(self.data[self.iter_key])
 
+    def _iter_stream(self) -> t.Iterator[t.Mapping[t.Any, t.Any]]:
+        fields: dict[str, t.Any] = {}
+        try:
+            yield from _json.iter_json_array(
+                self._raw_response.iter_content(chunk_size=_STREAM_CHUNK_SIZE),
+                self.iter_key,
+                fields,
+            )
+        finally:
+            self._parsed_json = fields
+
 
 class ArrayResponse(GlobusHTTPResponse):
     """This response class adds an ``__iter__`` method which assumes that the top-level
@@ -9,7 +9,9 @@ from .flow_managers import (
     GlobusAuthorizationCodeFlowManager,
     GlobusNativeAppFlowManager,
 )
+from .identity_cache import IdentityCache, SQLiteIdentityCache, TTLIdentityCache
 from .identity_map import IdentityMap
+from .oidc_cache import OIDCMetadataCache
 from .response import (
     GetIdentitiesResponse,
     OAuthDependentTokenResponse,
@@ -26,6 +28,10 @@ __all__ = (
     "AuthAPIError",
     # high-level helpers
     "IdentityMap",
+    "IdentityCache",
+    "TTLIdentityCache",
+    "SQLiteIdentityCache",
+    "OIDCMetadataCache",
     # flow managers
     "GlobusNativeAppFlowManager",
     "GlobusAuthorizationCodeFlowManager",
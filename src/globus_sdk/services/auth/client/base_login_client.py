@@ -15,6 +15,7 @@ from globus_sdk.scopes import AuthScopes
 from .._common import get_jwk_data, pem_decode_jwk_data
 from ..errors import AuthAPIError
 from ..flow_managers import GlobusOAuthFlowManager
+from ..oidc_cache import OIDCMetadataCache
 from ..response import OAuthTokenResponse
 
 if sys.version_info >= (3, 8):
@@ -67,6 +68,10 @@ class AuthLoginClient(client.BaseClient):
         # encapsulate the functionality of various different types of flow
         # managers
         self.current_oauth2_flow_manager: GlobusOAuthFlowManager | None = None
+        #: The cache of OIDC configuration and keys used when decoding ID tokens.
+        #: Assign the same cache to several clients to share it, or ``None`` to
+        #: fetch the configuration and keys for every token.
+        self.oidc_metadata_cache: OIDCMetadataCache | None = OIDCMetadataCache()
 
         log.info(
             "Finished initializing AuthLoginClient. "
@@ -14,6 +14,7 @@ from globus_sdk.scopes import AuthScopes
 
 from .._common import get_jwk_data, pem_decode_jwk_data
 from ..errors import AuthAPIError
+from ..oidc_cache import OIDCMetadataCache
 from ..response import (
     GetIdentitiesResponse,
     GetIdentityProvidersResponse,
@@ -72,6 +73,10 @@ class AuthClient(client.BaseClient):
             app_name=app_name,
             transport_params=transport_params,
         )
+        #: The cache of OIDC configuration and keys used when decoding ID tokens.
+        #: Assign the same cache to several clients to share it, or ``None`` to
+        #: fetch the configuration and keys for every token.
+        self.oidc_metadata_cache: OIDCMetadataCache | None = OIDCMetadataCache()
 
         self._client_id = str(client_id) if client_id is not None else None
         if client_id is not None:
@@ -0,0 +1,398 @@
+"""
+Caches for the identity records looked up by an ``IdentityMap``.
+"""
+from __future__ import annotations
+
+import abc
+import collections
+import json
+import os
+import pathlib
+import sqlite3
+import threading
+import time
+import typing as t
+
+
+class IdentityCache(t.MutableMapping[str, t.Any]):
+    """
+    The base class for caches which can be passed to an ``IdentityMap``.
+
+    An ``IdentityCache`` is a mapping from usernames and IDs to identity records,
+    which can also record that a username or ID was not found in Globus Auth. Such a
+    "negative" entry is ``in`` the cache, so that the ``IdentityMap`` does not look
+    it up again, but reading it raises a ``KeyError``, as for an identity which is
+    not found.
+    """
+
+    def store_identities(self, identities: t.Iterable[dict[str, t.Any]]) -> None:
+        """
+        Store identity records under their IDs and usernames.
+
+        :param identities: The identity records to store
+        :type identities: iterable of dict
+        """
+        for identity in identities:
+            self[identity["id"]] = identity
+            self[identity["username"]] = identity
+
+    @abc.abstractmethod
+    def mark_missing(self, *keys: str) -> None:
+        """
+        Record that usernames or IDs were looked up and not found.
+
+        :param keys: The usernames or IDs which were not found
+        :type keys: str
+        """
+
+    @abc.abstractmethod
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get counters describing the use of the cache, for monitoring.
+        """
+
+
+class _Entry(t.NamedTuple):
+    expires_at: float
+    value: t.Any
+    missing: bool
+
+
+class TTLIdentityCache(IdentityCache):
+    """
+    An in-memory ``IdentityCache`` with a bounded size, in which entries expire.
+
+    Identity records expire ``ttl`` seconds after they are stored, and records of
+    usernames and IDs which were not found expire after ``negative_ttl`` seconds.
+    When more than ``maxsize`` entries are stored, the least recently used entry is
+    evicted. An identity is usually stored under both its ID and its username, and
+    each counts as an entry.
+
+    The cache may be shared by ``IdentityMap`` objects in several threads.
+
+    :param maxsize: The maximum number of entries to store
+    :type maxsize: int
+    :param ttl: The number of seconds for which an identity record is kept
+    :type ttl: float
+    :param negative_ttl: The number of seconds for which a username or ID which was
+        not found is remembered. Set to ``0`` to disable negative caching
+    :type negative_ttl: float
+    """
+
+    def __init__(
+        self, maxsize: int = 10000, ttl: float = 3600, negative_ttl: float = 300
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("TTLIdentityCache maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._entries: collections.OrderedDict[str, _Entry] = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._negative_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _live_entry(self, key: str, now: float) -> _Entry | None:
+        # must be called with the lock held
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= now:
+            del self._entries[key]
+            return None
+        return entry
+
+    def _store(self, key: str, entry: _Entry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def __getitem__(self, key: str) -> t.Any:
+        with self._lock:
+            entry = self._live_entry(key, time.time())
+            if entry is None:
+                self._misses += 1
+                raise KeyError(key)
+            self._entries.move_to_end(key)
+            if entry.missing:
+                self._negative_hits += 1
+                raise KeyError(key)
+            self._hits += 1
+            return entry.value
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        with self._lock:
+            return self._live_entry(key, time.time()) is not None
+
+    def __setitem__(self, key: str, value: t.Any) -> None:
+        self._store(key, _Entry(time.time() + self.ttl, value, False))
+
+    def mark_missing(self, *keys: str) -> None:
+        if self.negative_ttl > 0:
+            for key in keys:
+                self._store(key, _Entry(time.time() + self.negative_ttl, None, True))
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            del self._entries[key]
+
+    def _live_keys(self) -> list[str]:
+        now = time.time()
+        with self._lock:
+            return [
+                key
+                for key, entry in self._entries.items()
+                if entry.expires_at > now and not entry.missing
+            ]
+
+    def __iter__(self) -> t.Iterator[str]:
+        return iter(self._live_keys())
+
+    def __len__(self) -> int:
+        return len(self._live_keys())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get counters describing the use of the cache, for monitoring. The result is
+        a dict with the following keys:
+
+        - ``hits``: lookups which found an identity record
+        - ``negative_hits``: lookups which found that a username or ID does not exist
+        - ``misses``: lookups which found nothing, and so required a call to Auth
+        - ``evictions``: entries removed to keep the cache within ``maxsize``
+        - ``size``: the number of entries stored, including expired entries which
+          have not been removed yet
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "negative_hits": self._negative_hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "size": len(self._entries),
+            }
+
+
+class SQLiteIdentityCache(IdentityCache):
+    """
+    An ``IdentityCache`` which stores identity records in an SQLite database, so
+    that they are kept across restarts and shared by every process which uses the
+    same file.
+
+    Each identity is stored once, and can be looked up by ID or by username.
+    Identity records expire ``ttl`` seconds after they are stored, and records of
+    usernames and IDs which were not found expire after ``negative_ttl`` seconds.
+    Expired records are removed when the cache is opened.
+
+    The database uses write-ahead logging, so that many processes can read from it
+    while another writes. Values stored in the cache must be identity records, which
+    are dicts containing ``id`` and ``username``. Hit and miss counters are kept
+    separately by each cache object.
+
+    :param dbname: The path to the database file, which is created if it does not
+        exist
+    :type dbname: str or pathlib.Path
+    :param ttl: The number of seconds for which an identity record is kept
+    :type ttl: float
+    :param negative_ttl: The number of seconds for which a username or ID which was
+        not found is remembered. Set to ``0`` to disable negative caching
+    :type negative_ttl: float
+    :param timeout: The number of seconds to wait for another process to release the
+        database
+    :type timeout: float
+    """
+
+    def __init__(
+        self,
+        dbname: str | pathlib.Path,
+        *,
+        ttl: float = 86400,
+        negative_ttl: float = 300,
+        timeout: float = 10,
+    ) -> None:
+        self.dbname = os.fspath(dbname)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._negative_hits = 0
+        self._misses = 0
+        self._connection = sqlite3.connect(
+            self.dbname, timeout=timeout, check_same_thread=False
+        )
+        if self.dbname != ":memory:":
+            self._connection.execute("PRAGMA journal_mode=WAL")
+        with self._connection:
+            self._connection.executescript(
+                """
+CREATE TABLE IF NOT EXISTS identities (
+    id VARCHAR NOT NULL PRIMARY KEY,
+    username VARCHAR NOT NULL,
+    identity_json VARCHAR NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS identities_username ON identities (username);
+CREATE TABLE IF NOT EXISTS missing_identities (
+    key VARCHAR NOT NULL PRIMARY KEY,
+    expires_at REAL NOT NULL
+);
+"""
+            )
+        self.purge_expired()
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+        self._connection.close()
+
+    def purge_expired(self) -> None:
+        """
+        Remove expired records from the database.
+        """
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM identities WHERE expires_at <= ?", (now,)
+            )
+            self._connection.execute(
+                "DELETE FROM missing_identities WHERE expires_at <= ?", (now,)
+            )
+
+    def _lookup(self, key: str) -> tuple[bool, t.Any]:
+        # get (found, identity) for a key, where a found key with no identity has a
+        # negative entry; must be called with the lock held
+        now = time.time()
+        row = self._connection.execute(
+            "SELECT identity_json FROM identities "
+            "WHERE (id = ? OR username = ?) AND expires_at > ?",
+            (key, key, now),
+        ).fetchone()
+        if row is not None:
+            return True, json.loads(row[0])
+        row = self._connection.execute(
+            "SELECT 1 FROM missing_identities WHERE key = ? AND expires_at > ?",
+            (key, now),
+        ).fetchone()
+        return row is not None, None
+
+    def __getitem__(self, key: str) -> t.Any:
+        with self._lock:
+            found, identity = self._lookup(key)
+            if not found:
+                self._misses += 1
+                raise KeyError(key)
+            if identity is None:
+                self._negative_hits += 1
+                raise KeyError(key)
+            self._hits += 1
+            return identity
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        with self._lock:
+            return self._lookup(key)[0]
+
+    def __setitem__(self, key: str, value: t.Any) -> None:
+        if not (
+            isinstance(value, dict)
+            and "id" in value
+            and "username" in value
+            and key in (value["id"], value["username"])
+        ):
+            raise ValueError(
+                "SQLiteIdentityCache values must be identity records, stored under "
+                "their 'id' or 'username'"
+            )
+        self.store_identities([value])
+
+    def store_identities(self, identities: t.Iterable[dict[str, t.Any]]) -> None:
+        expires_at = time.time() + self.ttl
+        rows = [(x["id"], x["username"], json.dumps(x), expires_at) for x in identities]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "REPLACE INTO identities (id, username, identity_json, expires_at) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._connection.executemany(
+                "DELETE FROM missing_identities WHERE key IN (?, ?)",
+                [row[:2] for row in rows],
+            )
+
+    def mark_missing(self, *keys: str) -> None:
+        if self.negative_ttl <= 0 or not keys:
+            return
+        expires_at = time.time() + self.negative_ttl
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "REPLACE INTO missing_identities (key, expires_at) VALUES (?, ?)",
+                [(key, expires_at) for key in keys],
+            )
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock, self._connection:
+            deleted = self._connection.execute(
+                "DELETE FROM identities WHERE id = ? OR username = ?", (key, key)
+            ).rowcount
+            deleted += self._connection.execute(
+                "DELETE FROM missing_identities WHERE key = ?", (key,)
+            ).rowcount
+        if not deleted:
+            raise KeyError(key)
+
+    def __iter__(self) -> t.Iterator[str]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id, username FROM identities WHERE expires_at > ?",
+                (time.time(),),
+            ).fetchall()
+        for identity_id, username in rows:
+            yield identity_id
+            yield username
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM identities WHERE expires_at > ?",
+                (time.time(),),
+            ).fetchone()
+        # each identity is stored under its ID and its username
+        return int(count) * 2
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM identities")
+            self._connection.execute("DELETE FROM missing_identities")
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get counters describing the use of the cache by this object, for monitoring.
+        The result is a dict with the following keys:
+
+        - ``hits``: lookups which found an identity record
+        - ``negative_hits``: lookups which found that a username or ID does not exist
+        - ``misses``: lookups which found nothing, and so required a call to Auth
+        - ``size``: the number of identities stored in the database, including
+          expired records which have not been removed yet
+        """
+        with self._lock:
+            (size,) = self._connection.execute(
+                "SELECT COUNT(*) FROM identities"
+            ).fetchone()
+            return {
+                "hits": self._hits,
+                "negative_hits": self._negative_hits,
+                "misses": self._misses,
+                "size": int(size),
+            }
@@ -4,6 +4,8 @@ import typing as t
 import uuid
 
 from .client import AuthClient
+from .identity_cache import IdentityCache
+from .response import GetIdentitiesResponse
 
 
 def is_username(val: str) -> bool:
@@ -69,6 +71,10 @@ class IdentityMap:
     map, it will be immediately added. But adding many identities beforehand will
     improve performance.
 
+    Lookups fetch one batch at a time, as they are needed. When many identities have
+    been added, :py:meth:`~IdentityMap.resolve_all` fetches all of the batches up
+    front, several at once.
+
     The ``IdentityMap`` will cache its results so that repeated lookups of the same Identity
     will not repeat work. It will also map identities both by ID and by Username,
     regardless of how they're initially looked up.
@@ -125,6 +131,8 @@ class IdentityMap:
     :param cache:  A dict or other mapping object which will be used to cache results.
         The default is that results are cached once per IdentityMap object. If you want
         multiple IdentityMaps to share data, explicitly pass the same ``cache`` to both.
+        A :class:`TTLIdentityCache` bounds the size of the cache, expires entries, and
+        remembers usernames and IDs which were not found.
     :type cache: MutableMapping, optional
 
     .. automethodlist:: globus_sdk.IdentityMap
@@ -184,24 +192,81 @@ class IdentityMap:
 
         return batch
 
-    def _fetch_batch_including(self, key: str) -> None:
+    def _fetch_batch_including(self, key: str) -> dict[str, t.Any]:
         """
         Batch resolve identifiers (usernames or IDs), being sure to include the desired,
         named key. The key also determines which kind of batch will be built --
         usernames or IDs.
 
-        Store the results in the internal cache.
+        Store the results in the internal cache, and return them by ID and username.
         """
         batch = self._create_batch(key)
-
-        if is_username(key):
-            response = self.auth_client.get_identities(usernames=batch)
+        return self._store_identities(batch, self._fetch_batch(is_username(key), batch))
+
+    def _fetch_batch(self, usernames: bool, batch: set[str]) -> GetIdentitiesResponse:
+        if usernames:
+            return self.auth_client.get_identities(usernames=batch)
+        return self.auth_client.get_identities(ids=batch)
+
+    def _store_identities(
+        self, batch: set[str], response: GetIdentitiesResponse
+    ) -> dict[str, t.Any]:
+        identities = response["identities"]
+        found: dict[str, t.Any] = {}
+        for x in identities:
+            found[x["id"]] = found[x["username"]] = x
+        if isinstance(self._cache, IdentityCache):
+            self._cache.store_identities(identities)
+            self._cache.mark_missing(*(batch - found.keys()))
         else:
-            response = self.auth_client.get_identities(ids=batch)
+            self._cache.update(found)
+        return found
 
-        for x in response["identities"]:
-            self._cache[x["id"]] = x
-            self._cache[x["username"]] = x
+    def resolve_all(self, *, concurrency: int = 4) -> None:
+        """
+        Look up all of the unresolved usernames and IDs now, rather than as they are
+        accessed. They are split into batches of ``id_batch_size``, and up to
+        ``concurrency`` batches are fetched at once. The results are stored in the
+        cache, so that subsequent lookups do not call Globus Auth.
+
+        If a batch cannot be fetched, its usernames and IDs remain unresolved, and
+        the first error is raised after the other batches have been fetched.
+
+        :param concurrency: The maximum number of batches to fetch at once
+        :type concurrency: int
+        """
+        batches: list[tuple[bool, set[str]]] = []
+        for usernames, unresolved in (
+            (False, self.unresolved_ids),
+            (True, self.unresolved_usernames),
+        ):
+            # values may already have been looked up if the cache is shared
+            values = [value for value in unresolved if value not in self._cache]
+            unresolved.clear()
+            for start in range(0, len(values), self.id_batch_size):
+                batch = set(values[start : start + self.id_batch_size])
+                batches.append((usernames, batch))
+
+        error: Exception | None = None
+        # results are stored as they arrive on this thread, so the cache is never
+        # written to concurrently
+        for result in self.auth_client.map(
+            lambda item: self._fetch_batch(*item),
+            batches,
+            concurrency=concurrency,
+            ordered=False,
+        ):
+            if result.exception is not None:
+                usernames, batch = result.item
+                if usernames:
+                    self.unresolved_usernames.update(batch)
+                else:
+                    self.unresolved_ids.update(batch)
+                error = error or result.exception
+            else:
+                self._store_identities(result.item[1], result.result)
+        if error is not None:
+            raise error
 
     def add(self, identity_id: str) -> bool:
         """
@@ -245,9 +310,14 @@ class IdentityMap:
         """
         ``IdentityMap`` supports dict-like lookups with ``map[key]``
         """
-        if key not in self._cache:
-            self._fetch_batch_including(key)
-        return self._cache[key]
+        try:
+            return self._cache[key]
+        except KeyError:
+            # an IdentityCache may record that the key was already looked up and
+            # not found
+            if key in self._cache:
+                raise
+        return self._fetch_batch_including(key)[key]
 
     def __delitem__(self, key: str) -> None:
         """
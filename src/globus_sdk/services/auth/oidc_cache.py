@@ -0,0 +1,159 @@
+"""
+A cache for the OIDC configuration and signing keys used to decode ID tokens.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+import typing as t
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey
+
+from globus_sdk.response import GlobusHTTPResponse
+
+from ._common import SupportsJWKMethods, pem_decode_jwk_data
+
+log = logging.getLogger(__name__)
+
+
+class OIDCMetadataCache:
+    """
+    A cache of OIDC configuration documents and decoded signing keys, used by
+    :meth:`OAuthTokenResponse.decode_id_token
+    <globus_sdk.OAuthTokenResponse.decode_id_token>`.
+
+    Each ``AuthLoginClient`` and ``AuthClient`` has its own cache, as its
+    ``oidc_metadata_cache`` attribute. A cache may be shared by several clients, by
+    assigning it to each of them, and setting the attribute to ``None`` disables
+    caching for a client.
+
+    OIDC configuration is stored by the base URL of the client, and so by
+    environment. Keys are stored by ``jwks_uri`` and key ID. Entries are reused for
+    ``ttl`` seconds. When a token is signed with a key ID which is not in the cache,
+    the keys are fetched again, at most once every ``min_refresh_interval`` seconds,
+    so that key rotation is picked up without waiting for the TTL to expire.
+
+    :param ttl: The number of seconds for which configuration and keys are reused
+    :type ttl: float
+    :param min_refresh_interval: The minimum number of seconds between fetches of
+        the keys for an unknown key ID
+    :type min_refresh_interval: float
+    """
+
+    def __init__(self, ttl: float = 3600, min_refresh_interval: float = 30) -> None:
+        self.ttl = ttl
+        self.min_refresh_interval = min_refresh_interval
+        self._lock = threading.Lock()
+        # base_url -> (fetched_at, configuration)
+        self._configurations: dict[str, tuple[float, dict[str, t.Any]]] = {}
+        # jwks_uri -> (fetched_at, {kid: key}, default key)
+        self._keys: dict[
+            str, tuple[float, dict[str | None, RSAPublicKey], RSAPublicKey]
+        ] = {}
+
+    # the lock cannot be pickled, so that clients and token responses which hold a
+    # cache can be
+    def __getstate__(self) -> dict[str, t.Any]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, t.Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def clear(self) -> None:
+        """
+        Remove all configuration and keys from the cache.
+        """
+        with self._lock:
+            self._configurations.clear()
+            self._keys.clear()
+
+    def get_openid_configuration(self, client: SupportsJWKMethods) -> dict[str, t.Any]:
+        """
+        Get the OIDC configuration for the environment of a client, fetching it if
+        it is not cached.
+
+        :param client: The client with which to fetch the configuration
+        :type client: AuthLoginClient or AuthClient
+        """
+        key = getattr(client, "base_url", "")
+        with self._lock:
+            cached = self._configurations.get(key)
+        if cached is not None and time.time() - cached[0] < self.ttl:
+            return cached[1]
+        log.debug("OIDC config not cached or expired, fetching")
+        configuration = client.get_openid_configuration().data
+        if not isinstance(configuration, dict):
+            raise ValueError("OIDC configuration was not a dict.")
+        with self._lock:
+            self._configurations[key] = (time.time(), configuration)
+        return configuration
+
+    def get_jwk(
+        self,
+        client: SupportsJWKMethods,
+        openid_configuration: GlobusHTTPResponse | dict[str, t.Any],
+        kid: str | None,
+    ) -> RSAPublicKey:
+        """
+        Get the key with which a token was signed, fetching the keys if they are not
+        cached or do not include the key ID.
+
+        :param client: The client with which to fetch the keys
+        :type client: AuthLoginClient or AuthClient
+        :param openid_configuration: The OIDC configuration, which gives the location
+            of the keys
+        :type openid_configuration: dict or GlobusHTTPResponse
+        :param kid: The ID of the key from the header of the token, if it has one
+        :type kid: str, optional
+        :raises jwt.InvalidTokenError: if the key ID is not among the keys published
+            by Globus Auth
+        """
+        jwks_uri = openid_configuration["jwks_uri"]
+        with self._lock:
+            cached = self._keys.get(jwks_uri)
+        if cached is not None:
+            fetched_at, keys, default_key = cached
+            age = time.time() - fetched_at
+            if age < self.ttl:
+                if kid is None:
+                    return default_key
+                if kid in keys:
+                    return keys[kid]
+                if age < self.min_refresh_interval:
+                    raise _unknown_kid_error(kid, jwks_uri)
+                log.debug("unknown JWK kid=%s, refreshing keys", kid)
+
+        jwk_data = client.get_jwk(openid_configuration, as_pem=False)
+        keys, default_key = _decode_jwk_set(jwk_data)
+        with self._lock:
+            self._keys[jwks_uri] = (time.time(), keys, default_key)
+        if kid is None:
+            return default_key
+        if kid not in keys:
+            raise _unknown_kid_error(kid, jwks_uri)
+        return keys[kid]
+
+
+def _unknown_kid_error(kid: str, jwks_uri: str) -> jwt.InvalidTokenError:
+    return jwt.InvalidTokenError(
+        f"The ID token is signed with key ID '{kid}', which is not among the keys "
+        f"published at {jwks_uri}"
+    )
+
+
+def _decode_jwk_set(
+    jwk_data: dict[str, t.Any]
+) -> tuple[dict[str | None, RSAPublicKey], RSAPublicKey]:
+    keys: dict[str | None, RSAPublicKey] = {}
+    for key_data in jwk_data["keys"]:
+        keys[key_data.get("kid")] = t.cast(
+            RSAPublicKey, jwt.algorithms.RSAAlgorithm.from_jwk(json.dumps(key_data))
+        )
+    # keys without a kid are handled as pem_decode_jwk_data does, with the first key
+    return keys, pem_decode_jwk_data(jwk_data=jwk_data)
@@ -15,6 +15,9 @@ from globus_sdk.response import GlobusHTTPResponse
 
 from .._common import SupportsJWKMethods
 
+if t.TYPE_CHECKING:
+    from ..oidc_cache import OIDCMetadataCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -183,6 +186,11 @@ class OAuthTokenResponse(GlobusHTTPResponse):
 
         If you provide the `jwk`, you must also provide `openid_configuration`.
 
+        When they are not provided, the OIDC config and JWK are fetched automatically
+        and cached in the ``oidc_metadata_cache`` of the client, an
+        :class:`OIDCMetadataCache <globus_sdk.OIDCMetadataCache>`. If the ID Token is
+        signed with a key ID which is not in the cached JWK, the JWK is fetched again.
+
         :param openid_configuration: The OIDC config as a GlobusHTTPResponse or dict.
             When not provided, it will be fetched automatically.
         :type openid_configuration: dict or GlobusHTTPResponse
@@ -204,6 +212,9 @@ class OAuthTokenResponse(GlobusHTTPResponse):
         else:
             auth_client: SupportsJWKMethods = self.client
 
+        cache: OIDCMetadataCache | None = getattr(
+            auth_client, "oidc_metadata_cache", None
+        )
         jwt_params = jwt_params or {}
 
         jwt_leeway: float | datetime.timedelta = 0.5
@@ -216,16 +227,22 @@ class OAuthTokenResponse(GlobusHTTPResponse):
                 raise exc.GlobusSDKUsageError(
                     "passing jwk without openid configuration is not allowed"
                 )
-            logger.debug("No OIDC Config provided, autofetching...")
-            oidc_config: (
-                GlobusHTTPResponse | dict[str, t.Any]
-            ) = auth_client.get_openid_configuration()
+            logger.debug("No OIDC Config provided, using cached or autofetching...")
+            oidc_config: GlobusHTTPResponse | dict[str, t.Any] = (
+                cache.get_openid_configuration(auth_client)
+                if cache is not None
+                else auth_client.get_openid_configuration()
+            )
         else:
             oidc_config = openid_configuration
 
         if not jwk:
-            logger.debug("No JWK provided, autofetching + decoding...")
-            jwk = auth_client.get_jwk(openid_configuration=oidc_config, as_pem=True)
+            logger.debug("No JWK provided, using cached or autofetching + decoding...")
+            if cache is not None:
+                kid = jwt.get_unverified_header(self["id_token"]).get("kid")
+                jwk = cache.get_jwk(auth_client, oidc_config, kid)
+            else:
+                jwk = auth_client.get_jwk(openid_configuration=oidc_config, as_pem=True)
 
         logger.debug("final step: decode with JWK")
         signing_algos = oidc_config["id_token_signing_alg_values_supported"]
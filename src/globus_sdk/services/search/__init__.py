@@ -1,5 +1,12 @@
 from .client import SearchClient
 from .data import SearchQuery, SearchScrollQuery
 from .errors import SearchAPIError
+from .response import IterableSearchResponse
 
-__all__ = ("SearchClient", "SearchQuery", "SearchScrollQuery", "SearchAPIError")
+__all__ = (
+    "SearchClient",
+    "SearchQuery",
+    "SearchScrollQuery",
+    "SearchAPIError",
+    "IterableSearchResponse",
+)
@@ -10,6 +10,7 @@ from globus_sdk.scopes import SearchScopes
 
 from .data import SearchQuery, SearchScrollQuery
 from .errors import SearchAPIError
+from .response import IterableSearchResponse
 
 log = logging.getLogger(__name__)
 
@@ -279,7 +280,8 @@ class SearchClient(client.BaseClient):
         *,
         offset: int | None = None,
         limit: int | None = None,
-    ) -> response.GlobusHTTPResponse:
+        stream: bool = False,
+    ) -> IterableSearchResponse:
         """
         Execute a complex Search Query, using a query document to express filters,
         facets, sorting, field boostring, and other behaviors.
@@ -292,6 +294,9 @@ class SearchClient(client.BaseClient):
         :type offset: int, optional
         :param limit: limit the number of results (overwrites any limit in ``data``)
         :type limit: int, optional
+        :param stream: Download the results as they are iterated, decoding one result
+            at a time, rather than loading the whole response into memory at once
+        :type stream: bool, optional
 
         .. tab-set::
 
@@ -340,7 +345,9 @@ class SearchClient(client.BaseClient):
             add_kwargs["limit"] = limit
         if add_kwargs:
             data = {**data, **add_kwargs}
-        return self.post(f"v1/index/{index_id}/search", data=data)
+        return IterableSearchResponse(
+            self.post(f"v1/index/{index_id}/search", data=data, stream=stream)
+        )
 
     @paging.has_paginator(paging.MarkerPaginator, items_key="gmeta")
     def scroll(
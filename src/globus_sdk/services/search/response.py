@@ -0,0 +1,16 @@
+from globus_sdk.response import IterableResponse
+
+
+class IterableSearchResponse(IterableResponse):
+    """
+    Response class for search results. Allows top level fields to be accessed
+    normally via standard item access, and iterates over the ``gmeta`` list of
+    results:
+
+    >>> print("Total:", r["total"])
+    >>> # Equivalent to: for result in r["gmeta"]
+    >>> for result in r:
+    >>>     print(result["subject"])
+    """
+
+    default_iter_key = "gmeta"
@@ -1,6 +1,6 @@
 from .client import TransferClient
 from .data import DeleteData, TransferData
-from .errors import TransferAPIError
+from .errors import ChunkedSubmissionError, TransferAPIError
 from .response import ActivationRequirementsResponse, IterableTransferResponse
 
 __all__ = (
@@ -8,6 +8,7 @@ __all__ = (
     "TransferData",
     "DeleteData",
     "TransferAPIError",
+    "ChunkedSubmissionError",
     "ActivationRequirementsResponse",
     "IterableTransferResponse",
 )
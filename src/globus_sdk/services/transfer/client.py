@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import copy
+import itertools
 import logging
 import time
 import typing as t
@@ -10,7 +12,7 @@ from globus_sdk._types import DateLike, IntLike, UUIDLike
 from globus_sdk.scopes import TransferScopes
 
 from .data import DeleteData, TransferData
-from .errors import TransferAPIError
+from .errors import ChunkedSubmissionError, TransferAPIError
 from .response import ActivationRequirementsResponse, IterableTransferResponse
 from .transport import TransferRequestsTransport
 
@@ -1219,6 +1221,7 @@ class TransferClient(client.BaseClient):
         ) = None,
         local_user: str | None = None,
         query_params: dict[str, t.Any] | None = None,
+        stream: bool = False,
     ) -> IterableTransferResponse:
         """
         :param endpoint_id: The ID of the endpoint on which to do a dir listing
@@ -1249,6 +1252,10 @@ class TransferClient(client.BaseClient):
         :type local_user: str, optional
         :param query_params: Additional passthrough query parameters
         :type query_params: dict, optional
+        :param stream: Download the listing as it is iterated, decoding one entry at a
+            time, rather than loading the whole listing into memory at once. This
+            reduces memory use for very large directories
+        :type stream: bool, optional
 
         .. note::
 
@@ -1323,7 +1330,11 @@ class TransferClient(client.BaseClient):
 
         log.info(f"TransferClient.operation_ls({endpoint_id}, {query_params})")
         return IterableTransferResponse(
-            self.get(f"operation/endpoint/{endpoint_id}/ls", query_params=query_params)
+            self.get(
+                f"operation/endpoint/{endpoint_id}/ls",
+                query_params=query_params,
+                stream=stream,
+            )
         )
 
     def operation_mkdir(
@@ -1612,6 +1623,132 @@ class TransferClient(client.BaseClient):
             data["submission_id"] = self.get_submission_id()["value"]
         return self.post("/delete", data=data)
 
+    def submit_chunked(
+        self,
+        data: TransferData | DeleteData,
+        items: t.Iterable[t.Any] | None = None,
+        *,
+        chunk_size: int = 50000,
+        concurrency: int = 4,
+    ) -> list[str]:
+        """
+        Submit a transfer or delete task document which is too large to submit at
+        once, by splitting its items into chunks and submitting each chunk as a
+        separate task. Returns the IDs of the tasks, in the order of their chunks.
+
+        Every task uses the options of ``data``. Each chunk is given its own
+        submission ID, so a submission which is retried after a network error does
+        not create a duplicate task. Up to ``concurrency`` chunks are submitted at
+        once, as with :meth:`map <globus_sdk.BaseClient.map>`.
+
+        The items are taken from ``data``, or from ``items`` if it is given. In that
+        case, ``items`` is read as chunks are submitted, so a generator of millions
+        of items is never held in memory at once, and it may contain any of the
+        forms of item accepted by ``add_items`` on ``data``.
+
+        If any chunk cannot be submitted, no more items are read, but chunks which
+        were already read are still submitted. This includes chunks in flight and
+        those queued to be sent next, up to ``2 * concurrency`` chunks. Then a
+        :class:`ChunkedSubmissionError <globus_sdk.ChunkedSubmissionError>` is raised.
+        It records the outcome of every chunk, so that the failed chunks can be
+        submitted again.
+
+        :param data: The task document to submit. It must not have a
+            ``submission_id``
+        :type data: TransferData or DeleteData
+        :param items: The items to submit, instead of the items of ``data``
+        :type items: iterable, optional
+        :param chunk_size: The maximum number of items in each task
+        :type chunk_size: int
+        :param concurrency: The maximum number of chunks to submit at once
+        :type concurrency: int
+
+        .. tab-set::
+
+            .. tab-item:: Example Usage
+
+                .. code-block:: python
+
+                    tc = globus_sdk.TransferClient(...)
+                    tdata = globus_sdk.TransferData(
+                        source_endpoint=source_endpoint_id,
+                        destination_endpoint=destination_endpoint_id,
+                        label="Migration",
+                    )
+                    task_ids = tc.submit_chunked(
+                        tdata,
+                        ((f"/source/{name}", f"/dest/{name}") for name in names),
+                    )
+        """
+        if isinstance(data, TransferData):
+            path = "/transfer"
+        elif isinstance(data, DeleteData):
+            path = "/delete"
+        else:
+            raise exc.GlobusSDKUsageError(
+                "submit_chunked requires a TransferData or DeleteData"
+            )
+        if "submission_id" in data:
+            raise exc.GlobusSDKUsageError(
+                "submit_chunked cannot use the submission_id of the task document, "
+                "since each chunk is submitted with its own submission_id"
+            )
+        if items is not None and data["DATA"]:
+            raise exc.GlobusSDKUsageError(
+                "submit_chunked cannot take items when the task document has items"
+            )
+        if chunk_size < 1:
+            raise ValueError("Cannot submit chunks of less than one item.")
+        log.info("TransferClient.submit_chunked(...)")
+
+        errors: list[exc.GlobusError] = []
+
+        def new_chunk() -> TransferData | DeleteData:
+            chunk = copy.copy(data)
+            chunk.data = {k: v for k, v in data.items() if k != "DATA"}
+            return chunk
+
+        def iter_chunks() -> t.Iterator[TransferData | DeleteData]:
+            if items is None:
+                all_items = data["DATA"]
+                for start in range(0, len(all_items), chunk_size):
+                    if errors:
+                        return
+                    chunk = new_chunk()
+                    chunk["DATA"] = all_items[start : start + chunk_size]
+                    yield chunk
+            else:
+                iterator = iter(items)
+                while not errors:
+                    chunk = new_chunk()
+                    chunk["DATA"] = []
+                    if not chunk.add_items(itertools.islice(iterator, chunk_size)):
+                        return
+                    yield chunk
+
+        def submit(chunk: TransferData | DeleteData) -> str:
+            chunk["submission_id"] = self.get_submission_id()["value"]
+            log.debug(
+                "submit_chunked submitting %d items as %s",
+                len(chunk["DATA"]),
+                chunk["submission_id"],
+            )
+            return str(self.post(path, data=chunk)["task_id"])
+
+        results = []
+        for result in self.map(submit, iter_chunks(), concurrency=concurrency):
+            if result.exception is not None:
+                log.warning(
+                    "submit_chunked could not submit chunk %d: %s",
+                    result.position,
+                    result.exception,
+                )
+                errors.append(result.exception)
+            results.append(result)
+        if errors:
+            raise ChunkedSubmissionError(results) from errors[0]
+        return [result.result for result in results]
+
     #
     # Task inspection and management
     #
@@ -1716,6 +1853,7 @@ class TransferClient(client.BaseClient):
         limit: int | None = None,
         offset: int | None = None,
         query_params: dict[str, t.Any] | None = None,
+        stream: bool = False,
     ) -> IterableTransferResponse:
         r"""
         List events (for example, faults and errors) for a given Task.
@@ -1728,6 +1866,9 @@ class TransferClient(client.BaseClient):
         :type offset: int, optional
         :param query_params: Additional passthrough query parameters
         :type query_params: dict, optional
+        :param stream: Download the events as they are iterated, decoding one event at
+            a time, rather than loading the whole response into memory at once
+        :type stream: bool, optional
 
         .. tab-set::
 
@@ -1761,7 +1902,9 @@ class TransferClient(client.BaseClient):
         if offset is not None:
             query_params["offset"] = offset
         return IterableTransferResponse(
-            self.get(f"task/{task_id}/event_list", query_params=query_params)
+            self.get(
+                f"task/{task_id}/event_list", query_params=query_params, stream=stream
+            )
         )
 
     def get_task(
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import typing as t
+
+from globus_sdk import utils
+
+
+class _CompactItems:
+    """
+    Items which have been added to a task document but not yet built as dicts.
+
+    Each item is stored as a tuple of a tuple of its keys, followed by its values.
+    Items with the same fields share one tuple of keys, so an item costs a single
+    small tuple rather than a dict.
+    """
+
+    def __init__(self) -> None:
+        self._rows: list[tuple[t.Any, ...]] = []
+        self._shapes: dict[tuple[str, ...], tuple[str, ...]] = {}
+
+    def append(self, keys: tuple[str, ...], values: t.Iterable[t.Any]) -> None:
+        keys = self._shapes.setdefault(keys, keys)
+        self._rows.append((keys, *values))
+
+    def copy(self) -> _CompactItems:
+        new = _CompactItems()
+        new._rows = list(self._rows)
+        new._shapes = dict(self._shapes)
+        return new
+
+    def clear(self) -> None:
+        self._rows.clear()
+        self._shapes.clear()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __iter__(self) -> t.Iterator[dict[str, t.Any]]:
+        for keys, *values in self._rows:
+            yield dict(zip(keys, values))
+
+
+class _ItemsPayloadWrapper(utils.PayloadWrapper):
+    """
+    A task document with a ``DATA`` list of items, such as a ``TransferData``.
+
+    Items added by the helper methods are held compactly, and are only built as
+    dicts and moved into ``DATA`` when ``DATA`` or ``data`` is read. When the
+    document is sent, the dicts are built for the request body alone, and the
+    document keeps the compact items.
+    """
+
+    # the items which are not yet in DATA, created when the first one is added
+    _pending_items: _CompactItems | None = None
+
+    # ``data`` is the dict of the document. Reading it moves pending items into DATA,
+    # so that it may be used like the dict of any other PayloadWrapper
+    @property
+    def data(self) -> dict[str, t.Any]:
+        self._flush_items()
+        return t.cast(t.Dict[str, t.Any], self.__dict__["data"])
+
+    @data.setter
+    def data(self, value: dict[str, t.Any]) -> None:
+        self.__dict__["data"] = value
+
+    # other keys are read and written without building the pending items
+    def __getitem__(self, key: str) -> t.Any:
+        if key == "DATA":
+            self._flush_items()
+        return self.__dict__["data"][key]
+
+    def __setitem__(self, key: str, value: t.Any) -> None:
+        if key == "DATA":
+            self._flush_items()
+        self.__dict__["data"][key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key == "DATA":
+            self._flush_items()
+        del self.__dict__["data"][key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__dict__["data"]
+
+    def __len__(self) -> int:
+        return len(self.__dict__["data"])
+
+    def __iter__(self) -> t.Iterator[str]:
+        return iter(self.__dict__["data"])
+
+    def __copy__(self) -> _ItemsPayloadWrapper:
+        new = type(self).__new__(type(self))
+        new.__dict__.update(self.__dict__)
+        new.__dict__["data"] = dict(self.__dict__["data"])
+        # pending items are moved into DATA, so the copies must not share one list
+        if isinstance(new.__dict__["data"].get("DATA"), list):
+            new.__dict__["data"]["DATA"] = list(new.__dict__["data"]["DATA"])
+        if self._pending_items is not None:
+            new._pending_items = self._pending_items.copy()
+        return new
+
+    def _add_compact_item(self, keys: tuple[str, ...], values: list[t.Any]) -> None:
+        if self._pending_items is None:
+            self._pending_items = _CompactItems()
+        self._pending_items.append(keys, values)
+
+    def _flush_items(self) -> None:
+        pending = self._pending_items
+        if pending:
+            self.__dict__["data"].setdefault("DATA", []).extend(pending)
+            pending.clear()
+
+    def _get_request_data(self) -> dict[str, t.Any]:
+        data: dict[str, t.Any] = self.__dict__["data"]
+        pending = self._pending_items
+        if not pending:
+            return data
+        return {**data, "DATA": [*data.get("DATA", []), *pending]}
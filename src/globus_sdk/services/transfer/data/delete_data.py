@@ -4,16 +4,19 @@ import datetime
 import logging
 import typing as t
 
-from globus_sdk import exc, utils
+from globus_sdk import exc
 from globus_sdk._types import UUIDLike
 
+from ._items import _ItemsPayloadWrapper
+
 if t.TYPE_CHECKING:
     import globus_sdk
 
 log = logging.getLogger(__name__)
+_DELETE_ITEM_KEYS = ("DATA_TYPE", "path")
 
 
-class DeleteData(utils.PayloadWrapper):
+class DeleteData(_ItemsPayloadWrapper):
     r"""
     Convenience class for constructing a delete document, to use as the
     `data` parameter to
@@ -176,11 +179,41 @@ class DeleteData(utils.PayloadWrapper):
         :param additional_fields: additional fields to be added to the delete item
         :type additional_fields: dict, optional
         """
-        item_data = {"DATA_TYPE": "delete_item", "path": path}
-        if additional_fields is not None:
+        log.debug('DeleteData.add_item: "%s"', path)
+        self._add_delete_item(path, additional_fields)
+
+    def add_items(self, items: t.Iterable[str | t.Mapping[str, t.Any]]) -> int:
+        """
+        Add many files, directories, or symlinks to be deleted, as with
+        :meth:`add_item <globus_sdk.DeleteData.add_item>`. Items are read from
+        ``items`` one at a time, so they may be produced by a generator.
+
+        Each item is either a path, or a dict of the arguments to ``add_item``.
+
+        Returns the number of items added.
+
+        :param items: The items to add
+        :type items: iterable of str or dict
+        """
+        count = 0
+        for item in items:
+            if isinstance(item, str):
+                self._add_delete_item(item, None)
+            else:
+                self._add_delete_item(item["path"], item.get("additional_fields"))
+            count += 1
+        log.debug("DeleteData.add_items: added %d items", count)
+        return count
+
+    def _add_delete_item(
+        self, path: str, additional_fields: dict[str, t.Any] | None
+    ) -> None:
+        if additional_fields:
+            item_data = {"DATA_TYPE": "delete_item", "path": path}
             item_data.update(additional_fields)
-        log.debug('DeleteData[{}].add_item: "{}"'.format(self["endpoint"], path))
-        self["DATA"].append(item_data)
+            self._add_compact_item(tuple(item_data), list(item_data.values()))
+        else:
+            self._add_compact_item(_DELETE_ITEM_KEYS, ["delete_item", path])
 
     def iter_items(self) -> t.Iterator[dict[str, t.Any]]:
         """
@@ -10,9 +10,11 @@ if sys.version_info >= (3, 8):
 else:
     from typing_extensions import Literal
 
-from globus_sdk import exc, utils
+from globus_sdk import exc
 from globus_sdk._types import UUIDLike
 
+from ._items import _ItemsPayloadWrapper
+
 if t.TYPE_CHECKING:
     import globus_sdk
 
@@ -24,6 +26,7 @@ _sync_level_dict: dict[_StrSyncLevel, int] = {
     "mtime": 2,
     "checksum": 3,
 }
+_TRANSFER_ITEM_KEYS = ("DATA_TYPE", "source_path", "destination_path")
 
 
 def _parse_sync_level(sync_level: _StrSyncLevel | int) -> int:
@@ -40,7 +43,7 @@ def _parse_sync_level(sync_level: _StrSyncLevel | int) -> int:
     return sync_level
 
 
-class TransferData(utils.PayloadWrapper):
+class TransferData(_ItemsPayloadWrapper):
     r"""
     Convenience class for constructing a transfer document, to use as the
     ``data`` parameter to
@@ -308,29 +311,90 @@ class TransferData(utils.PayloadWrapper):
         :param additional_fields: additional fields to be added to the transfer item
         :type additional_fields: dict, optional
         """
-        item_data: dict[str, t.Any] = {
-            "DATA_TYPE": "transfer_item",
-            "source_path": source_path,
-            "destination_path": destination_path,
-        }
-        if recursive is not None:
-            item_data["recursive"] = recursive
-        if external_checksum is not None:
-            item_data["external_checksum"] = external_checksum
-        if checksum_algorithm is not None:
-            item_data["checksum_algorithm"] = checksum_algorithm
-        if additional_fields is not None:
-            item_data.update(additional_fields)
-
-        log.debug(
-            'TransferData[{}, {}].add_item: "{}"->"{}"'.format(
-                self["source_endpoint"],
-                self["destination_endpoint"],
-                source_path,
-                destination_path,
-            )
+        log.debug('TransferData.add_item: "%s"->"%s"', source_path, destination_path)
+        self._add_transfer_item(
+            source_path,
+            destination_path,
+            recursive,
+            external_checksum,
+            checksum_algorithm,
+            additional_fields,
         )
-        self["DATA"].append(item_data)
+
+    def add_items(
+        self, items: t.Iterable[t.Sequence[str] | t.Mapping[str, t.Any]]
+    ) -> int:
+        """
+        Add many files or directories to be transferred, as with
+        :meth:`add_item <globus_sdk.TransferData.add_item>`. Items are read from
+        ``items`` one at a time, so they may be produced by a generator.
+
+        Each item is either a ``(source_path, destination_path)`` pair, given as any
+        sequence of two paths, or a dict of the arguments to ``add_item``.
+
+        Returns the number of items added.
+
+        :param items: The items to add
+        :type items: iterable of sequence or dict
+
+        Example Usage:
+
+        >>> tdata = TransferData(...)
+        >>> tdata.add_items(
+        ...     (f"/source/{name}", f"/dest/{name}") for name in file_names
+        ... )
+        >>> tdata.add_items([{"source_path": "/dir/", "destination_path": "/dir/",
+        ...                   "recursive": True}])
+        """
+        count = 0
+        for item in items:
+            if isinstance(item, t.Mapping):
+                self._add_transfer_item(
+                    item["source_path"],
+                    item["destination_path"],
+                    item.get("recursive"),
+                    item.get("external_checksum"),
+                    item.get("checksum_algorithm"),
+                    item.get("additional_fields"),
+                )
+            elif isinstance(item, (str, bytes)):
+                raise exc.GlobusSDKUsageError(
+                    "add_items requires a (source_path, destination_path) pair or a "
+                    f"dict for each item, not a string: {item!r}"
+                )
+            else:
+                source_path, destination_path = item
+                self._add_transfer_item(
+                    source_path, destination_path, None, None, None, None
+                )
+            count += 1
+        log.debug("TransferData.add_items: added %d items", count)
+        return count
+
+    def _add_transfer_item(
+        self,
+        source_path: str,
+        destination_path: str,
+        recursive: bool | None,
+        external_checksum: str | None,
+        checksum_algorithm: str | None,
+        additional_fields: dict[str, t.Any] | None,
+    ) -> None:
+        keys: tuple[str, ...] = _TRANSFER_ITEM_KEYS
+        values: list[t.Any] = ["transfer_item", source_path, destination_path]
+        for key, value in (
+            ("recursive", recursive),
+            ("external_checksum", external_checksum),
+            ("checksum_algorithm", checksum_algorithm),
+        ):
+            if value is not None:
+                keys += (key,)
+                values.append(value)
+        if additional_fields:
+            item_data = dict(zip(keys, values))
+            item_data.update(additional_fields)
+            keys, values = tuple(item_data), list(item_data.values())
+        self._add_compact_item(keys, values)
 
     def add_symlink_item(self, source_path: str, destination_path: str) -> None:
         """
@@ -345,20 +409,13 @@ class TransferData(utils.PayloadWrapper):
         :param destination_path: Path to which the source symlink will be transferred
         :type destination_path: str
         """
-        item_data = {
-            "DATA_TYPE": "transfer_symlink_item",
-            "source_path": source_path,
-            "destination_path": destination_path,
-        }
         log.debug(
-            'TransferData[{}, {}].add_symlink_item: "{}"->"{}"'.format(
-                self["source_endpoint"],
-                self["destination_endpoint"],
-                source_path,
-                destination_path,
-            )
+            'TransferData.add_symlink_item: "%s"->"%s"', source_path, destination_path
+        )
+        self._add_compact_item(
+            _TRANSFER_ITEM_KEYS,
+            ["transfer_symlink_item", source_path, destination_path],
         )
-        self["DATA"].append(item_data)
 
     def add_filter_rule(
         self,
@@ -1,9 +1,54 @@
 from __future__ import annotations
 
+import typing as t
+
 from globus_sdk import exc
 
+if t.TYPE_CHECKING:
+    from globus_sdk.client import MapResult
+
 
 class TransferAPIError(exc.GlobusAPIError):
     """
     Error class for the Transfer API client.
     """
+
+
+class ChunkedSubmissionError(exc.GlobusError):
+    """
+    Some chunks of a task document passed to
+    :meth:`TransferClient.submit_chunked <globus_sdk.TransferClient.submit_chunked>`
+    could not be submitted. The error of the first chunk which failed is also the
+    ``__cause__`` of this error.
+
+    Chunks are numbered from 0 in the order of the items, so chunk ``n`` holds the
+    items from ``n * chunk_size`` up to ``(n + 1) * chunk_size``. Every chunk which
+    was read from the items was submitted, and appears in either ``task_ids`` or
+    ``errors``. Items after the last chunk in ``results`` were not submitted. When
+    the items were given as an iterator, those items were not read, and remain in
+    the iterator.
+
+    :ivar results: The outcome of each chunk, in chunk order, as
+        :class:`MapResult <globus_sdk.client.MapResult>` objects. The ``item`` of
+        each result is the task document of the chunk, so the items of a failed
+        chunk can be submitted again
+    :ivar task_ids: The IDs of the tasks which were submitted, by chunk number
+    :ivar errors: The errors raised when submitting the other chunks, by chunk number
+    """
+
+    def __init__(self, results: list[MapResult]) -> None:
+        super().__init__(results)
+        self.results = results
+        self.task_ids: dict[int, str] = {
+            r.position: r.result for r in results if r.exception is None
+        }
+        self.errors: dict[int, exc.GlobusError] = {
+            r.position: r.exception for r in results if r.exception is not None
+        }
+
+    def __str__(self) -> str:
+        return (
+            f"{len(self.errors)} chunks could not be submitted "
+            f"(chunks {sorted(self.errors)}), "
+            f"{len(self.task_ids)} tasks were submitted"
+        )
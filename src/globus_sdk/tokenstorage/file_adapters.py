@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import pathlib
+import threading
 import typing as t
 
 from globus_sdk.services.auth import OAuthTokenResponse
@@ -14,6 +15,10 @@ class SimpleJSONFileAdapter(FileAdapter):
     :param filename: the name of the file to write to and read from
 
     A storage adapter for storing tokens in JSON files.
+
+    An adapter may be shared between threads. Reads and writes of the file made
+    through one adapter are done while holding a lock, so a read never sees a partly
+    written file.
     """
 
     # the version for the current data format used by the file adapter
@@ -26,6 +31,7 @@ class SimpleJSONFileAdapter(FileAdapter):
 
     def __init__(self, filename: pathlib.Path | str):
         self.filename = str(filename)
+        self._lock = threading.RLock()
 
     def _raw_load(self) -> dict[str, t.Any]:
         """
@@ -66,7 +72,8 @@ class SimpleJSONFileAdapter(FileAdapter):
         If the file is missing, this will return a "skeleton" for new data.
         """
         try:
-            data = self._raw_load()
+            with self._lock:
+                data = self._raw_load()
         except FileNotFoundError:
             return {
                 "by_rs": {},
@@ -91,21 +98,22 @@ class SimpleJSONFileAdapter(FileAdapter):
         :param token_response: The token data received from the refresh
         :type token_response: :class:`~.OAuthTokenResponse`
         """
-        to_write = self._load()
-
-        # copy the data from the by_resource_server attribute
-        #
-        # if the file did not exist and we're handling the initial token response, this
-        # is a full copy of all of the token data
-        #
-        # if the file already exists and we're handling a token refresh, we only modify
-        # newly received tokens
-        to_write["by_rs"].update(token_response.by_resource_server)
-
-        # deny rwx to Group and World, exec to User
-        with self.user_only_umask():
-            with open(self.filename, "w", encoding="utf-8") as f:
-                json.dump(to_write, f)
+        with self._lock:
+            to_write = self._load()
+
+            # copy the data from the by_resource_server attribute
+            #
+            # if the file did not exist and we're handling the initial token
+            # response, this is a full copy of all of the token data
+            #
+            # if the file already exists and we're handling a token refresh, we only
+            # modify newly received tokens
+            to_write["by_rs"].update(token_response.by_resource_server)
+
+            # deny rwx to Group and World, exec to User
+            with self.user_only_umask():
+                with open(self.filename, "w", encoding="utf-8") as f:
+                    json.dump(to_write, f)
 
     def get_by_resource_server(self) -> dict[str, t.Any]:
         """
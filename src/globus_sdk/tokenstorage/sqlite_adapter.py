@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import pathlib
 import sqlite3
+import threading
 import typing as t
 
 from globus_sdk.services.auth import OAuthTokenResponse
@@ -40,6 +41,11 @@ class SQLiteAdapter(FileAdapter):
     to the underlying ``sqlite3.connect()`` method, enabling developers to fine-tune the
     connection to the SQLite database.  Refer to the ``sqlite3.connect()``
     documentation for SQLite-specific parameters.
+
+    An adapter may be shared between threads, for example when it is used as the
+    ``on_refresh`` callback of an authorizer which renews tokens in the background.
+    Its connection is opened with ``check_same_thread=False``, and each operation on
+    the database is done while holding a lock.
     """
 
     def __init__(
@@ -51,6 +57,7 @@ class SQLiteAdapter(FileAdapter):
     ):
         self.filename = self.dbname = str(dbname)
         self.namespace = namespace
+        self._lock = threading.RLock()
         self._connection = self._init_and_connect(connect_params)
 
     def _is_memory_db(self) -> bool:
@@ -61,7 +68,7 @@ class SQLiteAdapter(FileAdapter):
         connect_params: dict[str, t.Any] | None,
     ) -> sqlite3.Connection:
         init_tables = self._is_memory_db() or not self.file_exists()
-        connect_params = connect_params or {}
+        connect_params = {"check_same_thread": False, **(connect_params or {})}
         if init_tables and not self._is_memory_db():  # real file needs to be created
             with self.user_only_umask():
                 conn = sqlite3.connect(self.dbname, **connect_params)
@@ -107,7 +114,8 @@ CREATE TABLE sdk_storage_adapter_internal (
         """
         Close the underlying database connection.
         """
-        self._connection.close()
+        with self._lock:
+            self._connection.close()
 
     def store_config(
         self, config_name: str, config_dict: t.Mapping[str, t.Any]
@@ -124,12 +132,13 @@ CREATE TABLE sdk_storage_adapter_internal (
 
         Uses sqlite "REPLACE" to perform the operation.
         """
-        self._connection.execute(
-            "REPLACE INTO config_storage(namespace, config_name, config_data_json) "
-            "VALUES (?, ?, ?)",
-            (self.namespace, config_name, json.dumps(config_dict)),
-        )
-        self._connection.commit()
+        with self._lock:
+            self._connection.execute(
+                "REPLACE INTO config_storage(namespace, config_name, config_data_json) "
+                "VALUES (?, ?, ?)",
+                (self.namespace, config_name, json.dumps(config_dict)),
+            )
+            self._connection.commit()
 
     def read_config(self, config_name: str) -> dict[str, t.Any] | None:
         """
@@ -139,11 +148,12 @@ CREATE TABLE sdk_storage_adapter_internal (
         Load a config dict under the current namespace in the config table.
         If no value is found, returns None
         """
-        row = self._connection.execute(
-            "SELECT config_data_json FROM config_storage "
-            "WHERE namespace=? AND config_name=?",
-            (self.namespace, config_name),
-        ).fetchone()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT config_data_json FROM config_storage "
+                "WHERE namespace=? AND config_name=?",
+                (self.namespace, config_name),
+            ).fetchone()
 
         if row is None:
             return None
@@ -162,11 +172,12 @@ CREATE TABLE sdk_storage_adapter_internal (
 
         Returns True if data was deleted, False if none was found to delete.
         """
-        rowcount = self._connection.execute(
-            "DELETE FROM config_storage WHERE namespace=? AND config_name=?",
-            (self.namespace, config_name),
-        ).rowcount
-        self._connection.commit()
+        with self._lock:
+            rowcount = self._connection.execute(
+                "DELETE FROM config_storage WHERE namespace=? AND config_name=?",
+                (self.namespace, config_name),
+            ).rowcount
+            self._connection.commit()
         return rowcount != 0
 
     def store(self, token_response: OAuthTokenResponse) -> None:
@@ -184,15 +195,16 @@ CREATE TABLE sdk_storage_adapter_internal (
         for rs_name, token_data in token_response.by_resource_server.items():
             pairs.append((rs_name, token_data))
 
-        self._connection.executemany(
-            "REPLACE INTO token_storage(namespace, resource_server, token_data_json) "
-            "VALUES(?, ?, ?)",
-            [
-                (self.namespace, rs_name, json.dumps(token_data))
-                for (rs_name, token_data) in pairs
-            ],
-        )
-        self._connection.commit()
+        with self._lock:
+            self._connection.executemany(
+                "REPLACE INTO token_storage"
+                "(namespace, resource_server, token_data_json) VALUES(?, ?, ?)",
+                [
+                    (self.namespace, rs_name, json.dumps(token_data))
+                    for (rs_name, token_data) in pairs
+                ],
+            )
+            self._connection.commit()
 
     def get_token_data(self, resource_server: str) -> dict[str, t.Any] | None:
         """
@@ -204,11 +216,13 @@ CREATE TABLE sdk_storage_adapter_internal (
             one would use as a key in OAuthTokenResponse.by_resource_server
         :type resource_server: str
         """
-        for row in self._connection.execute(
-            "SELECT token_data_json FROM token_storage "
-            "WHERE namespace=? AND resource_server=?",
-            (self.namespace, resource_server),
-        ):
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT token_data_json FROM token_storage "
+                "WHERE namespace=? AND resource_server=?",
+                (self.namespace, resource_server),
+            ).fetchall()
+        for row in rows:
             (token_data_json,) = row
             val = json.loads(token_data_json)
             if not isinstance(val, dict):
@@ -225,11 +239,13 @@ CREATE TABLE sdk_storage_adapter_internal (
         and content. (But it is not attached to a token response object.)
         """
         data = {}
-        for row in self._connection.execute(
-            "SELECT resource_server, token_data_json "
-            "FROM token_storage WHERE namespace=?",
-            (self.namespace,),
-        ):
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT resource_server, token_data_json "
+                "FROM token_storage WHERE namespace=?",
+                (self.namespace,),
+            ).fetchall()
+        for row in rows:
             resource_server, token_data_json = row
             data[resource_server] = json.loads(token_data_json)
         return data
@@ -247,11 +263,12 @@ CREATE TABLE sdk_storage_adapter_internal (
             as one would use as a key in OAuthTokenResponse.by_resource_server
         :type resource_server: str
         """
-        rowcount = self._connection.execute(
-            "DELETE FROM token_storage WHERE namespace=? AND resource_server=?",
-            (self.namespace, resource_server),
-        ).rowcount
-        self._connection.commit()
+        with self._lock:
+            rowcount = self._connection.execute(
+                "DELETE FROM token_storage WHERE namespace=? AND resource_server=?",
+                (self.namespace, resource_server),
+            ).rowcount
+            self._connection.commit()
         return rowcount != 0
 
     def iter_namespaces(
@@ -268,17 +285,21 @@ CREATE TABLE sdk_storage_adapter_internal (
         :type include_config_namespaces: bool, optional
         """
         seen: set[str] = set()
-        for row in self._connection.execute(
-            "SELECT DISTINCT namespace FROM token_storage;"
-        ):
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT DISTINCT namespace FROM token_storage;"
+            ).fetchall()
+        for row in rows:
             namespace = row[0]
             seen.add(namespace)
             yield namespace
 
         if include_config_namespaces:
-            for row in self._connection.execute(
-                "SELECT DISTINCT namespace FROM config_storage;"
-            ):
+            with self._lock:
+                rows = self._connection.execute(
+                    "SELECT DISTINCT namespace FROM config_storage;"
+                ).fetchall()
+            for row in rows:
                 namespace = row[0]
                 if namespace not in seen:
                     yield namespace
@@ -1,6 +1,30 @@
-from .encoders import FormRequestEncoder, JSONRequestEncoder, RequestEncoder
+from globus_sdk._json import JSONCodec, set_json_codec
+
+from ._pool import create_session
+from .caching import ResponseCache
+from .circuit_breaker import CircuitBreaker, CircuitState
+from .encoders import (
+    CompressedJSONRequestEncoder,
+    FormRequestEncoder,
+    JSONRequestEncoder,
+    RequestEncoder,
+)
+from .hooks import (
+    AttemptInfo,
+    OpenTelemetryHooks,
+    PrometheusHooks,
+    RequestInfo,
+    TransportHooks,
+)
+from .ratelimit import (
+    MemoryRateLimitBackend,
+    RateLimitBackend,
+    RateLimiter,
+    SQLiteRateLimitBackend,
+)
 from .requests import RequestsTransport
 from .retry import (
+    RetryBudget,
     RetryCheck,
     RetryCheckFlags,
     RetryCheckResult,
@@ -17,7 +41,24 @@ __all__ = (
     "RetryCheckRunner",
     "set_retry_check_flags",
     "RetryContext",
+    "RetryBudget",
+    "TransportHooks",
+    "RequestInfo",
+    "AttemptInfo",
+    "PrometheusHooks",
+    "OpenTelemetryHooks",
     "RequestEncoder",
     "JSONRequestEncoder",
     "FormRequestEncoder",
+    "CompressedJSONRequestEncoder",
+    "JSONCodec",
+    "set_json_codec",
+    "create_session",
+    "ResponseCache",
+    "RateLimiter",
+    "RateLimitBackend",
+    "MemoryRateLimitBackend",
+    "SQLiteRateLimitBackend",
+    "CircuitBreaker",
+    "CircuitState",
 )
@@ -0,0 +1,189 @@
+"""
+Connection pool configuration for the RequestsTransport.
+
+``requests`` manages connections with a ``urllib3.PoolManager``, which keeps one pool
+of connections per host. The adapter defined here allows the size of each pool to be
+set per host, and enables TCP keepalive on pooled connections.
+"""
+from __future__ import annotations
+
+import socket
+import typing as t
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+
+def _keepalive_socket_options(interval: int) -> list[tuple[int, int, int]]:
+    options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    # the timing options are not available on all platforms
+    for name in ("TCP_KEEPIDLE", "TCP_KEEPINTVL"):
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), interval))
+    return options
+
+
+class _HostSizedPoolManager(urllib3.PoolManager):
+    """
+    A PoolManager which allows the maximum size of a pool to be set per host.
+    """
+
+    def __init__(
+        self, *args: t.Any, maxsize_by_host: dict[str, int], **kwargs: t.Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.maxsize_by_host = maxsize_by_host
+
+    def _new_pool(
+        self,
+        scheme: str,
+        host: str,
+        port: int,
+        request_context: dict[str, t.Any] | None = None,
+    ) -> urllib3.HTTPConnectionPool:
+        if host in self.maxsize_by_host:
+            request_context = {
+                **(request_context or self.connection_pool_kw),
+                "maxsize": self.maxsize_by_host[host],
+            }
+        return super()._new_pool(scheme, host, port, request_context)
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    An HTTPAdapter with per-host pool sizing and optional TCP keepalive.
+
+    :param pool_connections: The number of per-host pools to keep
+    :param pool_maxsize: The maximum number of connections to keep in each pool
+    :param pool_block: Whether to wait for a connection to become available when a
+        pool is full, rather than opening a new connection which is discarded after use
+    :param pool_maxsize_by_host: A mapping of hostnames to pool sizes, overriding
+        ``pool_maxsize`` for those hosts
+    :param tcp_keepalive_interval: If set, enable TCP keepalive on connections, with
+        probes sent after this many seconds of idleness where the platform supports it
+    """
+
+    __attrs__ = HTTPAdapter.__attrs__ + [
+        "pool_maxsize_by_host",
+        "tcp_keepalive_interval",
+    ]
+
+    def __init__(
+        self,
+        *,
+        pool_connections: int,
+        pool_maxsize: int,
+        pool_block: bool,
+        pool_maxsize_by_host: dict[str, int] | None = None,
+        tcp_keepalive_interval: int | None = None,
+    ) -> None:
+        # these must be set before the parent init, which builds the pool manager
+        self.pool_maxsize_by_host = dict(pool_maxsize_by_host or {})
+        self.tcp_keepalive_interval = tcp_keepalive_interval
+        super().__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+
+    def init_poolmanager(
+        self,
+        connections: int,
+        maxsize: int,
+        block: bool = False,
+        **pool_kwargs: t.Any,
+    ) -> None:
+        if self.tcp_keepalive_interval is not None:
+            pool_kwargs.setdefault(
+                "socket_options",
+                [
+                    *HTTPConnection.default_socket_options,
+                    *_keepalive_socket_options(self.tcp_keepalive_interval),
+                ],
+            )
+        # record the settings as the parent class does, so that they survive pickling
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = _HostSizedPoolManager(
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            maxsize_by_host=self.pool_maxsize_by_host,
+            **pool_kwargs,
+        )
+
+
+def create_session(
+    *,
+    pool_connections: int = 10,
+    pool_maxsize: int = 10,
+    pool_block: bool = False,
+    pool_maxsize_by_host: dict[str, int] | None = None,
+    tcp_keepalive_interval: int | None = None,
+) -> requests.Session:
+    """
+    Create a ``requests.Session`` with configured connection pools, as used by the
+    ``RequestsTransport``.
+
+    A session created with this function can be passed to several transports (e.g.
+    via ``transport_params={"session": session}``) so that many clients share the
+    same pools of open connections.
+
+    :param pool_connections: The number of per-host connection pools to keep
+    :type pool_connections: int, optional
+    :param pool_maxsize: The maximum number of connections to keep open in each
+        per-host pool
+    :type pool_maxsize: int, optional
+    :param pool_block: When a pool has no free connection, wait for one to be
+        returned instead of opening a new connection which is discarded after use
+    :type pool_block: bool, optional
+    :param pool_maxsize_by_host: A mapping of hostnames to pool sizes, which overrides
+        ``pool_maxsize`` for those hosts
+    :type pool_maxsize_by_host: dict of str to int, optional
+    :param tcp_keepalive_interval: Enable TCP keepalive on pooled connections, with
+        keepalive probes sent after this many seconds of idleness
+    :type tcp_keepalive_interval: int, optional
+    """
+    session = requests.Session()
+    adapter = PooledHTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+        pool_maxsize_by_host=pool_maxsize_by_host,
+        tcp_keepalive_interval=tcp_keepalive_interval,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_pool_stats(session: requests.Session) -> dict[str, dict[str, int]]:
+    """
+    Collect utilisation statistics for the connection pools of a session.
+
+    :param session: The session whose pools will be inspected
+    """
+    stats: dict[str, dict[str, int]] = {}
+    for adapter in set(session.adapters.values()):
+        poolmanager = getattr(adapter, "poolmanager", None)
+        if poolmanager is None:
+            continue
+        for key in list(poolmanager.pools.keys()):
+            pool = poolmanager.pools.get(key)
+            if pool is None or pool.pool is None:
+                continue
+            # the pool queue holds idle connections, and `None` placeholders for
+            # connections which may still be opened
+            idle = sum(1 for conn in list(pool.pool.queue) if conn is not None)
+            maxsize = pool.pool.maxsize
+            stats[f"{key.key_scheme}://{key.key_host}:{key.key_port}"] = {
+                "maxsize": maxsize,
+                "in_use": max(maxsize - pool.pool.qsize(), 0),
+                "idle": idle,
+                "num_connections": pool.num_connections,
+                "num_requests": pool.num_requests,
+            }
+    return stats
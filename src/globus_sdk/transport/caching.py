@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import collections
+import copy
+import email.utils
+import hashlib
+import logging
+import threading
+import time
+
+import requests
+
+log = logging.getLogger(__name__)
+
+
+def _parse_cache_control(response: requests.Response) -> dict[str, str | None]:
+    directives: dict[str, str | None] = {}
+    for directive in response.headers.get("Cache-Control", "").split(","):
+        name, _, value = directive.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') if value else None
+    return directives
+
+
+def _freshness_lifetime(response: requests.Response) -> float:
+    """
+    Get the number of seconds for which a response may be used without revalidation,
+    based on its ``Cache-Control`` and ``Expires`` headers.
+    """
+    directives = _parse_cache_control(response)
+    if "no-cache" in directives:
+        return 0
+    max_age = directives.get("max-age")
+    if max_age is not None:
+        try:
+            return max(int(max_age), 0)
+        except ValueError:
+            return 0
+    expires = response.headers.get("Expires")
+    if expires:
+        try:
+            expires_at = email.utils.parsedate_to_datetime(expires).timestamp()
+        except (TypeError, ValueError):
+            return 0
+        return max(expires_at - time.time(), 0)
+    return 0
+
+
+class _CacheEntry:
+    def __init__(self, response: requests.Response) -> None:
+        self.response = response
+        self.etag = response.headers.get("ETag")
+        self.last_modified = response.headers.get("Last-Modified")
+        self.expires_at = time.time() + _freshness_lifetime(response)
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    @property
+    def has_validators(self) -> bool:
+        return self.etag is not None or self.last_modified is not None
+
+
+class ResponseCache:
+    """
+    An HTTP response cache for use with a ``RequestsTransport``.
+
+    Successful ``GET`` responses are stored by URL and by the ``Authorization`` header
+    sent, so that responses are never shared between different credentials. Only a
+    hash of the header is retained.
+
+    A stored response is reused without contacting the service while it is fresh, as
+    indicated by its ``Cache-Control: max-age`` or ``Expires`` headers. Once it is
+    stale, the request is sent with ``If-None-Match`` and ``If-Modified-Since``
+    headers based on the ``ETag`` and ``Last-Modified`` headers of the stored
+    response. If the service replies ``304 Not Modified``, the stored response is
+    returned.
+
+    Responses with ``Cache-Control: no-store``, or with neither a freshness lifetime
+    nor a validator, are not stored. When more than ``maxsize`` responses are stored,
+    the least recently used response is evicted.
+
+    :param maxsize: The maximum number of responses to store
+    :type maxsize: int
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        if maxsize < 1:
+            raise ValueError("ResponseCache maxsize must be at least 1")
+        self.maxsize = maxsize
+        self._entries: collections.OrderedDict[
+            tuple[str, str], _CacheEntry
+        ] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(prepared: requests.PreparedRequest) -> tuple[str, str]:
+        authorization = prepared.headers.get("Authorization", "")
+        identity = hashlib.sha256(authorization.encode("utf-8")).hexdigest()
+        return (prepared.url or "", identity)
+
+    def clear(self) -> None:
+        """
+        Remove all stored responses.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def lookup(self, prepared: requests.PreparedRequest) -> _CacheEntry | None:
+        """
+        Get the stored entry for a request, if there is one.
+
+        :param prepared: The request which is about to be sent
+        """
+        if prepared.method != "GET":
+            return None
+        key = self._key(prepared)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        return entry
+
+    def store(self, response: requests.Response) -> None:
+        """
+        Store a response, if it is cacheable.
+
+        :param response: A response which has been fully read
+        """
+        prepared = response.request
+        if (
+            prepared is None
+            or prepared.method != "GET"
+            or response.status_code != 200
+            or "no-store" in _parse_cache_control(response)
+            or response.headers.get("Vary", "").strip() == "*"
+        ):
+            return
+        entry = _CacheEntry(response)
+        if not (entry.is_fresh or entry.has_validators):
+            return
+        key = self._key(prepared)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    @staticmethod
+    def add_validators(entry: _CacheEntry, prepared: requests.PreparedRequest) -> None:
+        """
+        Add conditional request headers for a stored entry to a request.
+
+        :param entry: The stored entry for the request
+        :param prepared: The request which is about to be sent
+        """
+        if entry.etag is not None:
+            prepared.headers["If-None-Match"] = entry.etag
+        if entry.last_modified is not None:
+            prepared.headers["If-Modified-Since"] = entry.last_modified
+
+    def revalidated(
+        self, entry: _CacheEntry, not_modified: requests.Response
+    ) -> requests.Response:
+        """
+        Build the response for a request which received ``304 Not Modified``, and
+        refresh the stored entry with the headers of the ``304`` response.
+
+        :param entry: The stored entry for the request
+        :param not_modified: The ``304`` response
+        """
+        response = copy.copy(entry.response)
+        response.headers = copy.copy(entry.response.headers)
+        for header in ("Cache-Control", "Date", "ETag", "Expires", "Last-Modified"):
+            if header in not_modified.headers:
+                response.headers[header] = not_modified.headers[header]
+        response.request = not_modified.request
+        response.url = not_modified.url
+        response.elapsed = not_modified.elapsed
+        self.store(response)
+        return response
+
+    @staticmethod
+    def cached(
+        entry: _CacheEntry, prepared: requests.PreparedRequest
+    ) -> requests.Response:
+        """
+        Build a response from a fresh stored entry, without sending the request.
+
+        :param entry: The stored entry for the request
+        :param prepared: The request which would have been sent
+        """
+        response = copy.copy(entry.response)
+        response.headers = copy.copy(entry.response.headers)
+        response.request = prepared
+        return response
@@ -0,0 +1,248 @@
+"""
+A circuit breaker for the RequestsTransport.
+
+The breaker tracks the outcome of recent requests to each host. When too many of
+them fail, the circuit for the host "opens" and requests to it fail immediately,
+rather than being sent and retried. After a cooling-off period the circuit becomes
+"half-open" and a limited number of probe requests are let through. A successful
+probe closes the circuit, and a failed probe opens it again.
+"""
+from __future__ import annotations
+
+import collections
+import enum
+import logging
+import threading
+import time
+import typing as t
+import urllib.parse
+
+import requests
+
+from .retry import RetryCheckResult, RetryContext
+
+log = logging.getLogger(__name__)
+
+
+class CircuitState(enum.Enum):
+    #: requests are sent normally
+    closed = "closed"
+    #: requests fail without being sent
+    open = "open"
+    #: a limited number of probe requests are sent
+    half_open = "half_open"
+
+
+class _Circuit:
+    def __init__(self) -> None:
+        self.state = CircuitState.closed
+        # (time, failed) for each request in the window
+        self.outcomes: collections.deque[tuple[float, bool]] = collections.deque()
+        self.opened_at: float | None = None
+        self.probes_started: list[float] = []
+
+
+def _host_of(url: str | None) -> str:
+    parsed = urllib.parse.urlsplit(url or "")
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+class CircuitBreaker:
+    """
+    A circuit breaker with a circuit for each host that requests are sent to.
+
+    A circuit opens when, within the last ``window`` seconds, at least
+    ``minimum_requests`` requests were sent to the host and at least
+    ``failure_rate_threshold`` of them failed. A request fails if it raises a network
+    error or receives one of the ``failure_status_codes``.
+
+    While a circuit is open, requests to the host raise
+    :class:`GlobusCircuitOpenError <globus_sdk.GlobusCircuitOpenError>` without
+    being sent, and requests which are in progress are not retried. After
+    ``reset_timeout`` seconds, up to ``half_open_max_requests`` probe requests are
+    sent. If a probe succeeds, the circuit closes. If a probe fails, the circuit
+    opens again.
+
+    A breaker is used by passing it to a ``RequestsTransport``, which registers
+    :meth:`check` as its first retry check. It may be shared by several
+    transports.
+
+    :param failure_rate_threshold: The fraction of failed requests, between 0 and 1,
+        at which the circuit opens
+    :type failure_rate_threshold: float
+    :param minimum_requests: The number of requests in the window below which the
+        circuit does not open
+    :type minimum_requests: int
+    :param window: The number of seconds of request history to consider
+    :type window: float
+    :param reset_timeout: The number of seconds for which a circuit stays open before
+        probe requests are sent
+    :type reset_timeout: float
+    :param half_open_max_requests: The number of probe requests allowed at once while
+        a circuit is half-open
+    :type half_open_max_requests: int
+    :param failure_status_codes: The response status codes which count as failures
+    :type failure_status_codes: tuple of int
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_rate_threshold: float = 0.5,
+        minimum_requests: int = 10,
+        window: float = 60,
+        reset_timeout: float = 30,
+        half_open_max_requests: int = 1,
+        failure_status_codes: tuple[int, ...] = (500, 502, 503, 504),
+    ) -> None:
+        if not 0 < failure_rate_threshold <= 1:
+            raise ValueError("failure_rate_threshold must be greater than 0 and <= 1")
+        if minimum_requests < 1 or half_open_max_requests < 1:
+            raise ValueError(
+                "minimum_requests and half_open_max_requests must be at least 1"
+            )
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_requests = minimum_requests
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self.half_open_max_requests = half_open_max_requests
+        self.failure_status_codes = failure_status_codes
+        self._lock = threading.Lock()
+        self._circuits: dict[str, _Circuit] = collections.defaultdict(_Circuit)
+
+    def _update_state(self, host: str, circuit: _Circuit, now: float) -> None:
+        if circuit.state is CircuitState.open:
+            if now - (circuit.opened_at or now) >= self.reset_timeout:
+                log.info("circuit for %s is half-open", host)
+                circuit.state = CircuitState.half_open
+                circuit.probes_started = []
+        elif circuit.state is CircuitState.half_open:
+            # probes which never reported an outcome do not block new probes forever
+            circuit.probes_started = [
+                started
+                for started in circuit.probes_started
+                if now - started < self.reset_timeout
+            ]
+        while circuit.outcomes and now - circuit.outcomes[0][0] > self.window:
+            circuit.outcomes.popleft()
+
+    def _open(self, host: str, circuit: _Circuit, now: float) -> None:
+        log.warning("circuit for %s is open", host)
+        circuit.state = CircuitState.open
+        circuit.opened_at = now
+        circuit.probes_started = []
+
+    def allow_request(self, url: str) -> bool:
+        """
+        Check whether a request may be sent. In the half-open state, a ``True``
+        result reserves one of the probe requests.
+
+        :param url: The URL of the request
+        """
+        host = _host_of(url)
+        now = time.time()
+        with self._lock:
+            circuit = self._circuits[host]
+            self._update_state(host, circuit, now)
+            if circuit.state is CircuitState.closed:
+                return True
+            if circuit.state is CircuitState.half_open and (
+                len(circuit.probes_started) < self.half_open_max_requests
+            ):
+                circuit.probes_started.append(now)
+                return True
+            return False
+
+    def retry_at(self, url: str) -> float | None:
+        """
+        Get the time at which probe requests will be sent to a host whose circuit is
+        open, or ``None`` if the circuit is not open.
+
+        :param url: A URL for the host
+        """
+        with self._lock:
+            circuit = self._circuits.get(_host_of(url))
+            if circuit is None or circuit.opened_at is None:
+                return None
+            if circuit.state is not CircuitState.open:
+                return None
+            return circuit.opened_at + self.reset_timeout
+
+    def _is_failure(self, ctx: RetryContext) -> bool:
+        if ctx.exception is not None:
+            return isinstance(ctx.exception, requests.RequestException)
+        return (
+            ctx.response is not None
+            and ctx.response.status_code in self.failure_status_codes
+        )
+
+    def record(self, url: str, failed: bool) -> CircuitState:
+        """
+        Record the outcome of a request, and get the resulting state of the circuit.
+
+        :param url: The URL of the request
+        :param failed: Whether or not the request failed
+        """
+        host = _host_of(url)
+        now = time.time()
+        with self._lock:
+            circuit = self._circuits[host]
+            self._update_state(host, circuit, now)
+            if circuit.state is CircuitState.half_open:
+                if failed:
+                    self._open(host, circuit, now)
+                else:
+                    log.info("circuit for %s is closed", host)
+                    circuit.state = CircuitState.closed
+                    circuit.opened_at = None
+                    circuit.outcomes.clear()
+            elif circuit.state is CircuitState.closed:
+                circuit.outcomes.append((now, failed))
+                failures = sum(1 for _, f in circuit.outcomes if f)
+                if (
+                    failed
+                    and len(circuit.outcomes) >= self.minimum_requests
+                    and failures / len(circuit.outcomes) >= self.failure_rate_threshold
+                ):
+                    self._open(host, circuit, now)
+            return circuit.state
+
+    def check(self, ctx: RetryContext) -> RetryCheckResult:
+        """
+        A retry check which records the outcome of each request attempt, and stops
+        retries once the circuit for the host is open.
+
+        :param ctx: The context object which describes the state of the request and the
+            retries which may already have been attempted.
+        :type ctx: RetryContext
+        """
+        if ctx.response is not None:
+            url = ctx.response.request.url if ctx.response.request else None
+        else:
+            request = getattr(ctx.exception, "request", None)
+            url = request.url if request is not None else None
+        if url is None:
+            return RetryCheckResult.no_decision
+
+        if self.record(url, self._is_failure(ctx)) is CircuitState.closed:
+            return RetryCheckResult.no_decision
+        return RetryCheckResult.do_not_retry
+
+    def get_stats(self) -> dict[str, dict[str, t.Any]]:
+        """
+        Get the state of each circuit, for monitoring. The result maps
+        ``"scheme://host"`` strings to dicts with the keys ``state``, ``requests``
+        and ``failures`` (counted over the current window), and ``opened_at``.
+        """
+        now = time.time()
+        stats: dict[str, dict[str, t.Any]] = {}
+        with self._lock:
+            for host, circuit in self._circuits.items():
+                self._update_state(host, circuit, now)
+                stats[host] = {
+                    "state": circuit.state.value,
+                    "requests": len(circuit.outcomes),
+                    "failures": sum(1 for _, failed in circuit.outcomes if failed),
+                    "opened_at": circuit.opened_at,
+                }
+        return stats
@@ -0,0 +1,406 @@
+"""
+Instrumentation hooks for the RequestsTransport.
+
+A hook object receives a call when a request starts, after each attempt to send
+it, before each sleep between retries, and when the request is done. Adapters are
+provided which record Prometheus metrics and OpenTelemetry spans. Their libraries
+are optional dependencies, imported only when an adapter is created.
+"""
+from __future__ import annotations
+
+import importlib
+import logging
+import re
+import time
+import typing as t
+import urllib.parse
+
+import requests
+
+log = logging.getLogger(__name__)
+
+# path segments which identify an object, rather than a type of resource
+_ID_SEGMENT = re.compile(
+    r"^(?:"
+    r"[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}"
+    r"|\d+"
+    r"|[0-9a-fA-F]{24,}"
+    r")$"
+)
+
+
+def template_path(path: str) -> str:
+    """
+    Replace the segments of a URL path which look like IDs (UUIDs, numbers, and long
+    hex strings) with ``{id}``, so that requests for different objects of the same
+    kind can be grouped. For example, ``/v0.10/task/<uuid>/event_list`` becomes
+    ``/v0.10/task/{id}/event_list``.
+
+    :param path: The path of a request URL
+    """
+    return "/".join(
+        "{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/")
+    )
+
+
+class RequestInfo:
+    """
+    A description of a request, passed to every hook call for that request.
+
+    :ivar method: The HTTP method
+    :ivar url: The URL, without its query string
+    :ivar host: The host, as ``scheme://host``
+    :ivar path_template: The path of the URL, with IDs replaced by ``{id}``
+    :ivar bytes_sent: The size of the request body
+    :ivar start_time: The ``time.perf_counter()`` value when the request started
+    :ivar hook_data: A dict which hooks may use to keep state for the request
+    """
+
+    def __init__(self, method: str, url: str, bytes_sent: int) -> None:
+        parsed = urllib.parse.urlsplit(url)
+        self.method = method
+        self.url = urllib.parse.urlunsplit(parsed._replace(query="", fragment=""))
+        self.host = f"{parsed.scheme}://{parsed.netloc}"
+        self.path_template = template_path(parsed.path)
+        self.bytes_sent = bytes_sent
+        self.start_time = time.perf_counter()
+        self.hook_data: dict[t.Any, t.Any] = {}
+
+
+class AttemptInfo:
+    """
+    The outcome of one attempt to send a request.
+
+    :ivar attempt: The attempt number, starting at 0
+    :ivar duration: The number of seconds the attempt took
+    :ivar status: The response status, or ``None`` if an error was raised
+    :ivar exception: The error raised, if any
+    :ivar bytes_received: The size of the response body. For streamed responses,
+        this is taken from the ``Content-Length`` header, and is 0 if it is absent
+    """
+
+    def __init__(
+        self,
+        attempt: int,
+        duration: float,
+        response: requests.Response | None,
+        exception: Exception | None,
+    ) -> None:
+        self.attempt = attempt
+        self.duration = duration
+        self.exception = exception
+        self.status = response.status_code if response is not None else None
+        self.bytes_received = _response_size(response)
+
+
+def _response_size(response: requests.Response | None) -> int:
+    if response is None:
+        return 0
+    if getattr(response, "_content_consumed", True):
+        return len(response.content or b"")
+    try:
+        return int(response.headers.get("Content-Length", 0))
+    except ValueError:
+        return 0
+
+
+def _body_size(body: t.Any) -> int:
+    if body is None:
+        return 0
+    if isinstance(body, str):
+        return len(body.encode("utf-8"))
+    if isinstance(body, bytes):
+        return len(body)
+    return 0
+
+
+def retry_reason(attempt: AttemptInfo) -> str:
+    """
+    Describe why an attempt is being retried, as the response status (e.g. ``"503"``)
+    or the name of the error raised (e.g. ``"ConnectionError"``).
+
+    :param attempt: The attempt which is being retried
+    """
+    if attempt.exception is not None:
+        return type(attempt.exception).__name__
+    return str(attempt.status)
+
+
+class TransportHooks:
+    """
+    The base class for transport hooks. Each method does nothing, and subclasses
+    override the methods for the events they record.
+
+    Hooks are called synchronously on the thread which sends the request. An
+    exception raised by a hook is logged and otherwise ignored.
+    """
+
+    def on_request_start(self, request: RequestInfo) -> None:
+        """
+        Called before the first attempt to send a request.
+
+        :param request: The request
+        """
+
+    def on_attempt(self, request: RequestInfo, attempt: AttemptInfo) -> None:
+        """
+        Called after each attempt to send a request, successful or not.
+
+        :param request: The request
+        :param attempt: The outcome of the attempt
+        """
+
+    def on_retry_sleep(
+        self, request: RequestInfo, attempt: AttemptInfo, sleep: float
+    ) -> None:
+        """
+        Called before sleeping between an attempt and its retry.
+
+        :param request: The request
+        :param attempt: The attempt which will be retried
+        :param sleep: The number of seconds to sleep
+        """
+
+    def on_request_end(
+        self,
+        request: RequestInfo,
+        response: requests.Response | None,
+        exception: Exception | None,
+    ) -> None:
+        """
+        Called when a request is done, with the response which will be returned or the
+        error which will be raised.
+
+        :param request: The request
+        :param response: The final response, if any
+        :param exception: The error raised, if any
+        """
+
+
+class _RequestHooks:
+    """
+    Calls a list of hooks for one request, isolating the request from any errors
+    they raise. When there are no hooks, every method does nothing.
+    """
+
+    def __init__(
+        self,
+        hooks: t.Sequence[TransportHooks],
+        method: str,
+        url: str,
+        req: requests.Request,
+    ) -> None:
+        self.hooks = hooks
+        self.request: RequestInfo | None = None
+        if hooks:
+            body = req.prepare().body
+            self.request = RequestInfo(method, url, _body_size(body))
+
+    def _call(self, event: str, *args: t.Any) -> None:
+        for hook in self.hooks:
+            try:
+                getattr(hook, event)(self.request, *args)
+            except Exception:  # pylint: disable=broad-except
+                log.exception("transport hook %r failed in %s", hook, event)
+
+    def start(self) -> None:
+        if self.request is not None:
+            self._call("on_request_start")
+
+    def attempt(
+        self,
+        attempt: int,
+        started: float,
+        response: requests.Response | None,
+        exception: Exception | None,
+    ) -> AttemptInfo | None:
+        if self.request is None:
+            return None
+        info = AttemptInfo(attempt, time.perf_counter() - started, response, exception)
+        self._call("on_attempt", info)
+        return info
+
+    def retry_sleep(self, attempt: AttemptInfo | None, sleep: float) -> None:
+        if self.request is not None and attempt is not None:
+            self._call("on_retry_sleep", attempt, sleep)
+
+    def end(
+        self, response: requests.Response | None, exception: Exception | None
+    ) -> None:
+        if self.request is not None:
+            self._call("on_request_end", response, exception)
+
+
+def _import_optional(module: str, package: str, adapter: str) -> t.Any:
+    try:
+        return importlib.import_module(module)
+    except ImportError as err:
+        raise ImportError(
+            f"The '{package}' package is required in order to use {adapter}. "
+            f"Install it with 'pip install {package}'."
+        ) from err
+
+
+class PrometheusHooks(TransportHooks):
+    """
+    Hooks which record Prometheus metrics with ``prometheus_client``. The metrics are
+    labelled by ``method``, ``host``, and ``path`` (the templated path), and are:
+
+    - ``<prefix>_requests_total``, a counter of requests, also labelled by final
+      ``status`` (``"error"`` if an error was raised)
+    - ``<prefix>_request_duration_seconds``, a histogram of total request time,
+      including retries
+    - ``<prefix>_attempt_duration_seconds``, a histogram of the time taken by each
+      attempt
+    - ``<prefix>_retries_total``, a counter of retries, also labelled by ``reason``
+    - ``<prefix>_request_bytes_total`` and ``<prefix>_response_bytes_total``,
+      counters of body sizes
+
+    :param registry: The registry to add the metrics to. Defaults to the default
+        ``prometheus_client`` registry.
+    :param prefix: A prefix for the metric names
+    :type prefix: str
+    """
+
+    def __init__(self, registry: t.Any = None, *, prefix: str = "globus_sdk") -> None:
+        prometheus_client = _import_optional(
+            "prometheus_client", "prometheus-client", "PrometheusHooks"
+        )
+        kwargs = {} if registry is None else {"registry": registry}
+        labels = ("method", "host", "path")
+        self.requests = prometheus_client.Counter(
+            f"{prefix}_requests",
+            "Requests sent by the Globus SDK",
+            (*labels, "status"),
+            **kwargs,
+        )
+        self.request_duration = prometheus_client.Histogram(
+            f"{prefix}_request_duration_seconds",
+            "Total time taken by Globus SDK requests, including retries",
+            labels,
+            **kwargs,
+        )
+        self.attempt_duration = prometheus_client.Histogram(
+            f"{prefix}_attempt_duration_seconds",
+            "Time taken by each attempt to send a Globus SDK request",
+            labels,
+            **kwargs,
+        )
+        self.retries = prometheus_client.Counter(
+            f"{prefix}_retries",
+            "Retries of Globus SDK requests",
+            (*labels, "reason"),
+            **kwargs,
+        )
+        self.request_bytes = prometheus_client.Counter(
+            f"{prefix}_request_bytes",
+            "Size of Globus SDK request bodies",
+            labels,
+            **kwargs,
+        )
+        self.response_bytes = prometheus_client.Counter(
+            f"{prefix}_response_bytes",
+            "Size of Globus SDK response bodies",
+            labels,
+            **kwargs,
+        )
+
+    @staticmethod
+    def _labels(request: RequestInfo) -> tuple[str, str, str]:
+        return (request.method, request.host, request.path_template)
+
+    def on_attempt(self, request: RequestInfo, attempt: AttemptInfo) -> None:
+        labels = self._labels(request)
+        self.attempt_duration.labels(*labels).observe(attempt.duration)
+        self.request_bytes.labels(*labels).inc(request.bytes_sent)
+        self.response_bytes.labels(*labels).inc(attempt.bytes_received)
+
+    def on_retry_sleep(
+        self, request: RequestInfo, attempt: AttemptInfo, sleep: float
+    ) -> None:
+        self.retries.labels(*self._labels(request), retry_reason(attempt)).inc()
+
+    def on_request_end(
+        self,
+        request: RequestInfo,
+        response: requests.Response | None,
+        exception: Exception | None,
+    ) -> None:
+        labels = self._labels(request)
+        status = str(response.status_code) if response is not None else "error"
+        self.requests.labels(*labels, status).inc()
+        self.request_duration.labels(*labels).observe(
+            time.perf_counter() - request.start_time
+        )
+
+
+class OpenTelemetryHooks(TransportHooks):
+    """
+    Hooks which record an OpenTelemetry span for each request, using
+    ``opentelemetry-api``. The span is a child of the current span. Each attempt
+    and retry sleep is recorded as an event on the span.
+
+    :param tracer: The tracer to create spans with. Defaults to a tracer for
+        ``globus_sdk`` from the global tracer provider.
+    """
+
+    def __init__(self, tracer: t.Any = None) -> None:
+        self._trace = _import_optional(
+            "opentelemetry.trace", "opentelemetry-api", "OpenTelemetryHooks"
+        )
+        self.tracer = tracer if tracer is not None else self._trace.get_tracer(__name__)
+
+    def on_request_start(self, request: RequestInfo) -> None:
+        request.hook_data[self] = self.tracer.start_span(
+            f"{request.method} {request.path_template}",
+            kind=self._trace.SpanKind.CLIENT,
+            attributes={
+                "http.request.method": request.method,
+                "url.full": request.url,
+                "server.address": urllib.parse.urlsplit(request.url).hostname or "",
+                "url.template": request.path_template,
+                "http.request.body.size": request.bytes_sent,
+            },
+        )
+
+    def on_attempt(self, request: RequestInfo, attempt: AttemptInfo) -> None:
+        span = request.hook_data.get(self)
+        if span is None:
+            return
+        attributes: dict[str, t.Any] = {
+            "attempt": attempt.attempt,
+            "duration_seconds": attempt.duration,
+            "http.response.body.size": attempt.bytes_received,
+        }
+        if attempt.status is not None:
+            attributes["http.response.status_code"] = attempt.status
+        if attempt.exception is not None:
+            attributes["error.type"] = type(attempt.exception).__name__
+        span.add_event("attempt", attributes)
+
+    def on_retry_sleep(
+        self, request: RequestInfo, attempt: AttemptInfo, sleep: float
+    ) -> None:
+        span = request.hook_data.get(self)
+        if span is not None:
+            span.add_event(
+                "retry", {"reason": retry_reason(attempt), "sleep_seconds": sleep}
+            )
+
+    def on_request_end(
+        self,
+        request: RequestInfo,
+        response: requests.Response | None,
+        exception: Exception | None,
+    ) -> None:
+        span = request.hook_data.pop(self, None)
+        if span is None:
+            return
+        if response is not None:
+            span.set_attribute("http.response.status_code", response.status_code)
+            if response.status_code >= 400:
+                span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+        if exception is not None:
+            span.record_exception(exception)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+        span.end()
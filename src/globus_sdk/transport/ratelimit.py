@@ -0,0 +1,286 @@
+"""
+Client-side rate limiting for the RequestsTransport.
+
+Requests are limited with a token bucket per host. Buckets adapt to the service:
+when a response indicates that requests are being sent too quickly, the rate of the
+bucket is halved, and it then recovers gradually over time.
+
+Bucket state is held by a backend. The default backend keeps state in memory and
+shares it between threads. The SQLite backend keeps state in a database file, which
+lets several processes on a host share the same buckets.
+"""
+from __future__ import annotations
+
+import abc
+import logging
+import os
+import pathlib
+import sqlite3
+import threading
+import time
+import typing as t
+import urllib.parse
+
+import requests
+
+log = logging.getLogger(__name__)
+
+T = t.TypeVar("T")
+
+
+class BucketState(t.NamedTuple):
+    """
+    The state of a token bucket.
+
+    :ivar tokens: The number of tokens available. This is negative when requests
+        have reserved tokens which are not yet available.
+    :ivar rate: The current rate, in tokens per second
+    :ivar updated_at: The time at which ``tokens`` was computed
+    :ivar blocked_until: A time before which no request may be sent
+    """
+
+    tokens: float
+    rate: float
+    updated_at: float
+    blocked_until: float
+
+
+class RateLimitBackend(abc.ABC):
+    """
+    A store of token bucket states. Backends must apply each update atomically.
+    """
+
+    @abc.abstractmethod
+    def update(
+        self,
+        key: str,
+        func: t.Callable[[BucketState | None], tuple[BucketState, T]],
+    ) -> T:
+        """
+        Atomically replace the state of a bucket with the state computed by ``func``,
+        and return the other result of ``func``.
+
+        :param key: The name of the bucket
+        :param func: A function which receives the current state of the bucket, or
+            ``None`` if it has none, and returns the new state and a result
+        """
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """
+    A backend which holds bucket states in memory, shared by all threads which use
+    it.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._states: dict[str, BucketState] = {}
+
+    def update(
+        self,
+        key: str,
+        func: t.Callable[[BucketState | None], tuple[BucketState, T]],
+    ) -> T:
+        with self._lock:
+            state, result = func(self._states.get(key))
+            self._states[key] = state
+        return result
+
+
+class SQLiteRateLimitBackend(RateLimitBackend):
+    """
+    A backend which holds bucket states in an SQLite database, so that processes
+    using the same file share the same buckets.
+
+    :param dbname: The path to the database file, which is created if it does not
+        exist
+    :type dbname: str or pathlib.Path
+    :param timeout: The number of seconds to wait for another process to release the
+        database
+    :type timeout: float
+    """
+
+    def __init__(self, dbname: str | pathlib.Path, *, timeout: float = 10) -> None:
+        self.dbname = os.fspath(dbname)
+        self._lock = threading.Lock()
+        # transactions are managed explicitly, so that updates lock the database
+        # before reading
+        self._connection = sqlite3.connect(
+            self.dbname, timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute(
+            """
+CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+    key VARCHAR NOT NULL PRIMARY KEY,
+    tokens REAL NOT NULL,
+    rate REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    blocked_until REAL NOT NULL
+)
+"""
+        )
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+        self._connection.close()
+
+    def update(
+        self,
+        key: str,
+        func: t.Callable[[BucketState | None], tuple[BucketState, T]],
+    ) -> T:
+        with self._lock:
+            conn = self._connection
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT tokens, rate, updated_at, blocked_until "
+                    "FROM rate_limit_buckets WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                state, result = func(BucketState(*row) if row else None)
+                conn.execute(
+                    "REPLACE INTO rate_limit_buckets "
+                    "(key, tokens, rate, updated_at, blocked_until) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, *state),
+                )
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        return result
+
+
+def _parse_retry_after(response: requests.Response) -> float | None:
+    try:
+        return max(float(response.headers["Retry-After"]), 0)
+    except (KeyError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """
+    A rate limiter for use with a ``RequestsTransport``, which holds a token bucket
+    for each host that requests are sent to.
+
+    Each request takes a token from the bucket for its host, waiting until one is
+    available. Tokens are added at ``rate`` per second, up to ``capacity``, which
+    sets the size of the burst allowed after a quiet period.
+
+    When a host responds with a ``429``, or with a ``503`` which has a
+    ``Retry-After`` header, the rate of its bucket is halved (but not below
+    ``min_rate``) and no requests are sent to it until the ``Retry-After`` time has
+    passed. The rate then recovers steadily, regaining the configured rate over
+    ``RECOVERY_SECONDS``.
+
+    :param rate: The number of requests per second allowed to each host
+    :type rate: float
+    :param capacity: The maximum number of tokens in a bucket. Defaults to ``rate``,
+        or to one if ``rate`` is lower.
+    :type capacity: float, optional
+    :param rate_by_host: A mapping of hostnames to rates, overriding ``rate`` for
+        those hosts
+    :type rate_by_host: dict of str to float, optional
+    :param min_rate: The lowest rate to which a bucket may be reduced. Defaults to a
+        tenth of the configured rate of the bucket.
+    :type min_rate: float, optional
+    :param backend: The store of bucket states. Defaults to a new
+        ``MemoryRateLimitBackend``.
+    :type backend: RateLimitBackend, optional
+    """
+
+    #: the factor applied to the rate of a bucket when it is rate limited
+    DECREASE_FACTOR = 0.5
+    #: the number of seconds over which a bucket recovers from a rate of zero to its
+    #: configured rate
+    RECOVERY_SECONDS = 60.0
+
+    def __init__(
+        self,
+        rate: float,
+        *,
+        capacity: float | None = None,
+        rate_by_host: dict[str, float] | None = None,
+        min_rate: float | None = None,
+        backend: RateLimitBackend | None = None,
+    ) -> None:
+        if rate <= 0 or any(r <= 0 for r in (rate_by_host or {}).values()):
+            raise ValueError("RateLimiter rates must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self.rate_by_host = dict(rate_by_host or {})
+        self.min_rate = min_rate
+        self.backend = backend if backend is not None else MemoryRateLimitBackend()
+
+    def _bucket_settings(self, url: str) -> tuple[str, float, float, float]:
+        parsed = urllib.parse.urlsplit(url)
+        host = parsed.hostname or ""
+        rate = self.rate_by_host.get(host, self.rate)
+        capacity = self.capacity if self.capacity is not None else max(rate, 1)
+        min_rate = self.min_rate if self.min_rate is not None else rate / 10
+        return f"{parsed.scheme}://{parsed.netloc}", rate, capacity, min(min_rate, rate)
+
+    def _refill(
+        self, state: BucketState | None, now: float, rate: float, capacity: float
+    ) -> BucketState:
+        if state is None:
+            return BucketState(capacity, rate, now, 0)
+        elapsed = max(now - state.updated_at, 0)
+        tokens = min(state.tokens + elapsed * state.rate, capacity)
+        new_rate = min(state.rate + elapsed * rate / self.RECOVERY_SECONDS, rate)
+        return BucketState(tokens, new_rate, now, state.blocked_until)
+
+    def acquire(self, url: str) -> float:
+        """
+        Take a token for a request, and get the number of seconds to wait before
+        sending it.
+
+        :param url: The URL of the request
+        """
+        key, rate, capacity, _ = self._bucket_settings(url)
+
+        def reserve(state: BucketState | None) -> tuple[BucketState, float]:
+            now = time.time()
+            tokens, current_rate, _, blocked_until = self._refill(
+                state, now, rate, capacity
+            )
+            tokens -= 1
+            wait = max(-tokens / current_rate, blocked_until - now, 0)
+            return BucketState(tokens, current_rate, now, blocked_until), wait
+
+        delay = self.backend.update(key, reserve)
+        if delay:
+            log.debug("rate limiter delaying request to %s by %.3fs", key, delay)
+        return delay
+
+    def record_response(self, url: str, response: requests.Response) -> None:
+        """
+        Reduce the rate for a host if a response indicates that it is rate limiting
+        requests.
+
+        :param url: The URL of the request
+        :param response: The response received
+        """
+        key, rate, capacity, min_rate = self._bucket_settings(url)
+        retry_after = _parse_retry_after(response)
+
+        if not (
+            response.status_code == 429
+            or (response.status_code == 503 and retry_after is not None)
+        ):
+            return
+
+        def slow_down(state: BucketState | None) -> tuple[BucketState, None]:
+            now = time.time()
+            tokens, current_rate, _, blocked_until = self._refill(
+                state, now, rate, capacity
+            )
+            new_rate = max(current_rate * self.DECREASE_FACTOR, min_rate)
+            log.info("rate limited by %s, reducing rate to %.3f/s", key, new_rate)
+            blocked_until = max(blocked_until, now + (retry_after or 0))
+            return BucketState(min(tokens, 0), new_rate, now, blocked_until), None
+
+        self.backend.update(key, slow_down)
@@ -3,6 +3,7 @@ from __future__ import annotations
 import contextlib
 import logging
 import random
+import threading
 import time
 import typing as t
 
@@ -11,13 +12,20 @@ import requests
 from globus_sdk import config, exc
 from globus_sdk.authorizers import GlobusAuthorizer
 from globus_sdk.transport.encoders import (
+    CompressedJSONRequestEncoder,
     FormRequestEncoder,
     JSONRequestEncoder,
     RequestEncoder,
 )
 from globus_sdk.version import __version__
 
+from ._pool import create_session, get_pool_stats
+from .caching import ResponseCache, _CacheEntry
+from .circuit_breaker import CircuitBreaker, _host_of
+from .hooks import TransportHooks, _RequestHooks
+from .ratelimit import RateLimiter
 from .retry import (
+    RetryBudget,
     RetryCheck,
     RetryCheckFlags,
     RetryCheckResult,
@@ -28,6 +36,28 @@ from .retry import (
 
 log = logging.getLogger(__name__)
 
+# guards the creation of sessions by transports, which is rare enough that a single
+# lock is shared by all transports
+_SESSION_CREATION_LOCK = threading.Lock()
+
+
+class _SendStep(t.NamedTuple):
+    """A step of the retry loop: send one attempt of the request."""
+
+    prepared: requests.PreparedRequest
+    timeout: float | None
+
+
+class _SleepStep(t.NamedTuple):
+    """A step of the retry loop: wait before continuing."""
+
+    seconds: float
+
+
+# what is sent back into the retry loop after a step: the response or error of a send,
+# or None after a sleep
+_StepOutcome = t.Union[requests.Response, requests.RequestException, None]
+
 
 def _parse_retry_after(response: requests.Response) -> int | None:
     val = response.headers.get("Retry-After")
@@ -87,6 +117,54 @@ class RequestsTransport:
     :type max_sleep: float or int, optional
     :param max_retries: The maximum number of retries allowed by this transport
     :type max_retries: int, optional
+    :param pool_connections: The number of per-host connection pools to keep.
+        Defaults to 10
+    :type pool_connections: int, optional
+    :param pool_maxsize: The maximum number of connections to keep open in each
+        per-host pool. This should be at least the number of threads which share the
+        transport. Defaults to 10
+    :type pool_maxsize: int, optional
+    :param pool_block: When a pool has no free connection, wait for one to be
+        returned instead of opening a new connection which is discarded after use.
+        Defaults to ``False``
+    :type pool_block: bool, optional
+    :param pool_maxsize_by_host: A mapping of hostnames to pool sizes, which overrides
+        ``pool_maxsize`` for those hosts
+    :type pool_maxsize_by_host: dict of str to int, optional
+    :param tcp_keepalive_interval: Enable TCP keepalive on pooled connections, with
+        keepalive probes sent after this many seconds of idleness (on platforms which
+        support it). This keeps idle connections from being dropped by firewalls and
+        load balancers. Disabled by default
+    :type tcp_keepalive_interval: int, optional
+    :param session: A ``requests.Session`` to send requests with, in place of a new
+        session. Transports which share a session share its connection pools, so
+        passing the same session to many clients avoids opening separate
+        connections for each client. See
+        :func:`create_session <globus_sdk.transport.create_session>`. This may not be
+        combined with the connection pool settings above
+    :type session: requests.Session, optional
+    :param response_cache: A cache for ``GET`` responses, which reuses fresh responses
+        and revalidates stale ones with conditional requests. By default, responses
+        are not cached. A cache may be shared by several transports
+    :type response_cache: ResponseCache, optional
+    :param rate_limiter: A rate limiter which delays requests so that each host is
+        sent requests no faster than a configured rate. A limiter may be shared by
+        several transports
+    :type rate_limiter: RateLimiter, optional
+    :param circuit_breaker: A circuit breaker which stops requests to a host, and
+        stops retries, after too many requests to the host have failed. Its check is
+        registered as the first retry check of the transport
+    :type circuit_breaker: CircuitBreaker, optional
+    :param deadline: The maximum number of seconds that a request may take, including
+        all retries and the sleeps between them. Each attempt is given at most the
+        time remaining as its timeout, and no retry is made which could not start
+        before the deadline. By default, there is no deadline
+    :type deadline: float, optional
+    :param retry_budget: A budget which limits retries to a fraction of requests
+        sent. A budget may be shared by several transports
+    :type retry_budget: RetryBudget, optional
+    :param hooks: Instrumentation hooks which are called as requests are sent
+    :type hooks: list of TransportHooks, optional
     """
 
     #: default maximum number of retries
@@ -104,6 +182,8 @@ class RequestsTransport:
         "text": RequestEncoder(),
         "json": JSONRequestEncoder(),
         "form": FormRequestEncoder(),
+        "json+gzip": CompressedJSONRequestEncoder("gzip"),
+        "json+deflate": CompressedJSONRequestEncoder("deflate"),
     }
 
     BASE_USER_AGENT = f"globus-sdk-py-{__version__}"
@@ -116,10 +196,46 @@ class RequestsTransport:
         retry_checks: list[RetryCheck] | None = None,
         max_sleep: float | int = 10,
         max_retries: int | None = None,
+        pool_connections: int | None = None,
+        pool_maxsize: int | None = None,
+        pool_block: bool | None = None,
+        pool_maxsize_by_host: dict[str, int] | None = None,
+        tcp_keepalive_interval: int | None = None,
+        session: requests.Session | None = None,
+        response_cache: ResponseCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        deadline: float | None = None,
+        retry_budget: RetryBudget | None = None,
+        hooks: t.Sequence[TransportHooks] | None = None,
     ):
-        self.session = requests.Session()
+        pool_params: dict[str, t.Any] = {
+            k: v
+            for k, v in (
+                ("pool_connections", pool_connections),
+                ("pool_maxsize", pool_maxsize),
+                ("pool_block", pool_block),
+                ("pool_maxsize_by_host", pool_maxsize_by_host),
+                ("tcp_keepalive_interval", tcp_keepalive_interval),
+            )
+            if v is not None
+        }
+        if session is not None:
+            if pool_params:
+                raise exc.GlobusSDKUsageError(
+                    "A RequestsTransport cannot be given both a session and "
+                    f"connection pool settings ({', '.join(pool_params)}). "
+                    "Configure the pools of the session instead."
+                )
+        # the session is created when it is first used, so that transports which
+        # send requests with another HTTP client do not open connection pools
+        self._session = session
+        self._pool_params = pool_params
         self.verify_ssl = config.get_ssl_verify(verify_ssl)
         self.http_timeout = config.get_http_timeout(http_timeout)
+        self.response_cache = response_cache
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
         self._user_agent = self.BASE_USER_AGENT
 
         # retry parameters
@@ -128,9 +244,31 @@ class RequestsTransport:
         self.max_retries = (
             max_retries if max_retries is not None else self.DEFAULT_MAX_RETRIES
         )
+        self.deadline = deadline
+        self.retry_budget = retry_budget
+        self.hooks: list[TransportHooks] = list(hooks or [])
         self.retry_checks = list(retry_checks if retry_checks else [])  # copy
         # register internal checks
         self.register_default_retry_checks()
+        if circuit_breaker is not None:
+            # the breaker must see the outcome of every attempt, so it runs first
+            self.retry_checks.insert(0, circuit_breaker.check)
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        The ``requests.Session`` used to send requests. Unless a session was given to
+        the transport, it is created when it is first used.
+        """
+        if self._session is None:
+            with _SESSION_CREATION_LOCK:
+                if self._session is None:
+                    self._session = create_session(**self._pool_params)
+        return self._session
+
+    @session.setter
+    def session(self, value: requests.Session) -> None:
+        self._session = value
 
     @property
     def user_agent(self) -> str:
@@ -140,6 +278,24 @@ class RequestsTransport:
     def user_agent(self, value: str) -> None:
         self._user_agent = f"{self.BASE_USER_AGENT}/{value}"
 
+    def get_pool_stats(self) -> dict[str, dict[str, int]]:
+        """
+        Get utilisation statistics for the connection pools of this transport, which
+        can be used to choose pool sizes. The result maps each pool, identified as
+        ``"scheme://host:port"``, to a dict with the following keys:
+
+        - ``maxsize``: the maximum number of connections kept in the pool
+        - ``in_use``: the number of connections currently checked out of the pool
+        - ``idle``: the number of open connections waiting in the pool
+        - ``num_connections``: the total number of connections opened by the pool
+        - ``num_requests``: the total number of requests sent through the pool
+
+        If ``num_connections`` grows much faster than ``maxsize``, connections are
+        being discarded because the pool is too small for the number of concurrent
+        requests.
+        """
+        return get_pool_stats(self.session)
+
     @property
     def _headers(self) -> dict[str, str]:
         return {"Accept": "application/json", "User-Agent": self.user_agent}
@@ -153,6 +309,7 @@ class RequestsTransport:
         retry_backoff: t.Callable[[RetryContext], float] | None = None,
         max_sleep: float | int | None = None,
         max_retries: int | None = None,
+        deadline: float | None = None,
     ) -> t.Iterator[None]:
         """
         Temporarily adjust some of the request sending settings of the transport.
@@ -175,6 +332,9 @@ class RequestsTransport:
         :type max_sleep: float or int, optional
         :param max_retries: The maximum number of retries allowed by this transport
         :type max_retries: int, optional
+        :param deadline: The maximum number of seconds that a request may take,
+            including retries
+        :type deadline: float, optional
 
         **Examples**
 
@@ -192,6 +352,13 @@ class RequestsTransport:
         >>> client = ...  # any client class
         >>> with client.transport.tune(max_retries=0):
         >>>     foo = client.get_foo()
+
+        or to ensure that a call completes or fails within 30 seconds, however many
+        retries it needs:
+
+        >>> client = ...  # any client class
+        >>> with client.transport.tune(deadline=30):
+        >>>     foo = client.get_foo()
         """
         saved_settings = (
             self.verify_ssl,
@@ -199,6 +366,7 @@ class RequestsTransport:
             self.retry_backoff,
             self.max_sleep,
             self.max_retries,
+            self.deadline,
         )
         if verify_ssl is not None:
             self.verify_ssl = verify_ssl
@@ -210,6 +378,8 @@ class RequestsTransport:
             self.max_sleep = max_sleep
         if max_retries is not None:
             self.max_retries = max_retries
+        if deadline is not None:
+            self.deadline = deadline
         yield
         (
             self.verify_ssl,
@@ -217,6 +387,7 @@ class RequestsTransport:
             self.retry_backoff,
             self.max_sleep,
             self.max_retries,
+            self.deadline,
         ) = saved_settings
 
     def _encode(
@@ -265,9 +436,48 @@ class RequestsTransport:
             retries which may already have been attempted.
         :type ctx: RetryContext
         """
+        time.sleep(self._retry_sleep_period(ctx))
+
+    def _retry_sleep_period(self, ctx: RetryContext) -> float:
         sleep_period = min(self.retry_backoff(ctx), self.max_sleep)
         log.info("request retry_sleep(%s) [max=%s]", sleep_period, self.max_sleep)
-        time.sleep(sleep_period)
+        return sleep_period
+
+    def _get_expiry(self, deadline: float | None) -> float | None:
+        """
+        Get the ``time.monotonic()`` value at which a request starting now must end.
+        """
+        if deadline is None:
+            deadline = self.deadline
+        if deadline is None:
+            return None
+        return time.monotonic() + deadline
+
+    def _attempt_timeout(self, expires_at: float | None) -> float | None:
+        if expires_at is None:
+            return self.http_timeout
+        remaining = max(expires_at - time.monotonic(), 0)
+        if self.http_timeout is None:
+            return remaining
+        return min(self.http_timeout, remaining)
+
+    def _retry_allowed(self, ctx: RetryContext, expires_at: float | None) -> bool:
+        """
+        Check a retry which the retry checks have requested against the deadline and
+        the retry budget, and take it from the budget if it is allowed.
+
+        The backoff for the retry is computed here, and saved on the context as
+        ``ctx.backoff`` so that the sleep before the retry uses the same value.
+        """
+        if expires_at is not None:
+            ctx.backoff = min(self.retry_backoff(ctx), self.max_sleep)
+            if time.monotonic() + ctx.backoff >= expires_at:
+                log.info("request deadline would pass before retry, not retrying")
+                return False
+        if self.retry_budget is not None and not self.retry_budget.try_retry():
+            log.info("retry budget exhausted, not retrying")
+            return False
+        return True
 
     def request(
         self,
@@ -280,6 +490,7 @@ class RequestsTransport:
         authorizer: GlobusAuthorizer | None = None,
         allow_redirects: bool = True,
         stream: bool = False,
+        deadline: float | None = None,
     ) -> requests.Response:
         """
         Send an HTTP request
@@ -308,13 +519,95 @@ class RequestsTransport:
         :param stream: Do not immediately download the response content. Defaults to
             ``False``
         :type stream: bool
+        :param deadline: The maximum number of seconds that the request may take,
+            including retries. Defaults to the ``deadline`` of the transport
+        :type deadline: float, optional
 
         :return: ``requests.Response`` object
         """
         log.debug("starting request for %s", url)
-        resp: requests.Response | None = None
         req = self._encode(method, url, query_params, data, headers, encoding)
+        hooks = _RequestHooks(self.hooks, method, url, req)
+        hooks.start()
+        try:
+            resp = self._send_with_retries(
+                req,
+                url,
+                authorizer=authorizer,
+                allow_redirects=allow_redirects,
+                stream=stream,
+                deadline=deadline,
+                hooks=hooks,
+            )
+        except Exception as err:
+            hooks.end(None, err)
+            raise
+        hooks.end(resp, None)
+        return resp
+
+    def _send_with_retries(
+        self,
+        req: requests.Request,
+        url: str,
+        *,
+        authorizer: GlobusAuthorizer | None,
+        allow_redirects: bool,
+        stream: bool,
+        deadline: float | None,
+        hooks: _RequestHooks,
+    ) -> requests.Response:
+        steps = self._retry_steps(
+            req,
+            url,
+            authorizer=authorizer,
+            stream=stream,
+            deadline=deadline,
+            hooks=hooks,
+        )
+        outcome: _StepOutcome = None
+        while True:
+            try:
+                step = steps.send(outcome)
+            except StopIteration as stop:
+                return t.cast(requests.Response, stop.value)
+            if isinstance(step, _SleepStep):
+                time.sleep(step.seconds)
+                outcome = None
+                continue
+            try:
+                outcome = self._send(
+                    step.prepared,
+                    timeout=step.timeout,
+                    allow_redirects=allow_redirects,
+                    stream=stream,
+                )
+            except requests.RequestException as err:
+                outcome = err
+
+    def _retry_steps(
+        self,
+        req: requests.Request,
+        url: str,
+        *,
+        authorizer: GlobusAuthorizer | None,
+        stream: bool,
+        deadline: float | None,
+        hooks: _RequestHooks,
+    ) -> t.Generator[_SendStep | _SleepStep, _StepOutcome, requests.Response]:
+        """
+        The retry loop for a request, shared by the synchronous and asynchronous
+        transports.
+
+        This generator yields the sends and sleeps which the request needs, and the
+        caller performs them. The response or ``RequestException`` from each send is
+        sent back into the generator, as is ``None`` after each sleep. The final
+        response is the return value of the generator.
+        """
+        resp: requests.Response | None = None
+        # the error of the last attempt, if it did not get a response
+        last_error: requests.RequestException | None = None
         checker = RetryCheckRunner(self.retry_checks)
+        expires_at = self._get_expiry(deadline)
         log.debug("transport request state initialized")
         for attempt in range(self.max_retries + 1):
             log.debug("transport request retry cycle. attempt=%d", attempt)
@@ -323,39 +616,140 @@ class RequestsTransport:
             # done fresh for each request, to handle potential for refreshed credentials
             self._set_authz_header(authorizer, req)
 
-            ctx = RetryContext(attempt, authorizer=authorizer)
-            try:
-                log.debug("request about to send")
-                resp = ctx.response = self.session.send(
-                    req.prepare(),
-                    timeout=self.http_timeout,
-                    verify=self.verify_ssl,
-                    allow_redirects=allow_redirects,
-                    stream=stream,
+            prepared = req.prepare()
+            cache_entry = None
+            if self.response_cache is not None and not stream:
+                cache_entry = self.response_cache.lookup(prepared)
+                if cache_entry is not None:
+                    if cache_entry.is_fresh:
+                        log.info("request done (fresh response from cache)")
+                        return self.response_cache.cached(cache_entry, prepared)
+                    self.response_cache.add_validators(cache_entry, prepared)
+
+            if self.circuit_breaker is not None and (
+                not self.circuit_breaker.allow_request(url)
+            ):
+                log.warning("request done (fail, circuit open)")
+                raise exc.GlobusCircuitOpenError(
+                    _host_of(url), self.circuit_breaker.retry_at(url)
                 )
-            except requests.RequestException as err:
+
+            if self.rate_limiter is not None:
+                delay = self.rate_limiter.acquire(url)
+                if delay > 0:
+                    if expires_at is not None and (
+                        time.monotonic() + delay >= expires_at
+                    ):
+                        log.warning("request done (rate limit delay passes deadline)")
+                        return self._deadline_exceeded(resp, last_error)
+                    yield _SleepStep(delay)
+
+            timeout = self._attempt_timeout(expires_at)
+            if timeout is not None and timeout <= 0:
+                log.warning("request done (deadline passed before send)")
+                return self._deadline_exceeded(resp, last_error)
+
+            ctx = RetryContext(attempt, authorizer=authorizer)
+            if attempt == 0 and self.retry_budget is not None:
+                self.retry_budget.record_request()
+            started = time.perf_counter()
+            log.debug("request about to send")
+            outcome = yield _SendStep(prepared, timeout)
+            if isinstance(outcome, requests.RequestException):
                 log.debug("request hit error (RequestException)")
-                ctx.exception = err
-                if attempt >= self.max_retries or not checker.should_retry(ctx):
+                last_error = ctx.exception = outcome
+                attempt_info = hooks.attempt(attempt, started, None, outcome)
+                # run the checks even on the last attempt, so that every error is
+                # seen by checks which record outcomes
+                if (
+                    not checker.should_retry(ctx)
+                    or attempt >= self.max_retries
+                    or not self._retry_allowed(ctx, expires_at)
+                ):
                     log.warning("request done (fail, error)")
-                    raise exc.convert_request_exception(err)
+                    raise exc.convert_request_exception(outcome)
                 log.debug("request may retry (should-retry=true)")
             else:
+                resp = ctx.response = t.cast(requests.Response, outcome)
+                last_error = None
+                attempt_info = hooks.attempt(attempt, started, resp, None)
+                if self.rate_limiter is not None:
+                    self.rate_limiter.record_response(url, resp)
                 log.debug("request success, still check should-retry")
                 if not checker.should_retry(ctx):
                     log.info("request done (success)")
+                    if self.response_cache is not None and not stream:
+                        resp = self._apply_response_cache(cache_entry, resp)
                     return resp
                 log.debug("request may retry, will check attempts")
+                if attempt < self.max_retries and not self._retry_allowed(
+                    ctx, expires_at
+                ):
+                    log.warning("request done (fail, response, retry not allowed)")
+                    return resp
 
             # the request will be retried, so sleep...
             if attempt < self.max_retries:
                 log.debug("under attempt limit, will sleep")
-                self._retry_sleep(ctx)
+                sleep_period = self._retry_sleep_period(ctx)
+                hooks.retry_sleep(attempt_info, sleep_period)
+                yield _SleepStep(sleep_period)
         if resp is None:
             raise ValueError("Somehow, retries ended without a response")
         log.warning("request reached max retries, done (fail, response)")
         return resp
 
+    def _deadline_exceeded(
+        self,
+        resp: requests.Response | None,
+        last_error: requests.RequestException | None,
+    ) -> requests.Response:
+        """
+        Finish a request whose deadline would pass before its next attempt could be
+        sent. As when a retry is refused, the outcome of the previous attempt is
+        returned or raised. If there was no previous attempt, a
+        ``GlobusTimeoutError`` is raised.
+        """
+        if last_error is not None:
+            raise exc.convert_request_exception(last_error)
+        if resp is not None:
+            return resp
+        raise exc.GlobusTimeoutError(
+            "Request deadline passed before the request could be sent",
+            requests.Timeout("request deadline exceeded"),
+        )
+
+    def _send(
+        self,
+        prepared: requests.PreparedRequest,
+        *,
+        timeout: float | None,
+        allow_redirects: bool,
+        stream: bool,
+    ) -> requests.Response:
+        """
+        Send a single attempt of a request. Subclasses which send requests with a
+        different HTTP client override this method.
+        """
+        return self.session.send(
+            prepared,
+            timeout=timeout,
+            verify=self.verify_ssl,
+            allow_redirects=allow_redirects,
+            stream=stream,
+        )
+
+    def _apply_response_cache(
+        self, cache_entry: _CacheEntry | None, resp: requests.Response
+    ) -> requests.Response:
+        if self.response_cache is None:
+            return resp
+        if cache_entry is not None and resp.status_code == 304:
+            log.info("response not modified, using cached response")
+            return self.response_cache.revalidated(cache_entry, resp)
+        self.response_cache.store(resp)
+        return resp
+
     # decorator which lets you add a check to a retry policy
     def register_retry_check(self, func: RetryCheck) -> RetryCheck:
         """
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import collections
 import enum
 import logging
+import math
+import threading
+import time
 import typing as t
 
 import requests
@@ -152,3 +156,88 @@ class RetryCheckRunner:
 
         # fallthrough: don't retry any request which isn't marked for retry
         return False
+
+
+class RetryBudget:
+    """
+    A RetryBudget limits retries to a fraction of the requests sent, so that retries
+    cannot multiply the load on a service which is failing. A single budget is meant
+    to be shared by all of the transports in a process.
+
+    Over any ``window`` seconds, the number of retries allowed is ``ratio`` times
+    the number of requests sent, plus ``min_retries_per_second`` times ``window``
+    so that a process which sends few requests can still retry them. A retry which
+    would exceed the budget is not made, and the last response or error is returned
+    to the caller.
+
+    :param ratio: The number of retries allowed per request sent
+    :type ratio: float
+    :param min_retries_per_second: The number of retries allowed per second
+        regardless of the number of requests
+    :type min_retries_per_second: float
+    :param window: The number of seconds over which requests and retries are counted
+    :type window: int
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.1,
+        *,
+        min_retries_per_second: float = 1,
+        window: int = 10,
+    ) -> None:
+        if ratio < 0 or min_retries_per_second < 0 or window < 1:
+            raise ValueError(
+                "RetryBudget ratio and min_retries_per_second must not be negative, "
+                "and window must be at least 1"
+            )
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.window = window
+        self._lock = threading.Lock()
+        # [second, requests, retries] for each second with activity in the window
+        self._counts: collections.deque[list[int]] = collections.deque()
+
+    def _current_counts(self) -> list[int]:
+        now = math.floor(time.monotonic())
+        while self._counts and self._counts[0][0] <= now - self.window:
+            self._counts.popleft()
+        if not self._counts or self._counts[-1][0] != now:
+            self._counts.append([now, 0, 0])
+        return self._counts[-1]
+
+    def record_request(self) -> None:
+        """
+        Record that a request was sent, adding to the budget.
+        """
+        with self._lock:
+            self._current_counts()[1] += 1
+
+    def try_retry(self) -> bool:
+        """
+        Take a retry from the budget. Returns ``False``, and takes nothing, if the
+        budget is exhausted.
+        """
+        with self._lock:
+            counts = self._current_counts()
+            requests_sent = sum(c[1] for c in self._counts)
+            retries = sum(c[2] for c in self._counts)
+            allowed = (
+                self.ratio * requests_sent + self.min_retries_per_second * self.window
+            )
+            if retries + 1 > allowed:
+                log.debug("retry budget exhausted (%d retries)", retries)
+                return False
+            counts[2] += 1
+            return True
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get the numbers of ``requests`` and ``retries`` counted in the current window.
+        """
+        with self._lock:
+            self._current_counts()
+            return {
+                "requests": sum(c[1] for c in self._counts),
+                "retries": sum(c[2] for c in self._counts),
+            }
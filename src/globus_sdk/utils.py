@@ -154,6 +154,13 @@ class PayloadWrapper(PayloadWrapperBase):
         for k, v in kwargs.items():
             self._set_value(k, v, callback=int)
 
+    def _get_request_data(self) -> dict[str, t.Any]:
+        """
+        Get the dict to send when this payload is used as a request body. Payloads
+        which hold some of their data in another form may build the dict here.
+        """
+        return self.data
+
 
 def in_sphinx_build() -> bool:  # pragma: no cover
     # check if `sphinx-build` was used to invoke
@@ -1,6 +1,12 @@
+import gzip
+import json
+import zlib
+
 import pytest
 import responses
 
+from globus_sdk.transport import CompressedJSONRequestEncoder
+
 
 def test_cannot_encode_dict_as_text(client):
     with pytest.raises(TypeError):
@@ -25,3 +31,56 @@ def test_form_encoding_works(client):
 
     last_req = responses.calls[-1].request
     assert last_req.body == "baz=1"
+
+
+@pytest.mark.parametrize(
+    "encoding, decompress",
+    [("json+gzip", gzip.decompress), ("json+deflate", zlib.decompress)],
+)
+def test_compressed_json_encoding_compresses_large_bodies(client, encoding, decompress):
+    responses.add(responses.POST, "https://foo.api.globus.org/bar", body="hi")
+    data = {"DATA": [{"source_path": f"/~/file{i}.txt"} for i in range(1000)]}
+    client.post("/bar", data=data, encoding=encoding)
+
+    last_req = responses.calls[-1].request
+    assert last_req.headers["Content-Type"] == "application/json"
+    assert last_req.headers["Content-Encoding"] == encoding.split("+")[1]
+    assert int(last_req.headers["Content-Length"]) == len(last_req.body)
+    assert json.loads(decompress(last_req.body)) == data
+
+
+def test_compressed_json_encoding_skips_small_bodies(client):
+    responses.add(responses.POST, "https://foo.api.globus.org/bar", body="hi")
+    client.post("/bar", data={"baz": 1}, encoding="json+gzip")
+
+    last_req = responses.calls[-1].request
+    assert "Content-Encoding" not in last_req.headers
+    assert json.loads(last_req.body) == {"baz": 1}
+
+
+def test_compressed_json_encoder_can_replace_json_encoder(client):
+    responses.add(responses.POST, "https://foo.api.globus.org/bar", body="hi")
+    client.transport.encoders = {
+        **client.transport.encoders,
+        "json": CompressedJSONRequestEncoder(min_size=0),
+    }
+    client.post("/bar", data={"baz": 1})
+
+    last_req = responses.calls[-1].request
+    assert last_req.headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(last_req.body)) == {"baz": 1}
+
+
+def test_compressed_json_encoder_rejects_unknown_compression():
+    with pytest.raises(ValueError):
+        CompressedJSONRequestEncoder("br")
+
+
+def test_compressed_json_encoder_gzip_output_is_deterministic():
+    encoder = CompressedJSONRequestEncoder(min_size=0)
+    body = b'{"baz": 1}'
+    compressed = encoder.compress(body)
+    # the gzip header has no timestamp, so identical bodies compress identically
+    assert compressed[4:8] == b"\x00\x00\x00\x00"
+    assert encoder.compress(body) == compressed
+    assert gzip.decompress(compressed) == body
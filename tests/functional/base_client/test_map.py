@@ -0,0 +1,112 @@
+import threading
+
+import pytest
+import responses
+
+import globus_sdk
+from globus_sdk.client import MapResult
+
+BASE_URL = "https://foo.api.globus.org"
+
+
+def _add_items(count, fail=()):
+    for i in range(count):
+        if i in fail:
+            responses.add(
+                responses.GET,
+                f"{BASE_URL}/item/{i}",
+                status=404,
+                json={"code": "NotFound", "message": "no such item"},
+            )
+        else:
+            responses.add(responses.GET, f"{BASE_URL}/item/{i}", json={"id": i})
+
+
+def _get_item(client):
+    return lambda i: client.get(f"/item/{i}")
+
+
+def test_map_yields_results_in_order(client):
+    _add_items(20)
+
+    results = list(client.map(_get_item(client), range(20), concurrency=4))
+
+    assert [r.position for r in results] == list(range(20))
+    assert [r.item for r in results] == list(range(20))
+    assert [r.result["id"] for r in results] == list(range(20))
+    assert all(r.ok for r in results)
+
+
+def test_map_records_errors(client):
+    _add_items(5, fail={1, 3})
+
+    results = list(client.map(_get_item(client), range(5)))
+
+    assert [r.ok for r in results] == [True, False, True, False, True]
+    assert results[1].result is None
+    assert isinstance(results[1].exception, globus_sdk.GlobusAPIError)
+    assert results[1].exception.http_status == 404
+
+
+def test_map_unordered_yields_as_completed(client):
+    release_first = threading.Event()
+
+    def method(i):
+        if i == 0:
+            assert release_first.wait(timeout=5)
+        return i
+
+    results = client.map(method, range(2), concurrency=2, ordered=False)
+    # the first call is held until the second result has been yielded
+    assert next(results) == MapResult(1, 1, 1, None)
+    release_first.set()
+    assert list(results) == [MapResult(0, 0, 0, None)]
+
+
+def test_map_limits_concurrency(client):
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def method(i):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        # time.sleep is patched in tests, so wait on an event to hold the call open
+        threading.Event().wait(0.005)
+        with lock:
+            running -= 1
+        return i
+
+    results = list(client.map(method, range(50), concurrency=3))
+    assert [r.result for r in results] == list(range(50))
+    assert peak <= 3
+
+
+def test_map_reads_items_lazily(client):
+    consumed = []
+
+    def items():
+        for i in range(100):
+            consumed.append(i)
+            yield i
+
+    iterator = client.map(lambda i: i, items(), concurrency=2)
+    assert next(iterator).result == 0
+    # only the items needed to fill the window of pending calls have been read
+    assert len(consumed) < 10
+    iterator.close()
+
+
+def test_map_raises_non_globus_errors(client):
+    def method(i):
+        raise RuntimeError("bug")
+
+    with pytest.raises(RuntimeError, match="bug"):
+        list(client.map(method, range(3)))
+
+
+def test_map_rejects_invalid_concurrency(client):
+    with pytest.raises(ValueError):
+        list(client.map(lambda i: i, range(3), concurrency=0))
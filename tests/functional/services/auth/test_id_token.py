@@ -1,8 +1,11 @@
 import json
 import time
+from unittest import mock
 
 import jwt
 import pytest
+import responses
+from cryptography.hazmat.primitives.asymmetric import rsa
 
 import globus_sdk
 from tests.common import register_api_route
@@ -152,3 +155,184 @@ def test_decode_id_token_with_leeway(token_response):
         jwt_params={"leeway": expiration_delta + 1}
     )
     assert decoded["preferred_username"] == "sirosen2@globusid.org"
+
+
+def _count_calls(path):
+    return sum(1 for call in responses.calls if call.request.url.endswith(path))
+
+
+def test_decode_id_token_caches_oidc_config_and_jwk(client, token_response):
+    register_api_route(
+        "auth",
+        "/.well-known/openid-configuration",
+        method="GET",
+        body=json.dumps(OIDC_CONFIG),
+    )
+    register_api_route("auth", "/jwk.json", method="GET", body=json.dumps(JWK))
+
+    for _ in range(3):
+        decoded = token_response.decode_id_token(jwt_params={"verify_exp": False})
+        assert decoded["preferred_username"] == "sirosen2@globusid.org"
+
+    # a second client shares the cache when it is assigned the same one
+    other_client = globus_sdk.AuthLoginClient(client_id=client.client_id)
+    other_client.oidc_metadata_cache = client.oidc_metadata_cache
+    other_response = other_client.oauth2_token({"grant_type": "authorization_code"})
+    other_response.decode_id_token(jwt_params={"verify_exp": False})
+
+    assert _count_calls("/.well-known/openid-configuration") == 1
+    assert _count_calls("/jwk.json") == 1
+
+
+def test_decode_id_token_caches_per_client(client, token_response):
+    register_api_route(
+        "auth",
+        "/.well-known/openid-configuration",
+        method="GET",
+        body=json.dumps(OIDC_CONFIG),
+    )
+    register_api_route("auth", "/jwk.json", method="GET", body=json.dumps(JWK))
+
+    token_response.decode_id_token(jwt_params={"verify_exp": False})
+    other_client = globus_sdk.AuthLoginClient(client_id=client.client_id)
+    other_response = other_client.oauth2_token({"grant_type": "authorization_code"})
+    other_response.decode_id_token(jwt_params={"verify_exp": False})
+
+    assert _count_calls("/.well-known/openid-configuration") == 2
+    assert _count_calls("/jwk.json") == 2
+
+
+def test_decode_id_token_cache_disabled(client, token_response):
+    register_api_route(
+        "auth",
+        "/.well-known/openid-configuration",
+        method="GET",
+        body=json.dumps(OIDC_CONFIG),
+    )
+    register_api_route("auth", "/jwk.json", method="GET", body=json.dumps(JWK))
+
+    client.oidc_metadata_cache = None
+    for _ in range(2):
+        decoded = token_response.decode_id_token(jwt_params={"verify_exp": False})
+        assert decoded["preferred_username"] == "sirosen2@globusid.org"
+
+    assert _count_calls("/.well-known/openid-configuration") == 2
+    assert _count_calls("/jwk.json") == 2
+
+
+def test_decode_id_token_cache_ttl_is_configurable(client, token_response):
+    register_api_route(
+        "auth",
+        "/.well-known/openid-configuration",
+        method="GET",
+        body=json.dumps(OIDC_CONFIG),
+    )
+    register_api_route("auth", "/jwk.json", method="GET", body=json.dumps(JWK))
+
+    client.oidc_metadata_cache = globus_sdk.OIDCMetadataCache(ttl=60)
+    token_response.decode_id_token(jwt_params={"verify_exp": False})
+    with mock.patch("time.time", return_value=time.time() + 120):
+        token_response.decode_id_token(jwt_params={"verify_exp": False})
+
+    assert _count_calls("/.well-known/openid-configuration") == 2
+    assert _count_calls("/jwk.json") == 2
+
+
+def test_decode_id_token_cache_expires(token_response):
+    register_api_route(
+        "auth",
+        "/.well-known/openid-configuration",
+        method="GET",
+        body=json.dumps(OIDC_CONFIG),
+    )
+    register_api_route("auth", "/jwk.json", method="GET", body=json.dumps(JWK))
+
+    token_response.decode_id_token(jwt_params={"verify_exp": False})
+    with mock.patch("time.time", return_value=time.time() + 7200):
+        token_response.decode_id_token(jwt_params={"verify_exp": False})
+
+    assert _count_calls("/.well-known/openid-configuration") == 2
+    assert _count_calls("/jwk.json") == 2
+
+
+def _make_signing_key(kid):
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    public_jwk = json.loads(
+        jwt.algorithms.RSAAlgorithm.to_jwk(private_key.public_key())
+    )
+    return private_key, {**public_jwk, "kid": kid, "alg": "RS512", "use": "sig"}
+
+
+@pytest.fixture
+def issue_token(client):
+    def _issue_token(private_key, kid):
+        id_token = jwt.encode(
+            {"sub": "someone", "aud": client.client_id, "exp": time.time() + 60},
+            private_key,
+            algorithm="RS512",
+            headers={"kid": kid},
+        )
+        responses.replace(
+            responses.POST,
+            "https://auth.globus.org/v2/oauth2/token",
+            json={**TOKEN_PAYLOAD, "id_token": id_token},
+        )
+        return client.oauth2_token({"grant_type": "authorization_code"})
+
+    return _issue_token
+
+
+def test_decode_id_token_refreshes_jwk_on_unknown_kid(issue_token):
+    old_private_key, old_jwk = _make_signing_key("old")
+    new_private_key, new_jwk = _make_signing_key("new")
+
+    register_api_route(
+        "auth",
+        "/.well-known/openid-configuration",
+        method="GET",
+        body=json.dumps(OIDC_CONFIG),
+    )
+    register_api_route(
+        "auth", "/jwk.json", method="GET", body=json.dumps({"keys": [old_jwk]})
+    )
+    assert issue_token(old_private_key, "old").decode_id_token()["sub"] == "someone"
+
+    # the keys are rotated
+    responses.replace(
+        responses.GET,
+        "https://auth.globus.org/jwk.json",
+        json={"keys": [new_jwk, old_jwk]},
+    )
+    with mock.patch("time.time", return_value=time.time() + 60):
+        decoded = issue_token(new_private_key, "new").decode_id_token()
+    assert decoded["sub"] == "someone"
+    assert _count_calls("/jwk.json") == 2
+    assert _count_calls("/.well-known/openid-configuration") == 1
+
+
+def test_decode_id_token_unknown_kid_raises(issue_token):
+    old_private_key, old_jwk = _make_signing_key("old")
+    new_private_key, _ = _make_signing_key("new")
+
+    register_api_route(
+        "auth",
+        "/.well-known/openid-configuration",
+        method="GET",
+        body=json.dumps(OIDC_CONFIG),
+    )
+    register_api_route(
+        "auth", "/jwk.json", method="GET", body=json.dumps({"keys": [old_jwk]})
+    )
+    assert issue_token(old_private_key, "old").decode_id_token()["sub"] == "someone"
+
+    # within the refresh interval, the keys are not fetched again
+    response = issue_token(new_private_key, "new")
+    with pytest.raises(jwt.InvalidTokenError, match="key ID 'new'"):
+        response.decode_id_token()
+    assert _count_calls("/jwk.json") == 1
+
+    # after the refresh interval, the keys are fetched but still lack the key ID
+    with mock.patch("time.time", return_value=time.time() + 60):
+        with pytest.raises(jwt.InvalidTokenError, match="key ID 'new'"):
+            response.decode_id_token()
+    assert _count_calls("/jwk.json") == 2
@@ -1,7 +1,11 @@
+import json
+import uuid
+
 import pytest
 import responses
 
 import globus_sdk
+from globus_sdk import utils
 from globus_sdk._testing import get_last_request, load_response
 
 IDENTITIES_MULTIPLE_RESPONSE = {
@@ -248,3 +252,117 @@ def test_identity_map_batch_limit(service_client):
     last_req = get_last_request()
     assert "usernames" not in last_req.params
     assert last_req.params == {"ids": meta2["id"]}
+
+
+def _add_identities_callback(service_client, fail_ids=()):
+    def callback(request):
+        params = request.params
+        if "ids" in params:
+            ids = params["ids"].split(",")
+            if set(ids) & set(fail_ids):
+                return (500, {}, json.dumps({"code": "Error", "message": "oops"}))
+            records = [{"id": i, "username": f"user-{i}@example.org"} for i in ids]
+        else:
+            records = [
+                {"id": str(uuid.uuid5(uuid.NAMESPACE_DNS, u)), "username": u}
+                for u in params["usernames"].split(",")
+            ]
+        return (200, {}, json.dumps({"identities": records}))
+
+    responses.add_callback(
+        responses.GET,
+        utils.slash_join(service_client.base_url, "/v2/api/identities"),
+        callback=callback,
+        content_type="application/json",
+    )
+
+
+def test_identity_map_resolve_all(service_client):
+    ids = [str(uuid.UUID(int=i)) for i in range(25)]
+    usernames = [f"user{i}@example.org" for i in range(7)]
+    _add_identities_callback(service_client)
+    idmap = globus_sdk.IdentityMap(service_client, ids + usernames, id_batch_size=10)
+
+    idmap.resolve_all(concurrency=3)
+
+    # 3 batches of IDs and 1 batch of usernames
+    assert len(responses.calls) == 4
+    assert idmap.unresolved_ids == set()
+    assert idmap.unresolved_usernames == set()
+    for i in ids:
+        assert idmap[i]["username"] == f"user-{i}@example.org"
+    for u in usernames:
+        assert idmap[u]["username"] == u
+    # every lookup was served from the cache
+    assert len(responses.calls) == 4
+
+
+def test_identity_map_resolve_all_skips_cached_values(service_client):
+    ids = [str(uuid.UUID(int=i)) for i in range(3)]
+    _add_identities_callback(service_client)
+    cache = {ids[0]: {"id": ids[0], "username": "cached@example.org"}}
+    idmap = globus_sdk.IdentityMap(service_client, ids, cache=cache)
+
+    idmap.resolve_all()
+
+    assert len(responses.calls) == 1
+    assert set(responses.calls[0].request.params["ids"].split(",")) == set(ids[1:])
+    assert idmap[ids[0]]["username"] == "cached@example.org"
+
+
+def test_identity_map_resolve_all_error_leaves_batch_unresolved(service_client):
+    ids = [str(uuid.UUID(int=i)) for i in range(4)]
+    _add_identities_callback(service_client, fail_ids=[ids[0]])
+    idmap = globus_sdk.IdentityMap(service_client, id_batch_size=1)
+    for i in ids:
+        idmap.add(i)
+
+    with service_client.transport.tune(max_retries=0):
+        with pytest.raises(globus_sdk.AuthAPIError):
+            idmap.resolve_all()
+
+    assert idmap.unresolved_ids == {ids[0]}
+    for i in ids[1:]:
+        assert idmap[i]["id"] == i
+    assert len(responses.calls) == 4
+
+
+def test_identity_map_with_ttl_identity_cache(service_client):
+    meta = load_response(service_client.get_identities, case="sirosen").metadata
+    cache = globus_sdk.TTLIdentityCache()
+    idmap = globus_sdk.IdentityMap(
+        service_client, [meta["username"], "nobody@globus.org"], cache=cache
+    )
+
+    assert idmap[meta["username"]]["id"] == meta["id"]
+    assert idmap[meta["id"]]["username"] == meta["username"]
+    assert len(responses.calls) == 1
+
+    # the username which was not found is remembered, and is not looked up again
+    with pytest.raises(KeyError):
+        idmap["nobody@globus.org"]
+    assert idmap.get("nobody@globus.org") is None
+    assert idmap.add("nobody@globus.org") is False
+    assert len(responses.calls) == 1
+
+    assert cache.get_stats()["hits"] == 1
+    assert cache.get_stats()["negative_hits"] == 2
+
+
+def test_identity_map_with_sqlite_identity_cache(service_client, tmp_path):
+    ids = [str(uuid.UUID(int=i)) for i in range(5)]
+    _add_identities_callback(service_client)
+    dbname = tmp_path / "identities.db"
+
+    cache = globus_sdk.SQLiteIdentityCache(dbname)
+    globus_sdk.IdentityMap(service_client, ids, cache=cache).resolve_all()
+    cache.close()
+    assert len(responses.calls) == 1
+
+    # a new cache on the same file, as in another process, needs no lookups
+    cache = globus_sdk.SQLiteIdentityCache(dbname)
+    idmap = globus_sdk.IdentityMap(service_client, ids, cache=cache)
+    idmap.resolve_all()
+    assert [idmap[i]["username"] for i in ids] == [f"user-{i}@example.org" for i in ids]
+    assert len(responses.calls) == 1
+    cache.close()
@@ -132,3 +132,18 @@ def test_search_paginated_scroll_query(search_client, query_doc):
 
     # confirm that pagination was not side-effecting
     assert "marker" not in query_doc
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_search_post_query_iterates_over_results(search_client, stream):
+    meta = load_response(search_client.post_search).metadata
+
+    res = search_client.post_search(meta["index_id"], {"q": "foo"}, stream=stream)
+    assert isinstance(res, globus_sdk.IterableSearchResponse)
+    results = list(res)
+    assert results[0]["entries"][0]["content"]["foo"] == "bar"
+    if stream:
+        # streamed results are not retained
+        assert "gmeta" not in res.data
+    else:
+        assert res.data["gmeta"] == results
@@ -93,3 +93,19 @@ def test_operation_ls_params(client, kwargs, expected_qs):
     req = get_last_request()
     parsed_qs = urllib.parse.parse_qs(urllib.parse.urlparse(req.url).query)
     assert parsed_qs == expected_qs
+
+
+def test_operation_ls_stream(client):
+    ls_data = {**_mk_ls_data(), "DATA_TYPE": "file_list", "path": "/~/", "total": 4}
+    RegisteredResponse(
+        service="transfer",
+        path=f"/operation/endpoint/{GO_EP1_ID}/ls",
+        json=ls_data,
+    ).replace()
+
+    ls_doc = client.operation_ls(GO_EP1_ID, stream=True)
+    assert [x["name"] for x in ls_doc] == [x["name"] for x in ls_data["DATA"]]
+    # the other fields of the response are available after iteration
+    assert ls_doc["path"] == "/~/"
+    assert ls_doc["total"] == 4
+    assert "DATA" not in ls_doc
@@ -0,0 +1,198 @@
+"""
+Tests for submitting large Transfer and Delete tasks in chunks
+"""
+import itertools
+import json
+import pickle
+import threading
+
+import pytest
+import responses
+
+from globus_sdk import (
+    ChunkedSubmissionError,
+    DeleteData,
+    GlobusSDKUsageError,
+    TransferAPIError,
+    TransferData,
+)
+from globus_sdk.client import MapResult
+from tests.common import GO_EP1_ID, GO_EP2_ID
+
+
+@pytest.fixture
+def submissions(client):
+    """
+    Register responses which give each submission a new ID, and return a dict of
+    the documents submitted by submission ID. Documents with a label of "fail", or
+    with an item whose path contains "bad", are rejected.
+    """
+    submitted = {}
+    counter = itertools.count()
+    lock = threading.Lock()
+
+    def get_submission_id(request):
+        with lock:
+            value = f"submission-{next(counter)}"
+        return (200, {}, json.dumps({"value": value}))
+
+    def submit(request):
+        body = json.loads(request.body)
+        if body.get("label") == "fail" or "bad" in json.dumps(body["DATA"]):
+            return (400, {}, json.dumps({"code": "ClientError.BadRequest"}))
+        with lock:
+            submitted[body["submission_id"]] = body
+        return (202, {}, json.dumps({"task_id": f"task-{body['submission_id']}"}))
+
+    responses.add_callback(
+        responses.GET, f"{client.base_url}submission_id", callback=get_submission_id
+    )
+    for path in ("transfer", "delete"):
+        responses.add_callback(
+            responses.POST, f"{client.base_url}{path}", callback=submit
+        )
+    return submitted
+
+
+def _paths(document):
+    return [item["source_path"] for item in document["DATA"]]
+
+
+def test_submit_chunked_transfer(client, submissions):
+    tdata = TransferData(
+        source_endpoint=GO_EP1_ID, destination_endpoint=GO_EP2_ID, label="big"
+    )
+    tdata.add_items((f"/src/{i}", f"/dst/{i}") for i in range(7))
+
+    task_ids = client.submit_chunked(tdata, chunk_size=3, concurrency=2)
+
+    assert len(task_ids) == 3
+    documents = [submissions[task_id[len("task-") :]] for task_id in task_ids]
+    assert [_paths(doc) for doc in documents] == [
+        ["/src/0", "/src/1", "/src/2"],
+        ["/src/3", "/src/4", "/src/5"],
+        ["/src/6"],
+    ]
+    for doc in documents:
+        assert doc["DATA_TYPE"] == "transfer"
+        assert doc["label"] == "big"
+        assert doc["source_endpoint"] == GO_EP1_ID
+    # the original document is not changed
+    assert "submission_id" not in tdata
+    assert len(tdata["DATA"]) == 7
+
+
+def test_submit_chunked_delete_from_stream(client, submissions):
+    ddata = DeleteData(endpoint=GO_EP1_ID, recursive=True)
+
+    def paths():
+        for i in range(5):
+            yield f"/dir/{i}"
+
+    task_ids = client.submit_chunked(ddata, paths(), chunk_size=2)
+
+    documents = [submissions[task_id[len("task-") :]] for task_id in task_ids]
+    assert [[item["path"] for item in doc["DATA"]] for doc in documents] == [
+        ["/dir/0", "/dir/1"],
+        ["/dir/2", "/dir/3"],
+        ["/dir/4"],
+    ]
+    assert all(doc["recursive"] is True for doc in documents)
+    assert {item["DATA_TYPE"] for doc in documents for item in doc["DATA"]} == {
+        "delete_item"
+    }
+    assert ddata["DATA"] == []
+
+
+def test_submit_chunked_with_no_items(client, submissions):
+    tdata = TransferData(source_endpoint=GO_EP1_ID, destination_endpoint=GO_EP2_ID)
+    assert client.submit_chunked(tdata) == []
+    assert client.submit_chunked(tdata, iter(())) == []
+    assert submissions == {}
+
+
+def test_submit_chunked_failure_reports_submitted_tasks(client, submissions):
+    tdata = TransferData(
+        source_endpoint=GO_EP1_ID, destination_endpoint=GO_EP2_ID, label="fail"
+    )
+    tdata.add_items((f"/src/{i}", f"/dst/{i}") for i in range(4))
+
+    with pytest.raises(ChunkedSubmissionError) as excinfo:
+        client.submit_chunked(tdata, chunk_size=1, concurrency=1)
+
+    err = excinfo.value
+    assert err.task_ids == {}
+    assert err.errors
+    assert all(isinstance(e, TransferAPIError) for e in err.errors.values())
+    assert list(err.errors) == [result.position for result in err.results]
+    assert err.__cause__ is err.errors[0]
+    # no more chunks are read after a failure, though chunks which were already
+    # read are still submitted
+    submit_calls = [c for c in responses.calls if c.request.method == "POST"]
+    assert len(submit_calls) == len(err.results) < 4
+
+
+def test_submit_chunked_partial_failure_loses_no_items(client, submissions):
+    tdata = TransferData(source_endpoint=GO_EP1_ID, destination_endpoint=GO_EP2_ID)
+    paths = [f"/src/{i}" for i in range(20)]
+    paths[3] = "/src/bad"
+    items = iter([(path, path) for path in paths])
+
+    with pytest.raises(ChunkedSubmissionError) as excinfo:
+        client.submit_chunked(tdata, items, chunk_size=2, concurrency=1)
+
+    err = excinfo.value
+    assert list(err.errors) == [1]
+    assert [result.position for result in err.results] == list(range(len(err.results)))
+    # the failed chunk holds the items which must be submitted again
+    assert _paths(err.results[1].item) == ["/src/2", "/src/bad"]
+    for position, task_id in err.task_ids.items():
+        submitted = submissions[task_id[len("task-") :]]
+        assert _paths(submitted) == paths[position * 2 : position * 2 + 2]
+    # every item was either put in a chunk or is still unread in the iterator
+    chunked = [path for result in err.results for path in _paths(result.item)]
+    remaining = [source for source, _ in items]
+    assert chunked + remaining == paths
+    assert remaining
+
+
+def test_chunked_submission_error_pickles():
+    err = ChunkedSubmissionError(
+        [
+            MapResult(0, {"DATA": []}, "task-0", None),
+            MapResult(1, {"DATA": []}, None, GlobusSDKUsageError("oops")),
+        ]
+    )
+    copied = pickle.loads(pickle.dumps(err))
+    assert copied.task_ids == {0: "task-0"}
+    assert list(copied.errors) == [1]
+    assert str(copied) == str(err)
+
+
+@pytest.mark.parametrize(
+    "make_data, items, kwargs",
+    [
+        (lambda: {"DATA": []}, None, {}),
+        (
+            lambda: TransferData(
+                source_endpoint=GO_EP1_ID,
+                destination_endpoint=GO_EP2_ID,
+                submission_id="foo",
+            ),
+            None,
+            {},
+        ),
+        (lambda: DeleteData(endpoint=GO_EP1_ID), ["/a"], {"chunk_size": 0}),
+    ],
+    ids=["dict", "submission_id", "chunk_size"],
+)
+def test_submit_chunked_rejects_bad_usage(client, make_data, items, kwargs):
+    with pytest.raises((GlobusSDKUsageError, ValueError)):
+        client.submit_chunked(make_data(), items, **kwargs)
+
+
+def test_submit_chunked_rejects_items_and_data(client):
+    ddata = DeleteData(endpoint=GO_EP1_ID)
+    ddata.add_item("/a")
+    with pytest.raises(GlobusSDKUsageError):
+        client.submit_chunked(ddata, ["/b"])
@@ -53,6 +53,18 @@ def test_transfer_submit_success(client):
     req_body = json.loads(get_last_request().body)
     assert req_body["source_local_user"] == "my-source-user"
     assert req_body["destination_local_user"] == "my-dest-user"
+    assert req_body["DATA"] == [
+        {
+            "DATA_TYPE": "transfer_item",
+            "source_path": "/path/to/foo",
+            "destination_path": "/path/to/bar",
+        },
+        {
+            "DATA_TYPE": "transfer_symlink_item",
+            "source_path": "linkfoo",
+            "destination_path": "linkbar",
+        },
+    ]
 
 
 def test_delete_submit_success(client):
@@ -78,6 +90,7 @@ def test_delete_submit_success(client):
 
     req_body = json.loads(get_last_request().body)
     assert req_body["local_user"] == "my-user"
+    assert req_body["DATA"] == [{"DATA_TYPE": "delete_item", "path": "/path/to/foo"}]
 
 
 @pytest.mark.parametrize("datatype", ("transfer", "delete"))
@@ -1,4 +1,5 @@
 import os
+import threading
 
 import pytest
 
@@ -197,3 +198,53 @@ def test_iter_namespaces(mock_response, db_filename, make_adapter):
             "bar",
             "baz",
         }
+
+
+@pytest.mark.parametrize("use_file", [True, False])
+def test_adapter_may_be_used_from_other_threads(
+    use_file, db_filename, make_adapter, mock_response, mock_refresh_response
+):
+    if use_file:
+        adapter = make_adapter(db_filename)
+    else:
+        adapter = make_adapter(MEMORY_DBNAME)
+    adapter.store(mock_response)
+
+    errors = []
+
+    def refresh():
+        try:
+            for _ in range(20):
+                adapter.store(mock_refresh_response)
+                adapter.get_by_resource_server()
+        except Exception as e:  # pragma: no cover
+            errors.append(e)
+
+    threads = [threading.Thread(target=refresh) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert (
+        adapter.get_token_data("resource_server_2")["access_token"]
+        == "access_token_2_refreshed"
+    )
+    assert list(adapter.iter_namespaces()) == ["DEFAULT"]
+
+
+def test_connect_params_may_require_same_thread(db_filename, make_adapter):
+    adapter = make_adapter(db_filename, connect_params={"check_same_thread": True})
+    errors = []
+
+    def read_config():
+        try:
+            adapter.read_config("foo")
+        except Exception as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=read_config)
+    thread.start()
+    thread.join()
+    assert len(errors) == 1
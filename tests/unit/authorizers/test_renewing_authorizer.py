@@ -1,3 +1,6 @@
+import asyncio
+import gc
+import threading
 import time
 from unittest import mock
 
@@ -190,3 +193,194 @@ def test_handle_missing_authorization(authorizer):
     """
     assert authorizer.handle_missing_authorization()
     assert authorizer.expires_at is None
+
+
+def test_concurrent_renewal_is_coalesced(expired_authorizer, token_data):
+    """
+    Confirms that when many threads find the token expired at once, only one of
+    them fetches a new token and all of them use it
+    """
+    num_threads = 16
+    barrier = threading.Barrier(num_threads)
+    release = threading.Event()
+    calls = []
+
+    def slow_token_response():
+        calls.append(None)
+        # hold the renewal open so that other threads pile up behind it
+        release.wait(timeout=0.1)
+        return expired_authorizer.token_response
+
+    expired_authorizer._get_token_response = slow_token_response
+
+    headers = []
+
+    def get_header():
+        barrier.wait()
+        headers.append(expired_authorizer.get_authorization_header())
+
+    threads = [threading.Thread(target=get_header) for _ in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert headers == ["Bearer " + token_data["access_token"]] * num_threads
+
+
+def test_handle_missing_authorization_for_replaced_token(authorizer, token_data):
+    """
+    Confirms that a 401 for a token which another thread has already replaced does
+    not invalidate the replacement
+    """
+    assert authorizer.get_authorization_header() == "Bearer " + ACCESS_TOKEN
+
+    def renew_in_other_thread():
+        authorizer.get_authorization_header()
+        authorizer.handle_missing_authorization()
+        authorizer.get_authorization_header()
+
+    thread = threading.Thread(target=renew_in_other_thread)
+    thread.start()
+    thread.join()
+    assert authorizer.access_token == token_data["access_token"]
+
+    # this thread's request used the old token, so the new token is kept
+    assert authorizer.handle_missing_authorization()
+    assert authorizer.expires_at == token_data["expires_at_seconds"]
+    assert authorizer.get_authorization_header() == (
+        "Bearer " + token_data["access_token"]
+    )
+
+
+def test_handle_missing_authorization_for_replaced_token_in_task(
+    authorizer, token_data
+):
+    """
+    Confirms that the token used by a request is tracked for each asyncio task, so
+    that a 401 in one task does not invalidate a token renewed by another task on
+    the same thread
+    """
+    results = {}
+
+    async def stale_request(sent, renewed):
+        results["stale_header"] = authorizer.get_authorization_header()
+        sent.set()
+        await renewed.wait()
+        # the 401 for the old token arrives after the other task renewed it
+        results["stale_retry"] = authorizer.handle_missing_authorization()
+
+    async def renewing_request(sent, renewed):
+        await sent.wait()
+        authorizer.handle_missing_authorization()
+        results["new_header"] = authorizer.get_authorization_header()
+        renewed.set()
+
+    async def main():
+        sent, renewed = asyncio.Event(), asyncio.Event()
+        await asyncio.gather(
+            stale_request(sent, renewed), renewing_request(sent, renewed)
+        )
+
+    asyncio.run(main())
+
+    assert results["stale_header"] == "Bearer " + ACCESS_TOKEN
+    assert results["new_header"] == "Bearer " + token_data["access_token"]
+    assert results["stale_retry"] is True
+    # the renewed token was kept
+    assert authorizer.expires_at == token_data["expires_at_seconds"]
+
+
+def test_background_renewal_renews_ahead_of_expiry(authorizer, token_data):
+    """
+    Confirms that background renewal fetches a new token before the current one
+    expires, without any call to get_authorization_header
+    """
+    refreshed = threading.Event()
+    authorizer.on_refresh = lambda res: refreshed.set()
+    authorizer.expires_at = int(time.time())
+
+    # the token has expired, so it is renewed immediately
+    authorizer.start_background_renewal(lead_time=3600, jitter=0)
+    try:
+        assert refreshed.wait(timeout=5)
+    finally:
+        authorizer.stop_background_renewal()
+    assert authorizer.access_token == token_data["access_token"]
+    assert authorizer._renewal_thread is None
+
+
+def test_background_renewal_retries_failures(authorizer, token_data, monkeypatch):
+    monkeypatch.setattr(
+        "globus_sdk.authorizers.renewing.BACKGROUND_RENEWAL_RETRY_SECONDS", 0
+    )
+    refreshed = threading.Event()
+    authorizer.on_refresh = lambda res: refreshed.set()
+    original_get_token_response = authorizer._get_token_response
+    calls = []
+
+    def flaky_token_response():
+        calls.append(None)
+        if len(calls) == 1:
+            raise ValueError("temporary failure")
+        return original_get_token_response()
+
+    authorizer._get_token_response = flaky_token_response
+    authorizer.expires_at = int(time.time())
+
+    authorizer.start_background_renewal(lead_time=3600, jitter=0)
+    try:
+        assert refreshed.wait(timeout=5)
+    finally:
+        authorizer.stop_background_renewal()
+    assert len(calls) == 2
+    assert authorizer.access_token == token_data["access_token"]
+
+
+def test_background_renewal_of_short_lived_token(authorizer, token_data, monkeypatch):
+    """
+    A token whose lifetime is shorter than the lead time is renewed halfway through
+    its lifetime, rather than as soon as it is received
+    """
+    monkeypatch.setattr(
+        "globus_sdk.authorizers.renewing.BACKGROUND_RENEWAL_MIN_INTERVAL_SECONDS", 0
+    )
+    token_data["expires_at_seconds"] = int(time.time()) + 120
+    authorizer.expires_at = int(time.time())
+    calls = []
+    authorizer.on_refresh = calls.append
+
+    authorizer.start_background_renewal(lead_time=300, jitter=0)
+    try:
+        for _ in range(50):
+            if calls:
+                break
+            threading.Event().wait(0.01)
+        # give a continuously renewing thread time to renew again
+        threading.Event().wait(0.1)
+        assert len(calls) == 1
+        assert authorizer._seconds_until_background_renewal(300, 0) == pytest.approx(
+            60, abs=2
+        )
+    finally:
+        authorizer.stop_background_renewal()
+
+
+def test_background_renewal_rejects_negative_lead_time(authorizer):
+    with pytest.raises(exc.GlobusSDKUsageError):
+        authorizer.start_background_renewal(lead_time=-1)
+
+
+def test_background_renewal_stops_when_authorizer_is_collected(token_data, expires_at):
+    authorizer = MockRenewer(
+        token_data, access_token=ACCESS_TOKEN, expires_at=expires_at + 3600
+    )
+    authorizer.start_background_renewal(lead_time=0, jitter=0)
+    thread = authorizer._renewal_thread
+    assert thread.is_alive()
+
+    del authorizer
+    gc.collect()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
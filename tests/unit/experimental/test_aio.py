@@ -0,0 +1,259 @@
+import asyncio
+import json
+from unittest import mock
+
+import pytest
+
+import globus_sdk
+
+httpx = pytest.importorskip("httpx")
+
+from globus_sdk.experimental.aio import (  # noqa: E402
+    AsyncBaseClient,
+    AsyncTransferClient,
+    AsyncTransport,
+)
+
+
+def _no_backoff(ctx):
+    return 0
+
+
+def make_client(
+    handler, client_class=AsyncBaseClient, extra_transport_params=None, **kwargs
+):
+    transport_params = {
+        "httpx_client_params": {"transport": httpx.MockTransport(handler)},
+        "retry_backoff": _no_backoff,
+        **(extra_transport_params or {}),
+    }
+    if client_class is AsyncBaseClient:
+        kwargs.setdefault("base_url", "https://foo.api.globus.org/")
+    return client_class(transport_params=transport_params, **kwargs)
+
+
+def test_async_get_returns_response():
+    def handler(request):
+        assert request.url == "https://foo.api.globus.org/bar?x=1"
+        assert request.headers["Authorization"] == "Bearer tok"
+        return httpx.Response(200, json={"baz": 1})
+
+    async def main():
+        async with make_client(
+            handler, authorizer=globus_sdk.AccessTokenAuthorizer("tok")
+        ) as client:
+            return await client.get("/bar", query_params={"x": 1})
+
+    res = asyncio.run(main())
+    assert isinstance(res, globus_sdk.GlobusHTTPResponse)
+    assert res.http_status == 200
+    assert res["baz"] == 1
+
+
+def test_async_post_uses_json_encoder():
+    def handler(request):
+        assert request.headers["Content-Type"] == "application/json"
+        return httpx.Response(200, json=json.loads(request.content))
+
+    async def main():
+        async with make_client(handler) as client:
+            return await client.post("/bar", data={"a": "b"})
+
+    res = asyncio.run(main())
+    assert res.data == {"a": "b"}
+
+
+def test_async_concurrent_requests():
+    def handler(request):
+        return httpx.Response(200, json={"path": request.url.path})
+
+    async def main():
+        async with make_client(handler) as client:
+            return await asyncio.gather(*(client.get(f"/item/{i}") for i in range(20)))
+
+    results = asyncio.run(main())
+    assert [r["path"] for r in results] == [f"/item/{i}" for i in range(20)]
+
+
+def test_async_retries_transient_errors():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) < 3:
+            return httpx.Response(503, text="unavailable")
+        return httpx.Response(200, json={"ok": True})
+
+    async def main():
+        async with make_client(handler) as client:
+            return await client.get("/bar")
+
+    res = asyncio.run(main())
+    assert res["ok"] is True
+    assert len(calls) == 3
+
+
+def test_async_error_raises_error_class():
+    def handler(request):
+        return httpx.Response(
+            404, json={"code": "ClientError.NotFound", "message": "no such thing"}
+        )
+
+    async def main():
+        async with make_client(handler, client_class=AsyncTransferClient) as client:
+            with client.transport.tune(max_retries=0):
+                return await client.get("/endpoint/foo")
+
+    with pytest.raises(globus_sdk.TransferAPIError) as excinfo:
+        asyncio.run(main())
+    assert excinfo.value.http_status == 404
+    assert excinfo.value.code == "ClientError.NotFound"
+
+
+def test_async_network_error_is_converted():
+    def handler(request):
+        raise httpx.ConnectError("connection refused", request=request)
+
+    async def main():
+        async with make_client(handler) as client:
+            with client.transport.tune(max_retries=1):
+                return await client.get("/bar")
+
+    with pytest.raises(globus_sdk.GlobusConnectionError):
+        asyncio.run(main())
+
+
+def test_async_transport_handles_expired_authorization():
+    class CountingAuthorizer(globus_sdk.authorizers.GlobusAuthorizer):
+        def __init__(self):
+            self.token = "old"
+
+        def get_authorization_header(self):
+            return f"Bearer {self.token}"
+
+        def handle_missing_authorization(self):
+            self.token = "new"
+            return True
+
+    def handler(request):
+        if request.headers["Authorization"] == "Bearer old":
+            return httpx.Response(401, json={})
+        return httpx.Response(200, json={"ok": True})
+
+    async def main():
+        async with make_client(handler, authorizer=CountingAuthorizer()) as client:
+            return await client.get("/bar")
+
+    assert asyncio.run(main())["ok"] is True
+
+
+def test_async_transport_is_a_requests_transport():
+    transport = AsyncTransport(max_retries=2)
+    assert isinstance(transport, globus_sdk.transport.RequestsTransport)
+    assert transport.max_retries == 2
+
+
+def test_async_transport_does_not_create_a_session():
+    def handler(request):
+        return httpx.Response(200, json={"ok": True})
+
+    async def main():
+        async with make_client(handler) as client:
+            await client.get("/bar")
+            return client.transport
+
+    transport = asyncio.run(main())
+    assert transport._session is None
+    assert transport.get_pool_stats() == {}
+    assert transport._session is None
+
+
+def test_async_client_sends_payload_wrapper_items():
+    def handler(request):
+        return httpx.Response(200, json=json.loads(request.content))
+
+    tdata = globus_sdk.TransferData(source_endpoint="src", destination_endpoint="dst")
+    tdata.add_item("/a", "/b")
+
+    async def main():
+        async with make_client(handler) as client:
+            return await client.post("/bar", data=tdata)
+
+    res = asyncio.run(main())
+    assert [item["source_path"] for item in res["DATA"]] == ["/a"]
+
+
+def test_async_client_shares_base_client_behavior():
+    def handler(request):
+        assert request.url == "https://other.example.org/baz"
+        return httpx.Response(200, json={})
+
+    async def main():
+        async with make_client(handler) as client:
+            await client.get("https://other.example.org/baz")
+
+    asyncio.run(main())
+    assert AsyncTransferClient.resource_server == (
+        globus_sdk.TransferClient.resource_server
+    )
+
+
+def test_async_transport_uses_response_cache():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(
+            200, json={"n": len(calls)}, headers={"Cache-Control": "max-age=60"}
+        )
+
+    cache = globus_sdk.transport.ResponseCache()
+
+    async def main():
+        async with make_client(
+            handler, extra_transport_params={"response_cache": cache}
+        ) as client:
+            return [(await client.get("/bar"))["n"] for _ in range(3)]
+
+    assert asyncio.run(main()) == [1, 1, 1]
+    assert len(calls) == 1
+
+
+def test_async_transport_uses_rate_limiter():
+    def handler(request):
+        return httpx.Response(200, json={})
+
+    limiter = mock.Mock(spec=globus_sdk.transport.RateLimiter)
+    limiter.acquire.return_value = 0
+
+    async def main():
+        async with make_client(
+            handler, extra_transport_params={"rate_limiter": limiter}
+        ) as client:
+            await client.get("/bar")
+
+    asyncio.run(main())
+    limiter.acquire.assert_called_once_with("https://foo.api.globus.org/bar")
+    assert limiter.record_response.call_count == 1
+
+
+def test_async_transport_uses_circuit_breaker():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(503, text="unavailable")
+
+    breaker = globus_sdk.transport.CircuitBreaker(minimum_requests=2)
+
+    async def main():
+        async with make_client(
+            handler, extra_transport_params={"circuit_breaker": breaker}
+        ) as client:
+            with pytest.raises(globus_sdk.GlobusAPIError):
+                await client.get("/bar")
+            await client.get("/bar")
+
+    with pytest.raises(globus_sdk.GlobusCircuitOpenError):
+        asyncio.run(main())
+    assert len(calls) == 2
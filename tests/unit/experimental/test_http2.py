@@ -0,0 +1,143 @@
+import json
+
+import pytest
+
+import globus_sdk
+
+httpx = pytest.importorskip("httpx")
+
+from globus_sdk.experimental.http2 import (  # noqa: E402
+    HTTP2TransferTransport,
+    HTTP2Transport,
+)
+
+
+def _no_backoff(ctx):
+    return 0
+
+
+class HTTP2Client(globus_sdk.BaseClient):
+    service_name = "foo"
+    transport_class = HTTP2Transport
+
+
+def make_client(handler, **kwargs):
+    transport_params = {
+        "httpx_client_params": {"transport": httpx.MockTransport(handler)},
+        "retry_backoff": _no_backoff,
+        **kwargs.pop("transport_params", {}),
+    }
+    return HTTP2Client(transport_params=transport_params, **kwargs)
+
+
+def test_get_returns_response():
+    def handler(request):
+        assert request.url == "https://foo.api.globus.org/bar?x=1"
+        assert request.headers["Authorization"] == "Bearer tok"
+        return httpx.Response(200, json={"baz": 1})
+
+    client = make_client(handler, authorizer=globus_sdk.AccessTokenAuthorizer("tok"))
+    res = client.get("/bar", query_params={"x": 1})
+
+    assert isinstance(res, globus_sdk.GlobusHTTPResponse)
+    assert res.http_status == 200
+    assert res["baz"] == 1
+
+
+def test_post_uses_json_encoder():
+    def handler(request):
+        assert request.headers["Content-Type"] == "application/json"
+        return httpx.Response(200, json=json.loads(request.content))
+
+    res = make_client(handler).post("/bar", data={"a": "b"})
+    assert res.data == {"a": "b"}
+
+
+def test_retries_transient_errors():
+    statuses = [503, 502, 200]
+
+    def handler(request):
+        return httpx.Response(statuses.pop(0), json={})
+
+    res = make_client(handler).get("/bar")
+    assert res.http_status == 200
+    assert statuses == []
+
+
+def test_error_raises_error_class():
+    def handler(request):
+        return httpx.Response(404, json={"code": "NotFound", "message": "nope"})
+
+    with pytest.raises(globus_sdk.GlobusAPIError) as excinfo:
+        make_client(handler).get("/bar")
+    assert excinfo.value.http_status == 404
+    assert excinfo.value.code == "NotFound"
+
+
+def test_network_error_is_converted():
+    def handler(request):
+        raise httpx.ConnectError("oops", request=request)
+
+    client = make_client(handler)
+    with client.transport.tune(max_retries=1):
+        with pytest.raises(globus_sdk.GlobusConnectionError):
+            client.get("/bar")
+
+
+def test_streamed_response_is_read_incrementally():
+    items = [{"id": i} for i in range(100)]
+
+    def handler(request):
+        body = json.dumps({"DATA": items, "has_next_page": False}).encode()
+        chunks = [body[i : i + 7] for i in range(0, len(body), 7)]
+        return httpx.Response(200, content=iter(chunks))
+
+    client = make_client(handler)
+    raw = client.transport.request("GET", "https://foo.api.globus.org/bar", stream=True)
+    assert not raw._content_consumed
+
+    class DataResponse(globus_sdk.response.IterableResponse):
+        default_iter_key = "DATA"
+
+    res = DataResponse(raw, client)
+    assert list(res) == items
+    assert res["has_next_page"] is False
+
+
+def test_tune_verify_ssl_uses_a_new_client():
+    transport = HTTP2Transport(http2=False)
+    default_client = transport._get_client()
+    with transport.tune(verify_ssl=False):
+        assert transport._get_client() is not default_client
+    assert transport._get_client() is default_client
+    transport.close()
+    assert transport._clients == {}
+
+
+def test_http2_is_negotiated_by_default():
+    pytest.importorskip("h2")
+    transport = HTTP2Transport()
+    assert transport.http2
+    assert isinstance(transport._get_client(), httpx.Client)
+    transport.close()
+
+
+def test_transfer_transport_has_transfer_retry_behavior():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(502, json={"code": "ExternalError", "message": "x"})
+
+    class HTTP2TransferClient(globus_sdk.TransferClient):
+        transport_class = HTTP2TransferTransport
+
+    client = HTTP2TransferClient(
+        transport_params={
+            "httpx_client_params": {"transport": httpx.MockTransport(handler)},
+            "retry_backoff": _no_backoff,
+        }
+    )
+    with pytest.raises(globus_sdk.TransferAPIError):
+        client.get_endpoint("abc")
+    assert len(calls) == 1
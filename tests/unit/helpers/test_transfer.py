@@ -1,6 +1,12 @@
+import copy
+import json
+import pickle
+import tracemalloc
+
 import pytest
 
 from globus_sdk import DeleteData, GlobusSDKUsageError, TransferClient, TransferData
+from globus_sdk._json import get_json_codec
 from globus_sdk._testing import load_response
 from globus_sdk.services.transfer.client import _format_filter
 from tests.common import GO_EP1_ID, GO_EP2_ID
@@ -235,6 +241,18 @@ def test_delete_add_item():
     assert all(fields_data[k] == v for k, v in addfields.items())
 
 
+def test_delete_add_items():
+    ddata = DeleteData(endpoint=GO_EP1_ID)
+    count = ddata.add_items(
+        ["abc/", {"path": "def/", "additional_fields": {"foo": "bar"}}]
+    )
+    assert count == 2
+    assert list(ddata.iter_items()) == [
+        {"DATA_TYPE": "delete_item", "path": "abc/"},
+        {"DATA_TYPE": "delete_item", "path": "def/", "foo": "bar"},
+    ]
+
+
 def test_delete_iter_items():
     ddata = DeleteData(endpoint=GO_EP1_ID)
     # add item
@@ -276,6 +294,180 @@ def test_transfer_iter_items():
     check_item(as_list[1], "source/def/", "dest/def/", {"recursive": True})
 
 
+def test_transfer_add_items():
+    tdata = TransferData(source_endpoint=GO_EP1_ID, destination_endpoint=GO_EP2_ID)
+    count = tdata.add_items(
+        [
+            ("source/abc.txt", "dest/abc.txt"),
+            {
+                "source_path": "source/def/",
+                "destination_path": "dest/def/",
+                "recursive": True,
+                "additional_fields": {"foo": "bar"},
+            },
+        ]
+    )
+    assert count == 2
+    assert tdata.add_items((f"source/{i}", f"dest/{i}") for i in range(3)) == 3
+    # any two-item sequence of paths is accepted, not only tuples
+    assert tdata.add_items([["source/list", "dest/list"]]) == 1
+
+    assert list(tdata.iter_items()) == [
+        {
+            "DATA_TYPE": "transfer_item",
+            "source_path": "source/abc.txt",
+            "destination_path": "dest/abc.txt",
+        },
+        {
+            "DATA_TYPE": "transfer_item",
+            "source_path": "source/def/",
+            "destination_path": "dest/def/",
+            "recursive": True,
+            "foo": "bar",
+        },
+    ] + [
+        {
+            "DATA_TYPE": "transfer_item",
+            "source_path": f"source/{i}",
+            "destination_path": f"dest/{i}",
+        }
+        for i in range(3)
+    ] + [
+        {
+            "DATA_TYPE": "transfer_item",
+            "source_path": "source/list",
+            "destination_path": "dest/list",
+        }
+    ]
+
+
+def test_transfer_items_serialize_as_list():
+    tdata = TransferData(source_endpoint=GO_EP1_ID, destination_endpoint=GO_EP2_ID)
+    tdata.add_item("source/abc.txt", "dest/abc.txt", recursive=False)
+    tdata.add_symlink_item("source/link", "dest/link")
+    tdata["DATA"].append({"DATA_TYPE": "transfer_item", "source_path": "x"})
+
+    expect_items = [
+        {
+            "DATA_TYPE": "transfer_item",
+            "source_path": "source/abc.txt",
+            "destination_path": "dest/abc.txt",
+            "recursive": False,
+        },
+        {
+            "DATA_TYPE": "transfer_symlink_item",
+            "source_path": "source/link",
+            "destination_path": "dest/link",
+        },
+        {"DATA_TYPE": "transfer_item", "source_path": "x"},
+    ]
+    assert isinstance(tdata["DATA"], list)
+    assert tdata["DATA"] == expect_items
+    assert json.loads(json.dumps(tdata.data))["DATA"] == expect_items
+    assert json.loads(get_json_codec().dumps(tdata.data))["DATA"] == expect_items
+
+
+def test_transfer_items_can_be_modified_in_place():
+    tdata = TransferData(source_endpoint=GO_EP1_ID, destination_endpoint=GO_EP2_ID)
+    tdata.add_items([("source/abc.txt", "dest/abc.txt")])
+
+    tdata["DATA"][0]["recursive"] = True
+    assert tdata["DATA"][0]["recursive"] is True
+    assert json.loads(json.dumps(tdata.data))["DATA"][0]["recursive"] is True
+
+
+def test_transfer_items_are_stored_compactly_until_read():
+    tdata = TransferData(source_endpoint=GO_EP1_ID, destination_endpoint=GO_EP2_ID)
+    tdata.add_items((f"source/{i}", f"dest/{i}") for i in range(5))
+    tdata.add_symlink_item("source/link", "dest/link")
+
+    # the request body has every item, but the document keeps them compact
+    body = tdata._get_request_data()
+    assert len(body["DATA"]) == 6
+    assert body["DATA"][5]["DATA_TYPE"] == "transfer_symlink_item"
+    assert "submission_id" not in tdata
+    assert len(tdata._pending_items) == 6
+
+    # reading DATA builds the items, and from then on they are ordinary dicts
+    assert tdata["DATA"] == body["DATA"]
+    assert len(tdata._pending_items) == 0
+    assert tdata._get_request_data() is tdata.data
+
+
+def test_transfer_items_keep_their_order():
+    tdata = TransferData(source_endpoint=GO_EP1_ID, destination_endpoint=GO_EP2_ID)
+    tdata.add_item("source/0", "dest/0")
+    tdata["DATA"].append({"DATA_TYPE": "transfer_item", "source_path": "source/1"})
+    tdata.add_item("source/2", "dest/2")
+    expect = ["source/0", "source/1", "source/2"]
+    assert [x["source_path"] for x in tdata._get_request_data()["DATA"]] == expect
+    assert [x["source_path"] for x in tdata.iter_items()] == expect
+
+
+def test_transfer_items_use_less_memory_than_dicts():
+    tdata = TransferData(source_endpoint=GO_EP1_ID, destination_endpoint=GO_EP2_ID)
+    paths = [(f"source/{i}", f"dest/{i}") for i in range(10000)]
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        tdata.add_items(paths)
+        compact = tracemalloc.get_traced_memory()[0] - before
+        tdata["DATA"]
+        as_dicts = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    assert compact < as_dicts / 2
+
+
+def test_transfer_copy_does_not_share_items():
+    tdata = TransferData(source_endpoint=GO_EP1_ID, destination_endpoint=GO_EP2_ID)
+    tdata.add_item("source/0", "dest/0")
+    other = copy.copy(tdata)
+    other.add_item("source/1", "dest/1")
+    assert len(tdata["DATA"]) == 1
+    assert len(other["DATA"]) == 2
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_transfer_data_pickles(protocol):
+    tdata = TransferData(source_endpoint=GO_EP1_ID, destination_endpoint=GO_EP2_ID)
+    tdata.add_item("source/0", "dest/0")
+    copied = pickle.loads(pickle.dumps(tdata, protocol=protocol))
+    assert copied.data == tdata.data
+
+
+@pytest.mark.parametrize("item", ["ab", b"ab"])
+def test_transfer_add_items_rejects_strings(item):
+    tdata = TransferData(source_endpoint=GO_EP1_ID, destination_endpoint=GO_EP2_ID)
+    with pytest.raises(GlobusSDKUsageError):
+        tdata.add_items([item])
+
+
+def test_transfer_items_slice():
+    tdata = TransferData(source_endpoint=GO_EP1_ID, destination_endpoint=GO_EP2_ID)
+    tdata.add_items((f"source/{i}", f"dest/{i}") for i in range(5))
+
+    chunk = tdata["DATA"][1:3]
+    assert len(chunk) == 2
+    assert [item["source_path"] for item in chunk] == ["source/1", "source/2"]
+    del tdata["DATA"][:4]
+    assert [item["source_path"] for item in tdata["DATA"]] == ["source/4"]
+
+
+def test_transfer_add_item_to_replaced_data_list():
+    tdata = TransferData(source_endpoint=GO_EP1_ID, destination_endpoint=GO_EP2_ID)
+    tdata["DATA"] = []
+    tdata.add_item("source/abc.txt", "dest/abc.txt")
+    assert tdata["DATA"] == [
+        {
+            "DATA_TYPE": "transfer_item",
+            "source_path": "source/abc.txt",
+            "destination_path": "dest/abc.txt",
+        }
+    ]
+
+
 @pytest.mark.parametrize("n_succeeded", [None, True, False])
 @pytest.mark.parametrize("n_failed", [None, True, False])
 @pytest.mark.parametrize("n_inactive", [None, True, False])
@@ -356,3 +356,32 @@ def test_http_headers_from_response():
 
     r3 = GlobusHTTPResponse(r2)  # wrap another response
     assert r3.headers["content-length"] == "5"
+
+
+def test_response_data_is_parsed_lazily_and_once():
+    raw = _response({"label1": "value1"})
+    with mock.patch.object(raw, "json", wraps=raw.json) as json_method:
+        res = GlobusHTTPResponse(raw, client=mock.Mock())
+        assert res.http_status == 200
+        assert res.headers["Content-Type"] == "application/json"
+        assert json_method.call_count == 0
+
+        assert res["label1"] == "value1"
+        assert res.get("label1") == "value1"
+        assert res.data == {"label1": "value1"}
+        assert json_method.call_count == 1
+
+
+def test_wrapped_responses_share_parsed_data():
+    class MyIterableResponse(IterableResponse):
+        default_iter_key = "DATA"
+
+    raw = _response({"DATA": [{"x": 1}]})
+    with mock.patch.object(raw, "json", wraps=raw.json) as json_method:
+        inner = GlobusHTTPResponse(raw, client=mock.Mock())
+        outer = MyIterableResponse(inner)
+        assert json_method.call_count == 0
+
+        assert list(outer) == [{"x": 1}]
+        assert outer.data is inner.data
+        assert json_method.call_count == 1
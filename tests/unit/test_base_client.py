@@ -182,3 +182,15 @@ def test_access_resource_server_property_via_class(base_client_class):
         base_client_class.resource_server
         == globus_sdk.scopes.TransferScopes.resource_server
     )
+
+
+def test_clients_can_share_a_session(base_client_class):
+    session = globus_sdk.transport.create_session()
+    client_a = base_client_class(app_name="a", transport_params={"session": session})
+    client_b = base_client_class(app_name="b", transport_params={"session": session})
+    assert client_a.transport.session is client_b.transport.session
+
+    RegisteredResponse(service="transfer", path="/foo", json={"x": "y"}).add()
+    for client, app_name in ((client_a, "a"), (client_b, "b")):
+        assert client.get("/foo")["x"] == "y"
+        assert get_last_request().headers["User-Agent"].endswith(f"/{app_name}")
@@ -0,0 +1,238 @@
+import multiprocessing
+import threading
+import uuid
+from unittest import mock
+
+import pytest
+
+from globus_sdk import SQLiteIdentityCache, TTLIdentityCache
+
+ID = "46bd0f56-e24f-11e5-a510-131bef46955c"
+RECORD = {"id": ID, "username": "globus@globus.org"}
+
+
+@pytest.fixture
+def now():
+    with mock.patch("time.time", return_value=1000.0) as m:
+        yield m
+
+
+def test_invalid_maxsize():
+    with pytest.raises(ValueError):
+        TTLIdentityCache(maxsize=0)
+
+
+def test_entries_expire(now):
+    cache = TTLIdentityCache(ttl=60)
+    cache[ID] = RECORD
+    assert ID in cache
+    assert cache[ID] == RECORD
+    assert len(cache) == 1
+
+    now.return_value += 60
+    assert ID not in cache
+    with pytest.raises(KeyError):
+        cache[ID]
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted(now):
+    cache = TTLIdentityCache(maxsize=2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache["a"] == 1
+    cache["c"] = 3
+
+    assert sorted(cache) == ["a", "c"]
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_negative_entries(now):
+    cache = TTLIdentityCache(negative_ttl=30)
+    cache.mark_missing("nobody@example.org")
+
+    # the key is known, but reading it raises a KeyError
+    assert "nobody@example.org" in cache
+    with pytest.raises(KeyError):
+        cache["nobody@example.org"]
+    assert cache.get("nobody@example.org") is None
+    assert list(cache) == []
+
+    now.return_value += 30
+    assert "nobody@example.org" not in cache
+
+
+def test_negative_caching_can_be_disabled(now):
+    cache = TTLIdentityCache(negative_ttl=0)
+    cache.mark_missing("nobody@example.org")
+    assert "nobody@example.org" not in cache
+
+
+def test_stats(now):
+    cache = TTLIdentityCache()
+    cache[ID] = RECORD
+    cache.mark_missing("nobody@example.org")
+    cache[ID]
+    cache[ID]
+    cache.get("nobody@example.org")
+    cache.get("other@example.org")
+
+    assert cache.get_stats() == {
+        "hits": 2,
+        "negative_hits": 1,
+        "misses": 1,
+        "evictions": 0,
+        "size": 2,
+    }
+
+
+def test_delete_and_clear():
+    cache = TTLIdentityCache()
+    cache["a"] = 1
+    cache["b"] = 2
+    del cache["a"]
+    assert list(cache) == ["b"]
+    with pytest.raises(KeyError):
+        del cache["a"]
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_shared_across_threads():
+    cache = TTLIdentityCache(maxsize=100)
+
+    def worker(n):
+        for i in range(200):
+            cache[f"{n}-{i}"] = i
+            cache.get(f"{n}-{i - 1}")
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = cache.get_stats()
+    assert stats["size"] == 100
+    assert stats["evictions"] == 700
+
+
+@pytest.fixture
+def dbname(tmp_path):
+    return tmp_path / "identities.db"
+
+
+def test_sqlite_lookup_by_id_and_username(now, dbname):
+    cache = SQLiteIdentityCache(dbname)
+    cache.store_identities([RECORD])
+
+    assert cache[ID] == RECORD
+    assert cache["globus@globus.org"] == RECORD
+    assert sorted(cache) == sorted([ID, "globus@globus.org"])
+    assert len(cache) == 2
+    assert cache.get_stats() == {
+        "hits": 2,
+        "negative_hits": 0,
+        "misses": 0,
+        "size": 1,
+    }
+    cache.close()
+
+
+def test_sqlite_cache_is_persistent_and_shared(now, dbname):
+    cache_a = SQLiteIdentityCache(dbname)
+    cache_b = SQLiteIdentityCache(dbname)
+
+    cache_a[ID] = RECORD
+    cache_a.mark_missing("nobody@example.org")
+    assert cache_b["globus@globus.org"] == RECORD
+    assert "nobody@example.org" in cache_b
+    with pytest.raises(KeyError):
+        cache_b["nobody@example.org"]
+
+    cache_a.close()
+    cache_b.close()
+    reopened = SQLiteIdentityCache(dbname)
+    assert reopened[ID] == RECORD
+    reopened.close()
+
+
+def test_sqlite_entries_expire(now, dbname):
+    cache = SQLiteIdentityCache(dbname, ttl=60, negative_ttl=10)
+    cache[ID] = RECORD
+    cache.mark_missing("nobody@example.org")
+
+    now.return_value += 10
+    assert "nobody@example.org" not in cache
+    assert ID in cache
+
+    now.return_value += 50
+    assert ID not in cache
+    assert len(cache) == 0
+    assert cache.get_stats()["size"] == 1
+    cache.purge_expired()
+    assert cache.get_stats()["size"] == 0
+    cache.close()
+
+
+def test_sqlite_storing_an_identity_clears_negative_entry(now, dbname):
+    cache = SQLiteIdentityCache(dbname)
+    cache.mark_missing("globus@globus.org")
+    cache["globus@globus.org"] = RECORD
+    assert cache["globus@globus.org"] == RECORD
+    cache.close()
+
+
+def test_sqlite_delete_and_clear(dbname):
+    cache = SQLiteIdentityCache(dbname)
+    cache[ID] = RECORD
+    del cache["globus@globus.org"]
+    assert ID not in cache
+    with pytest.raises(KeyError):
+        del cache[ID]
+
+    cache[ID] = RECORD
+    cache.clear()
+    assert len(cache) == 0
+    cache.close()
+
+
+@pytest.mark.parametrize(
+    "key, value",
+    [
+        (ID, None),
+        (ID, {"id": ID}),
+        ("other@example.org", RECORD),
+    ],
+)
+def test_sqlite_rejects_non_identity_values(dbname, key, value):
+    cache = SQLiteIdentityCache(dbname)
+    with pytest.raises(ValueError):
+        cache[key] = value
+    cache.close()
+
+
+def _read_identity(dbname, key):
+    cache = SQLiteIdentityCache(dbname)
+    try:
+        return cache[key]["username"]
+    finally:
+        cache.close()
+
+
+def test_sqlite_cache_is_read_by_other_processes(dbname):
+    cache = SQLiteIdentityCache(dbname)
+    cache.store_identities(
+        [
+            {"id": str(uuid.UUID(int=i)), "username": f"u{i}@example.org"}
+            for i in range(8)
+        ]
+    )
+
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Pool(4) as pool:
+        usernames = pool.starmap(
+            _read_identity, [(dbname, str(uuid.UUID(int=i))) for i in range(8)]
+        )
+    assert usernames == [f"u{i}@example.org" for i in range(8)]
+    cache.close()
@@ -0,0 +1,153 @@
+import json
+from unittest import mock
+
+import pytest
+import requests
+
+from globus_sdk import _json
+from globus_sdk.response import GlobusHTTPResponse
+from globus_sdk.transport import JSONCodec, JSONRequestEncoder, set_json_codec
+
+
+@pytest.fixture(autouse=True)
+def reset_codec(monkeypatch):
+    monkeypatch.delenv("GLOBUS_SDK_JSON_CODEC", raising=False)
+    _json._get_configured_codec.cache_clear()
+    yield
+    _json.set_json_codec(None)
+    _json._get_configured_codec.cache_clear()
+
+
+def _make_response(content):
+    response = requests.Response()
+    response._content = content
+    response.headers["Content-Type"] = "application/json"
+    return response
+
+
+def test_default_codec_is_stdlib():
+    assert type(_json.get_json_codec()) is _json.JSONCodec
+
+
+def test_stdlib_codec_matches_requests_encoding():
+    data = {"DATA": [{"name": "café", "size": 1}], "nested": {"x": None}}
+    prepared = requests.Request("POST", "https://example.org", json=data).prepare()
+    encoded = JSONRequestEncoder().encode("POST", "https://example.org", None, data, {})
+    assert encoded.prepare().body == prepared.body
+    assert encoded.headers["Content-Type"] == "application/json"
+
+
+def test_json_encoder_rejects_nan():
+    with pytest.raises(requests.exceptions.InvalidJSONError):
+        JSONRequestEncoder().encode(
+            "POST", "https://example.org", None, {"x": float("nan")}, {}
+        )
+
+
+def test_json_encoder_sends_no_body_for_none():
+    encoded = JSONRequestEncoder().encode("POST", "https://example.org", None, None, {})
+    assert encoded.prepare().body is None
+    assert "Content-Type" not in encoded.headers
+
+
+@pytest.mark.parametrize("name", ["orjson", "ujson", "msgspec"])
+def test_third_party_codec_round_trip(monkeypatch, name):
+    pytest.importorskip(name)
+    monkeypatch.setenv("GLOBUS_SDK_JSON_CODEC", name)
+    codec = _json.get_json_codec()
+    assert codec.name == name
+
+    data = {"DATA": [{"name": "café", "size": 1}], "has_next_page": False}
+    assert json.loads(codec.dumps(data)) == data
+
+    # keys which the library may not support are handled by the stdlib
+    assert json.loads(codec.dumps({1: "x"})) == {"1": "x"}
+
+    response = GlobusHTTPResponse(_make_response(codec.dumps(data)), mock.Mock())
+    assert response.data == data
+    response = GlobusHTTPResponse(_make_response(b"not json"), mock.Mock())
+    assert response.data is None
+
+
+@pytest.mark.parametrize("name", ["stdlib", "orjson", "ujson", "msgspec"])
+def test_codec_rejects_unserializable_data(monkeypatch, name):
+    if name != "stdlib":
+        pytest.importorskip(name)
+    monkeypatch.setenv("GLOBUS_SDK_JSON_CODEC", name)
+    with pytest.raises(TypeError):
+        _json.get_json_codec().dumps({"DATA": object()})
+
+
+def test_missing_codec_falls_back_to_stdlib(monkeypatch):
+    monkeypatch.setenv("GLOBUS_SDK_JSON_CODEC", "orjson")
+    monkeypatch.setattr(_json, "_load_codec", lambda name: None)
+    assert type(_json.get_json_codec()) is _json.JSONCodec
+
+
+def test_auto_codec_falls_back_to_stdlib(monkeypatch):
+    monkeypatch.setenv("GLOBUS_SDK_JSON_CODEC", "auto")
+    monkeypatch.setattr(_json, "_load_codec", lambda name: None)
+    assert type(_json.get_json_codec()) is _json.JSONCodec
+
+
+def test_unknown_codec_is_rejected(monkeypatch):
+    monkeypatch.setenv("GLOBUS_SDK_JSON_CODEC", "simplejson")
+    with pytest.raises(ValueError, match="Unknown JSON codec"):
+        _json.get_json_codec()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_iter_json_array(chunk_size):
+    document = {
+        "DATA_TYPE": "file_list",
+        "DATA": [
+            {"name": f"file{i}", "size": i * 1000, "tags": ["ü", None, True]}
+            for i in range(50)
+        ],
+        "total": 50,
+        "has_next_page": False,
+    }
+    content = json.dumps(document, ensure_ascii=False).encode("utf-8")
+    chunks = (content[i : i + chunk_size] for i in range(0, len(content), chunk_size))
+
+    fields = {}
+    assert list(_json.iter_json_array(chunks, "DATA", fields)) == document["DATA"]
+    assert fields == {"DATA_TYPE": "file_list", "total": 50, "has_next_page": False}
+
+
+@pytest.mark.parametrize(
+    "content",
+    [b"[1, 2]", b'{"DATA": {"x": 1}}', b'{"DATA": [1, 2', b'{"DATA": [1 2]}'],
+)
+def test_iter_json_array_rejects_bad_documents(content):
+    with pytest.raises(ValueError):
+        list(_json.iter_json_array([content], "DATA", {}))
+
+
+def test_set_json_codec_installs_a_custom_codec(monkeypatch):
+    monkeypatch.setenv("GLOBUS_SDK_JSON_CODEC", "orjson")
+
+    class SortedCodec(JSONCodec):
+        name = "sorted"
+
+        def dumps(self, data):
+            return json.dumps(data, sort_keys=True).encode("utf-8")
+
+    codec = SortedCodec()
+    set_json_codec(codec)
+    assert _json.get_json_codec() is codec
+    encoded = JSONRequestEncoder().encode(
+        "POST", "https://example.org", None, {"b": 1, "a": 2}, {}
+    )
+    assert encoded.data == b'{"a": 2, "b": 1}'
+
+    # None restores the codec selected by the environment
+    set_json_codec(None)
+    assert _json.get_json_codec() is not codec
+
+
+def test_set_json_codec_by_name():
+    set_json_codec("stdlib")
+    assert type(_json.get_json_codec()) is JSONCodec
+    with pytest.raises(ValueError, match="Unknown JSON codec"):
+        set_json_codec("nonsense")
@@ -1,10 +1,19 @@
+import asyncio
 import json
+import threading
+import uuid
 from unittest import mock
 
 import pytest
 import requests
 
-from globus_sdk.paging import HasNextPaginator
+from globus_sdk.paging import (
+    HasNextPaginator,
+    LimitOffsetTotalPaginator,
+    MarkerPaginator,
+    Paginator,
+    has_paginator,
+)
 from globus_sdk.response import GlobusHTTPResponse
 from globus_sdk.services.transfer.response import IterableTransferResponse
 
@@ -29,8 +38,9 @@ class PagingSimulator:
         data["DATA"] = []
         for i in range(offset, min(self.n, offset + limit)):
             data["DATA"].append({"value": i})
-        # fill has_next_page field
+        # fill has_next_page and total fields
         data["has_next_page"] = (offset + limit) < self.n
+        data["total"] = self.n
 
         # make the simulated response
         response = requests.Response()
@@ -64,3 +74,337 @@ def test_has_next_paginator(paging_simulator):
     # confirm results
     for item, expected in zip(all_items(), range(N)):
         assert item["value"] == expected
+
+
+class MarkerPagingSimulator:
+    def __init__(self, n, page_size=10):
+        self.n = n
+        self.page_size = page_size
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def simulate_get(self, *args, **params):
+        with self.lock:
+            self.calls += 1
+        offset = int(params.get("marker", 0))
+        data = {
+            "DATA": [
+                {"value": i}
+                for i in range(offset, min(self.n, offset + self.page_size))
+            ],
+            "has_next_page": offset + self.page_size < self.n,
+            "marker": str(offset + self.page_size),
+        }
+        response = requests.Response()
+        response._content = json.dumps(data).encode()
+        response.headers["Content-Type"] = "application/json"
+        return IterableTransferResponse(GlobusHTTPResponse(response, mock.Mock()))
+
+
+def _marker_paginator(simulator):
+    return MarkerPaginator(
+        simulator.simulate_get, items_key="DATA", client_args=[], client_kwargs={}
+    )
+
+
+@pytest.mark.parametrize("depth", [1, 2, 10])
+def test_prefetch_items_matches_items(depth):
+    simulator = MarkerPagingSimulator(N)
+    items = list(_marker_paginator(simulator).prefetch_items(depth))
+    assert [x["value"] for x in items] == list(range(N))
+    assert simulator.calls == 3
+
+
+def test_prefetch_pages_stays_within_depth():
+    simulator = MarkerPagingSimulator(1000)
+    pages = _marker_paginator(simulator).prefetch_pages(2)
+    next(pages)
+    # wait for the background thread to fill the prefetch buffer
+    for _ in range(50):
+        if simulator.calls >= 3:
+            break
+        threading.Event().wait(0.01)
+    threading.Event().wait(0.05)
+    # one page consumed, plus two prefetched
+    assert simulator.calls == 3
+    pages.close()
+
+
+def test_prefetch_pages_reraises_errors():
+    def failing_get(*args, **kwargs):
+        raise ValueError("bad page")
+
+    paginator = MarkerPaginator(failing_get, client_args=[], client_kwargs={})
+    with pytest.raises(ValueError, match="bad page"):
+        list(paginator.prefetch_pages())
+
+
+def test_prefetch_rejects_bad_depth():
+    simulator = MarkerPagingSimulator(N)
+    with pytest.raises(ValueError):
+        list(_marker_paginator(simulator).prefetch_pages(0))
+
+
+def test_async_iteration():
+    simulator = MarkerPagingSimulator(N)
+
+    async def collect_pages():
+        return [page async for page in _marker_paginator(simulator)]
+
+    async def collect_items():
+        paginator = _marker_paginator(simulator)
+        return [item async for item in paginator.aitems(prefetch=3)]
+
+    pages = asyncio.run(collect_pages())
+    assert len(pages) == 3
+    items = asyncio.run(collect_items())
+    assert [x["value"] for x in items] == list(range(N))
+
+
+def test_async_iteration_reraises_errors():
+    def failing_get(*args, **kwargs):
+        raise ValueError("bad page")
+
+    paginator = MarkerPaginator(failing_get, client_args=[], client_kwargs={})
+
+    async def collect():
+        return [page async for page in paginator.apages()]
+
+    with pytest.raises(ValueError, match="bad page"):
+        asyncio.run(collect())
+
+
+@pytest.mark.parametrize(
+    "paginator_class", [HasNextPaginator, LimitOffsetTotalPaginator]
+)
+@pytest.mark.parametrize("concurrency", [1, 3, 10])
+@pytest.mark.parametrize("n, max_total_results", [(N, 1000), (100, 1000), (95, 40)])
+def test_parallel_items_matches_serial(
+    paginator_class, concurrency, n, max_total_results
+):
+    simulator = PagingSimulator(n)
+    paginator = paginator_class(
+        simulator.simulate_get,
+        items_key="DATA",
+        get_page_size=lambda x: len(x["DATA"]),
+        max_total_results=max_total_results,
+        page_size=10,
+        client_args=[],
+        client_kwargs={},
+    )
+    items = [x["value"] for x in paginator.parallel_items(concurrency)]
+    assert items == list(range(min(n, max_total_results)))
+    assert paginator.offset == min(n, max_total_results)
+
+
+def test_parallel_pages_recovers_from_short_page():
+    simulator = PagingSimulator(N)
+    original_get = simulator.simulate_get
+
+    def short_first_page(*args, **params):
+        if params.get("offset", 0) == 0:
+            params["limit"] = 5
+        return original_get(*args, **params)
+
+    paginator = LimitOffsetTotalPaginator(
+        short_first_page,
+        items_key="DATA",
+        get_page_size=lambda x: len(x["DATA"]),
+        max_total_results=1000,
+        page_size=10,
+        client_args=[],
+        client_kwargs={},
+    )
+    items = [x["value"] for x in paginator.parallel_items(4)]
+    assert items == list(range(N))
+
+
+def test_parallel_pages_ignores_errors_past_the_end():
+    simulator = PagingSimulator(N)
+    original_get = simulator.simulate_get
+
+    def error_past_end(*args, **params):
+        if params["offset"] >= N:
+            raise ValueError("offset out of range")
+        return original_get(*args, **params)
+
+    paginator = HasNextPaginator(
+        error_past_end,
+        items_key="DATA",
+        get_page_size=lambda x: len(x["DATA"]),
+        max_total_results=1000,
+        page_size=10,
+        client_args=[],
+        client_kwargs={},
+    )
+    items = [x["value"] for x in paginator.parallel_items(8)]
+    assert items == list(range(N))
+
+
+class _CheckpointClient:
+    def __init__(self, n=N):
+        self.marker_simulator = MarkerPagingSimulator(n)
+        self.offset_simulator = PagingSimulator(n)
+        self.calls = 0
+
+    @has_paginator(MarkerPaginator, items_key="DATA")
+    def marker_get(self, resource_id, *, marker=None):
+        self.calls += 1
+        return self.marker_simulator.simulate_get(resource_id, marker=marker or 0)
+
+    @has_paginator(
+        LimitOffsetTotalPaginator,
+        items_key="DATA",
+        get_page_size=lambda x: len(x["DATA"]),
+        max_total_results=1000,
+        page_size=10,
+    )
+    def offset_get(self, resource_id, *, limit=None, offset=None):
+        self.calls += 1
+        return self.offset_simulator.simulate_get(
+            resource_id, limit=limit, offset=offset or 0
+        )
+
+    def unpaginated_get(self, resource_id):
+        raise NotImplementedError
+
+
+@pytest.mark.parametrize("method_name", ["marker_get", "offset_get"])
+@pytest.mark.parametrize("pages_before_checkpoint", [0, 1, 2, 3])
+def test_resume_from_checkpoint(method_name, pages_before_checkpoint):
+    client = _CheckpointClient()
+    method = getattr(client, method_name)
+    paginator = Paginator.wrap(method)(uuid.UUID(int=1))
+
+    pages = paginator.pages()
+    items = []
+    for _ in range(pages_before_checkpoint):
+        items.extend(x["value"] for x in next(pages)["DATA"])
+    checkpoint = json.loads(json.dumps(paginator.checkpoint()))
+    assert checkpoint["client_args"] == [str(uuid.UUID(int=1))]
+
+    resumed = Paginator.from_checkpoint(method, checkpoint)
+    items.extend(x["value"] for x in resumed.items())
+    assert items == list(range(N))
+
+
+def _wait_for_calls(simulator, calls):
+    for _ in range(100):
+        if simulator.calls >= calls:
+            return
+        threading.Event().wait(0.01)
+
+
+def test_checkpoint_during_prefetch_records_the_callers_position():
+    client = _CheckpointClient()
+    paginator = Paginator.wrap(client.marker_get)("foo")
+
+    pages = paginator.prefetch_pages(2)
+    first = next(pages)
+    # the background thread fetches ahead, to the end of the results
+    _wait_for_calls(client.marker_simulator, 3)
+    checkpoint = paginator.checkpoint()
+    pages.close()
+
+    resumed = Paginator.from_checkpoint(client.marker_get, checkpoint)
+    items = [x["value"] for x in first["DATA"]]
+    items.extend(x["value"] for x in resumed.items())
+    assert items == list(range(N))
+
+
+@pytest.mark.parametrize("method_name", ["marker_get", "offset_get"])
+@pytest.mark.parametrize("depth", [2, 3])
+def test_checkpoint_during_deep_prefetch_resumes_without_gaps(method_name, depth):
+    n = 95
+    client = _CheckpointClient(n)
+    method = getattr(client, method_name)
+    paginator = Paginator.wrap(method)("foo")
+
+    pages = paginator.prefetch_pages(depth)
+    items = [x["value"] for x in next(pages)["DATA"]]
+    # wait for the background thread to fetch `depth` pages past the caller
+    for _ in range(100):
+        if client.calls >= depth + 1:
+            break
+        threading.Event().wait(0.01)
+    assert client.calls == depth + 1
+    checkpoint = json.loads(json.dumps(paginator.checkpoint()))
+    pages.close()
+
+    resumed = Paginator.from_checkpoint(method, checkpoint)
+    items.extend(x["value"] for x in resumed.items())
+    assert items == list(range(n))
+
+
+def test_checkpoint_after_prefetch_finishes_uses_the_paginator_position():
+    client = _CheckpointClient()
+    paginator = Paginator.wrap(client.offset_get)("foo")
+    assert len(list(paginator.prefetch_items(3))) == N
+    assert paginator._caller_state is None
+    assert paginator.checkpoint()["cursor"]["exhausted"] is True
+
+
+@pytest.mark.parametrize("method_name", ["marker_get", "offset_get"])
+def test_resume_from_checkpoint_replaces_stale_client_kwargs(method_name):
+    client = _CheckpointClient()
+    method = getattr(client, method_name)
+    paginator = Paginator.wrap(method)("foo")
+    pages = paginator.pages()
+    items = [x["value"] for x in next(pages)["DATA"]]
+    checkpoint = paginator.checkpoint()
+    # the parameters which page through results are taken from the cursor
+    checkpoint["client_kwargs"] = {}
+
+    resumed = Paginator.from_checkpoint(method, checkpoint)
+    items.extend(x["value"] for x in resumed.items())
+    assert items == list(range(N))
+
+
+def test_checkpoint_during_apages_records_the_callers_position():
+    client = _CheckpointClient()
+    paginator = Paginator.wrap(client.marker_get)("foo")
+
+    async def take_first_page():
+        pages = paginator.apages(prefetch=2)
+        first = await pages.__anext__()
+        for _ in range(100):
+            if client.marker_simulator.calls >= 3:
+                break
+            await asyncio.sleep(0.01)
+        checkpoint = paginator.checkpoint()
+        await pages.aclose()
+        return first, checkpoint
+
+    first, checkpoint = asyncio.run(take_first_page())
+    resumed = Paginator.from_checkpoint(client.marker_get, checkpoint)
+    items = [x["value"] for x in first["DATA"]]
+    items.extend(x["value"] for x in resumed.items())
+    assert items == list(range(N))
+
+
+def test_paginator_is_single_use():
+    client = _CheckpointClient()
+    paginator = Paginator.wrap(client.offset_get)("foo")
+    assert len(list(paginator.items())) == N
+    assert list(paginator.pages()) == []
+
+
+def test_exhausted_checkpoint_yields_no_pages():
+    client = _CheckpointClient()
+    paginator = Paginator.wrap(client.marker_get)("foo")
+    assert len(list(paginator.items())) == N
+
+    resumed = Paginator.from_checkpoint(client.marker_get, paginator.checkpoint())
+    assert list(resumed.pages()) == []
+
+
+def test_checkpoint_rejects_mismatched_method():
+    client = _CheckpointClient()
+    checkpoint = Paginator.wrap(client.marker_get)("foo").checkpoint()
+
+    with pytest.raises(ValueError, match="Cannot resume a checkpoint"):
+        Paginator.from_checkpoint(client.offset_get, checkpoint)
+    with pytest.raises(ValueError, match="not a paginated method"):
+        Paginator.from_checkpoint(
+            client.unpaginated_get, {**checkpoint, "method": "unpaginated_get"}
+        )
@@ -0,0 +1,139 @@
+import pickle
+from unittest import mock
+
+import pytest
+import requests
+import responses
+
+import globus_sdk
+from globus_sdk.transport import CircuitBreaker, CircuitState, RequestsTransport
+
+URL = "https://foo.example.org/bar"
+HOST = "https://foo.example.org"
+
+
+@pytest.fixture
+def now():
+    with mock.patch("time.time", return_value=1000.0) as m:
+        yield m
+
+
+@pytest.fixture
+def breaker():
+    return CircuitBreaker(minimum_requests=4, failure_rate_threshold=0.5)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"failure_rate_threshold": 0},
+        {"failure_rate_threshold": 1.5},
+        {"minimum_requests": 0},
+        {"half_open_max_requests": 0},
+    ],
+)
+def test_invalid_settings(kwargs):
+    with pytest.raises(ValueError):
+        CircuitBreaker(**kwargs)
+
+
+def test_circuit_opens_at_failure_rate(now, breaker):
+    assert breaker.record(URL, False) is CircuitState.closed
+    assert breaker.record(URL, True) is CircuitState.closed
+    assert breaker.record(URL, False) is CircuitState.closed
+    # 2 failures out of 4 requests reaches the threshold
+    assert breaker.record(URL, True) is CircuitState.open
+
+    assert not breaker.allow_request(URL)
+    assert breaker.allow_request("https://other.example.org/")
+    assert breaker.retry_at(URL) == 1030.0
+    assert breaker.get_stats()[HOST] == {
+        "state": "open",
+        "requests": 4,
+        "failures": 2,
+        "opened_at": 1000.0,
+    }
+
+
+def test_old_outcomes_leave_the_window(now, breaker):
+    for _ in range(3):
+        breaker.record(URL, True)
+    now.return_value += 61
+    assert breaker.record(URL, True) is CircuitState.closed
+    assert breaker.get_stats()[HOST]["requests"] == 1
+
+
+def test_half_open_probe_success_closes_circuit(now, breaker):
+    for _ in range(4):
+        breaker.record(URL, True)
+    now.return_value += 30
+
+    assert breaker.allow_request(URL)
+    # only one probe is allowed at a time
+    assert not breaker.allow_request(URL)
+    assert breaker.get_stats()[HOST]["state"] == "half_open"
+
+    assert breaker.record(URL, False) is CircuitState.closed
+    assert breaker.allow_request(URL)
+    assert breaker.get_stats()[HOST]["requests"] == 0
+
+
+def test_half_open_probe_failure_reopens_circuit(now, breaker):
+    for _ in range(4):
+        breaker.record(URL, True)
+    now.return_value += 30
+
+    assert breaker.allow_request(URL)
+    assert breaker.record(URL, True) is CircuitState.open
+    assert not breaker.allow_request(URL)
+    assert breaker.retry_at(URL) == 1060.0
+
+
+def test_transport_fails_fast_when_open(now, breaker, mocksleep):
+    responses.add(responses.GET, URL, status=503)
+    transport = RequestsTransport(circuit_breaker=breaker, max_retries=10)
+
+    # the request is retried until the circuit opens, then retries stop
+    response = transport.request("GET", URL)
+    assert response.status_code == 503
+    assert len(responses.calls) == 4
+
+    with pytest.raises(globus_sdk.GlobusCircuitOpenError) as excinfo:
+        transport.request("GET", URL)
+    assert excinfo.value.host == HOST
+    assert excinfo.value.retry_at == 1030.0
+    assert len(responses.calls) == 4
+
+
+def test_circuit_open_error_pickles():
+    err = globus_sdk.GlobusCircuitOpenError(HOST, 1030.0)
+    copied = pickle.loads(pickle.dumps(err))
+    assert (copied.host, copied.retry_at) == (HOST, 1030.0)
+    assert str(copied) == f"Circuit breaker is open for {HOST}, request not sent"
+
+
+def test_transport_records_network_errors(now, breaker, mocksleep):
+    responses.add(responses.GET, URL, body=requests.ConnectionError("oops"))
+    transport = RequestsTransport(circuit_breaker=breaker, max_retries=1)
+
+    with pytest.raises(globus_sdk.GlobusConnectionError):
+        transport.request("GET", URL)
+    with pytest.raises(globus_sdk.GlobusConnectionError):
+        transport.request("GET", URL)
+
+    # all four attempts were recorded, including the last attempt of each request
+    assert breaker.get_stats()[HOST]["state"] == "open"
+    with pytest.raises(globus_sdk.GlobusCircuitOpenError):
+        transport.request("GET", URL)
+
+
+def test_transport_probe_closes_circuit(now, breaker, mocksleep):
+    responses.add(responses.GET, URL, status=500)
+    transport = RequestsTransport(circuit_breaker=breaker, max_retries=3)
+    transport.request("GET", URL)
+    assert breaker.get_stats()[HOST]["state"] == "open"
+
+    responses.replace(responses.GET, URL, json={})
+    now.return_value += 30
+    assert transport.request("GET", URL).status_code == 200
+    assert breaker.get_stats()[HOST]["state"] == "closed"
@@ -0,0 +1,172 @@
+from unittest import mock
+
+import pytest
+import requests
+import responses
+
+import globus_sdk
+from globus_sdk.transport import RateLimiter, RequestsTransport, RetryBudget
+
+URL = "https://foo.example.org/bar"
+
+
+class _Clock:
+    """
+    A fake monotonic clock, which is advanced by the (mocked) sleeps of the transport.
+    """
+
+    def __init__(self, mocksleep):
+        self.now = 100.0
+        mocksleep.side_effect = self.sleep
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(mocksleep):
+    clock = _Clock(mocksleep)
+    with mock.patch("time.monotonic", side_effect=clock.monotonic):
+        yield clock
+
+
+def _fixed_backoff(ctx):
+    return 4
+
+
+@pytest.mark.parametrize("use_tune", (True, False))
+def test_deadline_stops_retries(clock, mocksleep, use_tune):
+    responses.add(responses.GET, URL, status=503)
+    transport = RequestsTransport(retry_backoff=_fixed_backoff, max_retries=10)
+
+    if use_tune:
+        with transport.tune(deadline=10):
+            response = transport.request("GET", URL)
+    else:
+        response = transport.request("GET", URL, deadline=10)
+
+    # attempts at t=0, t=4, t=8; a retry at t=12 would pass the deadline
+    assert response.status_code == 503
+    assert len(responses.calls) == 3
+    assert mocksleep.call_count == 2
+
+
+def test_deadline_limits_attempt_timeout(clock):
+    responses.add(responses.GET, URL, json={})
+    transport = RequestsTransport(http_timeout=60, deadline=5)
+    with mock.patch.object(
+        transport.session, "send", wraps=transport.session.send
+    ) as send:
+        transport.request("GET", URL)
+    assert send.call_args.kwargs["timeout"] == 5
+
+
+def test_deadline_raises_last_error(clock):
+    responses.add(responses.GET, URL, body=requests.ConnectionError("oops"))
+    transport = RequestsTransport(retry_backoff=_fixed_backoff, deadline=6)
+
+    with pytest.raises(globus_sdk.GlobusConnectionError):
+        transport.request("GET", URL)
+    assert len(responses.calls) == 2
+
+
+def test_retry_budget_validation():
+    with pytest.raises(ValueError):
+        RetryBudget(-1)
+    with pytest.raises(ValueError):
+        RetryBudget(window=0)
+
+
+def test_retry_budget_limits_retries(clock):
+    budget = RetryBudget(0.5, min_retries_per_second=0, window=10)
+    for _ in range(4):
+        budget.record_request()
+    assert budget.try_retry()
+    assert budget.try_retry()
+    assert not budget.try_retry()
+    assert budget.get_stats() == {"requests": 4, "retries": 2}
+
+    # counts leave the window as time passes
+    clock.now += 10
+    assert budget.get_stats() == {"requests": 0, "retries": 0}
+    assert not budget.try_retry()
+
+
+def test_retry_budget_minimum(clock):
+    budget = RetryBudget(0, min_retries_per_second=0.5, window=4)
+    assert budget.try_retry()
+    assert budget.try_retry()
+    assert not budget.try_retry()
+
+
+def test_transports_share_retry_budget(clock, mocksleep):
+    responses.add(responses.GET, URL, status=500)
+    budget = RetryBudget(0.5, min_retries_per_second=0)
+    transports = [
+        RequestsTransport(retry_budget=budget, retry_backoff=_fixed_backoff)
+        for _ in range(2)
+    ]
+
+    for transport in transports:
+        assert transport.request("GET", URL).status_code == 500
+
+    # the first request has not earned a retry, but after the second, one is allowed
+    assert len(responses.calls) == 3
+    assert budget.get_stats() == {"requests": 2, "retries": 1}
+
+
+def test_rate_limit_delay_past_deadline_raises_timeout(clock, mocksleep):
+    responses.add(responses.GET, URL, json={})
+    transport = RequestsTransport(rate_limiter=RateLimiter(1, capacity=1), deadline=0.5)
+    transport.request("GET", URL)
+
+    # the next request would wait about a second for the rate limiter
+    with pytest.raises(globus_sdk.GlobusTimeoutError):
+        transport.request("GET", URL)
+    assert len(responses.calls) == 1
+    mocksleep.assert_not_called()
+
+
+def test_rate_limit_delay_past_deadline_returns_last_response(clock, mocksleep):
+    responses.add(responses.GET, URL, status=503)
+    limiter = RateLimiter(1, capacity=1)
+    transport = RequestsTransport(
+        rate_limiter=limiter, retry_backoff=lambda ctx: 0.1, deadline=0.5
+    )
+
+    # the retry would wait for the rate limiter past the deadline
+    assert transport.request("GET", URL).status_code == 503
+    assert len(responses.calls) == 1
+
+
+def test_attempt_is_not_sent_after_deadline(clock):
+    responses.add(responses.GET, URL, json={})
+    authorizer = mock.Mock()
+
+    def slow_authorization_header():
+        clock.now += 10
+        return "Bearer x"
+
+    authorizer.get_authorization_header.side_effect = slow_authorization_header
+    transport = RequestsTransport(deadline=5)
+
+    with mock.patch.object(transport.session, "send") as send:
+        with pytest.raises(globus_sdk.GlobusTimeoutError):
+            transport.request("GET", URL, authorizer=authorizer)
+    send.assert_not_called()
+
+
+def test_client_request_takes_deadline(clock):
+    class CustomClient(globus_sdk.BaseClient):
+        service_name = "foo"
+
+    client = CustomClient()
+    responses.add(responses.GET, "https://foo.api.globus.org/bar", json={})
+    with mock.patch.object(
+        client.transport.session, "send", wraps=client.transport.session.send
+    ) as send:
+        client.request("GET", "/bar", deadline=3)
+    assert send.call_args.kwargs["timeout"] == 3
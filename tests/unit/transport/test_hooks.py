@@ -0,0 +1,176 @@
+import pytest
+import requests
+import responses
+
+import globus_sdk
+from globus_sdk.transport import RequestsTransport, TransportHooks
+from globus_sdk.transport.hooks import retry_reason, template_path
+
+TASK_ID = "a8cb3c2a-6a3d-11ee-9c2f-0242ac130002"
+URL = f"https://transfer.example.org/v0.10/task/{TASK_ID}/event_list"
+
+
+def _no_backoff(ctx):
+    return 0
+
+
+class RecordingHooks(TransportHooks):
+    def __init__(self):
+        self.events = []
+
+    def on_request_start(self, request):
+        self.events.append(("start", request.method, request.path_template))
+
+    def on_attempt(self, request, attempt):
+        self.events.append(
+            ("attempt", attempt.attempt, attempt.status, attempt.bytes_received)
+        )
+
+    def on_retry_sleep(self, request, attempt, sleep):
+        self.events.append(("retry", retry_reason(attempt), sleep))
+
+    def on_request_end(self, request, response, exception):
+        self.events.append(
+            (
+                "end",
+                response.status_code if response is not None else None,
+                type(exception).__name__ if exception is not None else None,
+            )
+        )
+
+
+@pytest.mark.parametrize(
+    "path, expect",
+    [
+        ("/v2/api/identities", "/v2/api/identities"),
+        (f"/v0.10/endpoint/{TASK_ID}/ls", "/v0.10/endpoint/{id}/ls"),
+        (f"/v0.10/endpoint/{TASK_ID.replace('-', '')}", "/v0.10/endpoint/{id}"),
+        ("/v1/index/1234/entry", "/v1/index/{id}/entry"),
+        ("/v2/groups/my_groups", "/v2/groups/my_groups"),
+    ],
+)
+def test_template_path(path, expect):
+    assert template_path(path) == expect
+
+
+def test_hooks_report_attempts_and_retries():
+    responses.add(responses.GET, URL, status=503, body="unavailable")
+    responses.add(responses.GET, URL, json={"ok": True})
+    hooks = RecordingHooks()
+    transport = RequestsTransport(hooks=[hooks], retry_backoff=_no_backoff)
+
+    transport.request("GET", URL, query_params={"limit": 10})
+
+    assert hooks.events == [
+        ("start", "GET", "/v0.10/task/{id}/event_list"),
+        ("attempt", 0, 503, len("unavailable")),
+        ("retry", "503", 0),
+        ("attempt", 1, 200, len('{"ok": true}')),
+        ("end", 200, None),
+    ]
+
+
+def test_hooks_report_errors():
+    responses.add(responses.GET, URL, body=requests.ConnectionError("oops"))
+    hooks = RecordingHooks()
+    transport = RequestsTransport(
+        hooks=[hooks], max_retries=1, retry_backoff=_no_backoff
+    )
+
+    with pytest.raises(globus_sdk.GlobusConnectionError):
+        transport.request("GET", URL)
+
+    assert hooks.events[1:] == [
+        ("attempt", 0, None, 0),
+        ("retry", "ConnectionError", 0),
+        ("attempt", 1, None, 0),
+        ("end", None, "GlobusConnectionError"),
+    ]
+
+
+def test_hooks_report_request_details():
+    responses.add(responses.POST, URL, json={})
+    seen = {}
+
+    class DetailHooks(TransportHooks):
+        def on_request_start(self, request):
+            seen["request"] = request
+
+        def on_attempt(self, request, attempt):
+            seen["attempt"] = attempt
+
+    transport = RequestsTransport(hooks=[DetailHooks()])
+    transport.request("POST", URL, query_params={"x": 1}, data={"a": "b"})
+
+    request = seen["request"]
+    assert request.url == URL
+    assert request.host == "https://transfer.example.org"
+    assert request.bytes_sent == len(b'{"a": "b"}')
+    assert seen["attempt"].duration >= 0
+
+
+def test_hook_errors_are_logged_and_ignored(caplog):
+    responses.add(responses.GET, URL, json={})
+
+    class BrokenHooks(TransportHooks):
+        def on_attempt(self, request, attempt):
+            raise RuntimeError("broken hook")
+
+    hooks = RecordingHooks()
+    transport = RequestsTransport(hooks=[BrokenHooks(), hooks])
+
+    assert transport.request("GET", URL).status_code == 200
+    assert hooks.events[-1] == ("end", 200, None)
+    assert "broken hook" in caplog.text
+
+
+def test_prometheus_hooks():
+    prometheus_client = pytest.importorskip("prometheus_client")
+    from globus_sdk.transport import PrometheusHooks
+
+    responses.add(responses.GET, URL, status=502)
+    responses.add(responses.GET, URL, json={})
+    registry = prometheus_client.CollectorRegistry()
+    transport = RequestsTransport(
+        hooks=[PrometheusHooks(registry)], retry_backoff=_no_backoff
+    )
+    transport.request("GET", URL)
+
+    labels = {
+        "method": "GET",
+        "host": "https://transfer.example.org",
+        "path": "/v0.10/task/{id}/event_list",
+    }
+    get = registry.get_sample_value
+    assert get("globus_sdk_requests_total", {**labels, "status": "200"}) == 1
+    assert get("globus_sdk_retries_total", {**labels, "reason": "502"}) == 1
+    assert get("globus_sdk_attempt_duration_seconds_count", labels) == 2
+    assert get("globus_sdk_request_duration_seconds_count", labels) == 1
+
+
+def test_opentelemetry_hooks():
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    from globus_sdk.transport import OpenTelemetryHooks
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+
+    responses.add(responses.GET, URL, status=502)
+    responses.add(responses.GET, URL, json={})
+    transport = RequestsTransport(
+        hooks=[OpenTelemetryHooks(provider.get_tracer("test"))],
+        retry_backoff=_no_backoff,
+    )
+    transport.request("GET", URL)
+
+    (span,) = exporter.get_finished_spans()
+    assert span.name == "GET /v0.10/task/{id}/event_list"
+    assert span.attributes["http.response.status_code"] == 200
+    assert [event.name for event in span.events] == ["attempt", "retry", "attempt"]
@@ -0,0 +1,149 @@
+import threading
+from unittest import mock
+
+import pytest
+import requests
+import responses
+
+from globus_sdk.transport import RateLimiter, RequestsTransport, SQLiteRateLimitBackend
+
+URL = "https://foo.example.org/bar"
+
+
+@pytest.fixture
+def now():
+    with mock.patch("time.time", return_value=1000.0) as m:
+        yield m
+
+
+def _response(status, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    return response
+
+
+def test_rates_must_be_positive():
+    with pytest.raises(ValueError):
+        RateLimiter(0)
+    with pytest.raises(ValueError):
+        RateLimiter(1, rate_by_host={"foo.example.org": -1})
+
+
+def test_burst_then_delay(now):
+    limiter = RateLimiter(2)
+    assert limiter.acquire(URL) == 0
+    assert limiter.acquire(URL) == 0
+    assert limiter.acquire(URL) == pytest.approx(0.5)
+    assert limiter.acquire(URL) == pytest.approx(1.0)
+
+    now.return_value += 1.5
+    assert limiter.acquire(URL) == 0
+
+
+def test_buckets_are_per_host(now):
+    limiter = RateLimiter(1, rate_by_host={"other.example.org": 10})
+    assert limiter.acquire(URL) == 0
+    assert limiter.acquire(URL) == pytest.approx(1.0)
+    assert limiter.acquire("https://foo.example.org/baz") == pytest.approx(2.0)
+
+    for _ in range(10):
+        assert limiter.acquire("https://other.example.org/") == 0
+    assert limiter.acquire("https://other.example.org/") == pytest.approx(0.1)
+
+
+def test_rate_is_reduced_by_retry_after_and_recovers(now):
+    limiter = RateLimiter(4)
+    limiter.record_response(URL, _response(429, {"Retry-After": "5"}))
+
+    # no requests until Retry-After has passed
+    assert limiter.acquire(URL) == pytest.approx(5.0)
+
+    # after that, requests are sent at the reduced rate
+    now.return_value += 10
+    for _ in range(4):
+        limiter.acquire(URL)
+    bucket = limiter.backend._states["https://foo.example.org"]
+    assert 2 < bucket.rate < 4
+
+    # and the configured rate is regained over time
+    now.return_value += limiter.RECOVERY_SECONDS
+    limiter.acquire(URL)
+    assert limiter.backend._states["https://foo.example.org"].rate == 4
+
+
+def test_rate_is_not_reduced_below_min_rate(now):
+    limiter = RateLimiter(4, min_rate=1.5)
+    for _ in range(5):
+        limiter.record_response(URL, _response(429))
+    assert limiter.backend._states["https://foo.example.org"].rate == 1.5
+
+
+@pytest.mark.parametrize(
+    "status, headers",
+    [(200, {}), (404, {}), (500, {"Retry-After": "1"}), (503, {})],
+)
+def test_other_responses_do_not_reduce_rate(now, status, headers):
+    limiter = RateLimiter(4)
+    limiter.acquire(URL)
+    limiter.record_response(URL, _response(status, headers))
+    assert limiter.backend._states["https://foo.example.org"].rate == 4
+
+
+def test_memory_backend_is_shared_by_threads():
+    limiter = RateLimiter(100, capacity=100)
+    delays = []
+    with mock.patch("time.time", return_value=1000.0):
+
+        def worker():
+            for _ in range(50):
+                delays.append(limiter.acquire(URL))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert sorted(delays)[-1] == pytest.approx(1.0)
+    assert sum(1 for d in delays if d == 0) == 100
+
+
+def test_sqlite_backend_is_shared(now, tmp_path):
+    dbname = tmp_path / "ratelimit.db"
+    limiter_a = RateLimiter(1, backend=SQLiteRateLimitBackend(dbname))
+    limiter_b = RateLimiter(1, backend=SQLiteRateLimitBackend(dbname))
+
+    assert limiter_a.acquire(URL) == 0
+    assert limiter_b.acquire(URL) == pytest.approx(1.0)
+
+    limiter_b.record_response(URL, _response(503, {"Retry-After": "30"}))
+    assert limiter_a.acquire(URL) == pytest.approx(30.0)
+
+    limiter_a.backend.close()
+    limiter_b.backend.close()
+
+
+def test_transport_waits_for_rate_limiter(now, mocksleep):
+    responses.add(responses.GET, URL, json={})
+    transport = RequestsTransport(rate_limiter=RateLimiter(1))
+
+    transport.request("GET", URL)
+    mocksleep.assert_not_called()
+    transport.request("GET", URL)
+    mocksleep.assert_called_once_with(pytest.approx(1.0))
+
+
+def test_transport_reports_rate_limited_responses(now, mocksleep):
+    responses.add(responses.GET, URL, status=429, headers={"Retry-After": "2"})
+    responses.add(responses.GET, URL, json={})
+    limiter = RateLimiter(10)
+    transport = RequestsTransport(rate_limiter=limiter)
+
+    response = transport.request("GET", URL)
+
+    assert response.status_code == 200
+    assert limiter.backend._states["https://foo.example.org"].rate == 5
+    # the retry waits for Retry-After, and the limiter blocks the host until then
+    assert mocksleep.call_args_list[0].args[0] == 2
+    assert limiter.backend._states["https://foo.example.org"].blocked_until == 1002
@@ -0,0 +1,166 @@
+from unittest import mock
+
+import pytest
+import responses
+
+from globus_sdk.authorizers import AccessTokenAuthorizer
+from globus_sdk.transport import RequestsTransport, ResponseCache
+
+URL = "https://foo.example.org/bar"
+
+
+@pytest.fixture
+def cache():
+    return ResponseCache()
+
+
+@pytest.fixture
+def transport(cache):
+    return RequestsTransport(response_cache=cache)
+
+
+def test_maxsize_must_be_positive():
+    with pytest.raises(ValueError):
+        ResponseCache(maxsize=0)
+
+
+def test_fresh_response_is_reused_without_a_request(transport, cache):
+    responses.add(
+        responses.GET,
+        URL,
+        json={"x": 1},
+        headers={"Cache-Control": "max-age=60"},
+    )
+
+    first = transport.request("GET", URL)
+    second = transport.request("GET", URL)
+
+    assert len(responses.calls) == 1
+    assert len(cache) == 1
+    assert first.json() == second.json() == {"x": 1}
+    assert second.status_code == 200
+
+
+def test_stale_response_is_revalidated_with_etag(transport):
+    responses.add(
+        responses.GET,
+        URL,
+        json={"x": 1},
+        headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+    )
+    responses.add(responses.GET, URL, status=304, headers={"ETag": '"v1"'})
+
+    transport.request("GET", URL)
+    second = transport.request("GET", URL)
+
+    assert len(responses.calls) == 2
+    conditional = responses.calls[1].request
+    assert conditional.headers["If-None-Match"] == '"v1"'
+    assert conditional.headers["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+    assert second.status_code == 200
+    assert second.json() == {"x": 1}
+
+
+def test_changed_response_replaces_stored_response(transport):
+    responses.add(responses.GET, URL, json={"x": 1}, headers={"ETag": '"v1"'})
+    responses.add(responses.GET, URL, json={"x": 2}, headers={"ETag": '"v2"'})
+    responses.add(responses.GET, URL, status=304)
+
+    assert transport.request("GET", URL).json() == {"x": 1}
+    assert transport.request("GET", URL).json() == {"x": 2}
+    assert transport.request("GET", URL).json() == {"x": 2}
+    assert responses.calls[2].request.headers["If-None-Match"] == '"v2"'
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {"Cache-Control": "no-store", "ETag": '"v1"'},
+        {"Vary": "*", "ETag": '"v1"'},
+        {},
+    ],
+)
+def test_uncacheable_responses_are_not_stored(transport, cache, headers):
+    responses.add(responses.GET, URL, json={"x": 1}, headers=headers)
+
+    transport.request("GET", URL)
+    transport.request("GET", URL)
+
+    assert len(cache) == 0
+    assert len(responses.calls) == 2
+    assert "If-None-Match" not in responses.calls[1].request.headers
+
+
+def test_non_get_requests_are_not_cached(transport, cache):
+    responses.add(
+        responses.POST, URL, json={"x": 1}, headers={"Cache-Control": "max-age=60"}
+    )
+
+    transport.request("POST", URL, data={})
+    transport.request("POST", URL, data={})
+
+    assert len(cache) == 0
+    assert len(responses.calls) == 2
+
+
+def test_responses_are_stored_per_authorization(transport, cache):
+    responses.add(
+        responses.GET, URL, json={"x": 1}, headers={"Cache-Control": "max-age=60"}
+    )
+
+    transport.request("GET", URL, authorizer=AccessTokenAuthorizer("token-a"))
+    transport.request("GET", URL, authorizer=AccessTokenAuthorizer("token-b"))
+    transport.request("GET", URL, authorizer=AccessTokenAuthorizer("token-a"))
+
+    assert len(responses.calls) == 2
+    assert len(cache) == 2
+
+
+def test_least_recently_used_response_is_evicted():
+    transport = RequestsTransport(response_cache=ResponseCache(maxsize=2))
+    for path in ("a", "b", "c"):
+        responses.add(
+            responses.GET,
+            f"{URL}/{path}",
+            json={"path": path},
+            headers={"Cache-Control": "max-age=60"},
+        )
+
+    transport.request("GET", f"{URL}/a")
+    transport.request("GET", f"{URL}/b")
+    # use 'a' again, so that 'b' is the least recently used
+    transport.request("GET", f"{URL}/a")
+    transport.request("GET", f"{URL}/c")
+    assert len(responses.calls) == 3
+
+    transport.request("GET", f"{URL}/a")
+    assert len(responses.calls) == 3
+    transport.request("GET", f"{URL}/b")
+    assert len(responses.calls) == 4
+
+
+def test_expired_max_age_triggers_revalidation(transport):
+    responses.add(
+        responses.GET,
+        URL,
+        json={"x": 1},
+        headers={"Cache-Control": "max-age=60", "ETag": '"v1"'},
+    )
+    responses.add(responses.GET, URL, status=304)
+
+    transport.request("GET", URL)
+    with mock.patch("time.time", return_value=10**10):
+        response = transport.request("GET", URL)
+
+    assert len(responses.calls) == 2
+    assert response.json() == {"x": 1}
+
+
+def test_streamed_requests_bypass_the_cache(transport, cache):
+    responses.add(
+        responses.GET, URL, json={"x": 1}, headers={"Cache-Control": "max-age=60"}
+    )
+
+    transport.request("GET", URL, stream=True)
+
+    assert len(cache) == 0
@@ -1,6 +1,9 @@
+import socket
+
 import pytest
 
-from globus_sdk.transport import RequestsTransport, RetryContext
+from globus_sdk.exc import GlobusSDKUsageError
+from globus_sdk.transport import RequestsTransport, RetryContext, create_session
 from globus_sdk.transport.requests import _exponential_backoff
 
 
@@ -21,6 +24,8 @@ def _linear_backoff(ctx: RetryContext) -> float:
         ("max_sleep", 10, 1),
         ("max_retries", 0, 5),
         ("max_retries", 10, 0),
+        ("deadline", None, 30),
+        ("deadline", 60, 30),
     ],
 )
 def test_transport_tuning(param_name, init_value, tune_value):
@@ -34,3 +39,69 @@ def test_transport_tuning(param_name, init_value, tune_value):
         assert getattr(transport, param_name) == tune_value
 
     assert getattr(transport, param_name) == init_value
+
+
+def _get_pool(transport, host):
+    adapter = transport.session.get_adapter(f"https://{host}")
+    return adapter.poolmanager.connection_from_host(host, 443, "https")
+
+
+def test_transport_pool_settings():
+    transport = RequestsTransport(
+        pool_maxsize=50,
+        pool_block=True,
+        pool_maxsize_by_host={"transfer.api.globus.org": 64},
+    )
+    default_pool = _get_pool(transport, "auth.globus.org")
+    assert default_pool.pool.maxsize == 50
+    assert default_pool.block is True
+    assert _get_pool(transport, "transfer.api.globus.org").pool.maxsize == 64
+
+
+def test_transport_tcp_keepalive():
+    assert "socket_options" not in _get_pool(RequestsTransport(), "foo").conn_kw
+
+    transport = RequestsTransport(tcp_keepalive_interval=30)
+    socket_options = _get_pool(transport, "foo").conn_kw["socket_options"]
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in socket_options
+
+
+def test_transport_pool_stats():
+    transport = RequestsTransport(pool_maxsize=4)
+    assert transport.get_pool_stats() == {}
+
+    pool = _get_pool(transport, "auth.globus.org")
+    conn = pool._get_conn()
+    assert transport.get_pool_stats() == {
+        "https://auth.globus.org:443": {
+            "maxsize": 4,
+            "in_use": 1,
+            "idle": 0,
+            "num_connections": 1,
+            "num_requests": 0,
+        }
+    }
+    pool._put_conn(conn)
+    stats = transport.get_pool_stats()["https://auth.globus.org:443"]
+    assert stats["in_use"] == 0
+    assert stats["idle"] == 1
+
+
+def test_transport_shared_session():
+    session = create_session(pool_maxsize=32)
+    transports = [RequestsTransport(session=session) for _ in range(3)]
+    assert all(transport.session is session for transport in transports)
+    assert _get_pool(transports[0], "auth.globus.org").pool.maxsize == 32
+
+
+def test_transport_rejects_session_with_pool_settings():
+    with pytest.raises(GlobusSDKUsageError, match="pool_maxsize"):
+        RequestsTransport(session=create_session(), pool_maxsize=32)
+
+
+def test_transport_creates_its_session_when_first_used():
+    transport = RequestsTransport(pool_maxsize=32)
+    assert transport._session is None
+    session = transport.session
+    assert transport.session is session
+    assert _get_pool(transport, "auth.globus.org").pool.maxsize == 32